@@ -10,7 +10,13 @@ to provide a structured way to define and store benchmark data.
 """
 
 
-from .benchmark import Benchmark, BenchmarkImplementation
+from .benchmark import (
+    Benchmark,
+    BenchmarkImplementation,
+    OutputValidation,
+    Roofline,
+    Tolerance,
+)
 from .config import Config
 from .framework import Framework
 from .implementation_postfix import Implementation
@@ -26,4 +32,7 @@ __all__ = [
     "Config",
     "Framework",
     "Implementation",
+    "OutputValidation",
+    "Roofline",
+    "Tolerance",
 ]
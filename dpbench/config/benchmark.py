@@ -4,8 +4,10 @@
 
 """Benchmark related configuration classes."""
 
+import ast
+import re
 from dataclasses import dataclass, field
-from typing import Any, List
+from typing import Any, List, Union
 
 Parameters = dict[str, Any]
 
@@ -49,6 +51,106 @@ class Init:
         self.func_name = self.func_name or "initialize"
 
 
+@dataclass
+class Roofline:
+    """Configuration with amount of work done by benchmark.
+
+    Formulas are arithmetic expressions in terms of the preset parameters and
+    itemsize, that is size in bytes of the floating point input arrays.
+    """
+
+    flops: str = ""
+    bytes: str = ""
+
+    @staticmethod
+    def from_dict(obj: Any) -> "Roofline":
+        """Convert object into Roofline dataclass."""
+        _flops = str(obj.get("flops") or "")
+        _bytes = str(obj.get("bytes") or "")
+        return Roofline(_flops, _bytes)
+
+
+@dataclass
+class Tolerance:
+    """Acceptable error of benchmark output elements.
+
+    Element is valid if |expected - actual| <= abs + rel * |actual| or if
+    the error does not exceed ulp units in the last place of the expected
+    value. Unset values fall back to the defaults of the validation mode.
+    """
+
+    abs: float = None
+    rel: float = None
+    ulp: float = None
+
+    @staticmethod
+    def from_dict(obj: Any) -> "Tolerance":
+        """Convert object into Tolerance dataclass."""
+        _abs = obj.get("abs")
+        _rel = obj.get("rel")
+        _ulp = obj.get("ulp")
+        return Tolerance(
+            float(_abs) if _abs is not None else None,
+            float(_rel) if _rel is not None else None,
+            float(_ulp) if _ulp is not None else None,
+        )
+
+    def update(self, other: "Tolerance") -> "Tolerance":
+        """Returns copy of tolerance with values set in other replaced."""
+        return Tolerance(
+            other.abs if other.abs is not None else self.abs,
+            other.rel if other.rel is not None else self.rel,
+            other.ulp if other.ulp is not None else self.ulp,
+        )
+
+
+@dataclass
+class OutputValidation:
+    """Configuration for validation of a benchmark output.
+
+    Attributes:
+        mode: name of the registered validation mode, e.g. allclose.
+        tolerance: tolerance for any precision.
+        precisions: tolerance for specific precision, e.g. single, that
+            overrides values of the tolerance.
+    """
+
+    mode: str = "allclose"
+    tolerance: Tolerance = field(default_factory=Tolerance)
+    precisions: dict[str, Tolerance] = field(default_factory=dict)
+
+    @staticmethod
+    def from_dict(obj: Any) -> "OutputValidation":
+        """Convert object into OutputValidation dataclass."""
+        _mode = str(obj.get("mode") or "allclose")
+        _tolerance = Tolerance.from_dict(obj)
+        _precisions = {
+            precision: Tolerance.from_dict(tolerance)
+            for precision, tolerance in obj.items()
+            if isinstance(tolerance, dict)
+        }
+        return OutputValidation(_mode, _tolerance, _precisions)
+
+    def get_tolerance(self, precision: str = "") -> Tolerance:
+        """Returns tolerance for the precision."""
+        if precision in self.precisions:
+            return self.tolerance.update(self.precisions[precision])
+
+        return self.tolerance
+
+
+# Validation of an output. Outputs holding several arrays, e.g. tuple
+# returned by the benchmark, can have validation per array.
+Validation = Union[OutputValidation, List[OutputValidation]]
+
+
+def _validation_from_dict(obj: Any) -> Validation:
+    if isinstance(obj, list):
+        return [OutputValidation.from_dict(o) for o in obj]
+
+    return OutputValidation.from_dict(obj)
+
+
 @dataclass
 class BenchmarkImplementation:
     """Configuration for benchmark initialization."""
@@ -92,6 +194,8 @@ class Benchmark:
     implementations: List[BenchmarkImplementation] = field(default_factory=list)
     reference_implementation_postfix: str = None
     expected_failure_implementations: List[str] = field(default_factory=list)
+    roofline: Roofline = None
+    validation: dict[str, Validation] = field(default_factory=dict)
 
     @staticmethod
     def from_dict(obj: Any) -> "Benchmark":
@@ -119,6 +223,12 @@ class Benchmark:
         _expected_failure_implementations = (
             obj.get("expected_failure_implementations") or []
         )
+        _roofline = obj.get("roofline")
+        _roofline = Roofline.from_dict(_roofline) if _roofline else None
+        _validation = {
+            output: _validation_from_dict(validation)
+            for output, validation in (obj.get("validation") or {}).items()
+        }
         return Benchmark(
             _name,
             _short_name,
@@ -138,4 +248,55 @@ class Benchmark:
             _implementations,
             _reference_implementation_postfix,
             _expected_failure_implementations,
+            _roofline,
+            _validation,
         )
+
+
+def module_top_level_names(source_path: str) -> set[str]:
+    """Collects names defined at the top level of the python source."""
+    with open(source_path, encoding="utf-8") as file:
+        tree = ast.parse(file.read(), filename=source_path)
+
+    names = set()
+    for node in tree.body:
+        if isinstance(
+            node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        ):
+            names.add(node.name)
+        elif isinstance(node, ast.Assign):
+            names.update(
+                target.id
+                for target in node.targets
+                if isinstance(target, ast.Name)
+            )
+        elif isinstance(node, ast.AnnAssign) and isinstance(
+            node.target, ast.Name
+        ):
+            names.add(node.target.id)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.update(
+                alias.asname or alias.name.split(".")[0] for alias in node.names
+            )
+
+    return names
+
+
+def implementation_func_names(
+    config: Benchmark, module: str, postfix: str
+) -> list[str]:
+    """Returns candidate names of the implementation function in priority order.
+
+    Args:
+        config: Benchmark configuration object.
+        module: Name of the root python module of the implementation.
+        postfix: Postfix of the implementation.
+    """
+    return [
+        module,
+        f"{module}_{postfix}",
+        config.module_name,
+        f"{config.module_name}_{postfix}",
+        "kernel",
+        re.sub(r"[0-9]", "", config.module_name),
+    ]
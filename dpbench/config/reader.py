@@ -4,18 +4,27 @@
 
 """Set of functions to read configuration files."""
 
+import dataclasses
 import importlib
+import importlib.util
+import json
 import logging
 import os
 import pkgutil
-import re
 import sys
+from typing import Union
 
 import tomli
 
 from dpbench.infrastructure.frameworks.fabric import get_framework_class
 
-from .benchmark import Benchmark, BenchmarkImplementation, Presets
+from .benchmark import (
+    Benchmark,
+    BenchmarkImplementation,
+    Presets,
+    implementation_func_names,
+    module_top_level_names,
+)
 from .config import Config
 from .framework import Framework
 from .implementation_postfix import Implementation
@@ -32,12 +41,20 @@ def read_configs(  # noqa: C901: TODO: move modules into config
     with_polybench: bool = False,
     with_rodinia: bool = False,
     load_implementations: bool = True,
+    manifest: str = None,
 ) -> Config:
     """Read all configuration files and populate those settings into Config.
 
+    Implementations are discovered from the file system without importing
+    benchmark modules, so heavy framework packages get imported only by the
+    process that actually runs the implementation.
+
     Args:
         benchmarks: list of benchmarks to load. None means all.
         postfixes: list of benchmark postfixes to load. None means all.
+        manifest: path to the manifest file with discovered implementations.
+            It is created if missing and refreshed for benchmarks whose
+            sources changed. None means implementations are always discovered.
 
     Returns:
         Configuration object with populated configurations.
@@ -123,12 +140,22 @@ def read_configs(  # noqa: C901: TODO: move modules into config
         implementations = {impl.postfix for impl in config.implementations}
 
     if load_implementations:
+        cached_implementations = read_manifest(manifest) if manifest else None
+        discovered_implementations = {} if manifest else None
+
         for benchmark in config.benchmarks:
             read_benchmark_implementations(
                 benchmark,
                 implementations,
+                cached_implementations=cached_implementations,
+                discovered_implementations=discovered_implementations,
             )
 
+        if manifest:
+            entries = {**cached_implementations, **discovered_implementations}
+            if entries != cached_implementations:
+                write_manifest(manifest, entries)
+
         config.benchmarks = [
             benchmark
             for benchmark in config.benchmarks
@@ -282,13 +309,6 @@ def setup_init(config: Benchmark, modules: list[str]) -> None:
         if config.init.func_name == "":
             config.init.func_name = "initialize"
 
-        impl_mod = importlib.import_module(config.init.package_path)
-
-        if not hasattr(impl_mod, config.init.func_name):
-            logging.warn(
-                f"could not find init function for {config.module_name}"
-            )
-
 
 def discover_module_name_and_postfix(module: str, config: Config):
     """Discover real module name and postfix for the implementation.
@@ -318,85 +338,233 @@ def discover_module_name_and_postfix(module: str, config: Config):
     return module_name, postfix
 
 
-def read_benchmark_implementations(
-    config: Benchmark,
-    implementations: set[str] = None,
-) -> None:
-    """Read and discover implementation modules and functions.
+def _find_package_modules(package_path: str) -> Union[list[str], None]:
+    """Lists modules of the package without importing it.
 
     Args:
-        config: Benchmark configuration object where settings should be
-            populated.
-        implementations: List of postfixes to import. It does not affect
-            initialization import.
+        package_path: full package path.
 
-    Raises:
-        RuntimeError: Implementation file does not match any known postfix.
+    Returns: list of module names or None if package was not found.
     """
-    if config.implementations:
-        return
-
     try:
-        mod = importlib.import_module(config.package_path)
-    except ModuleNotFoundError:
-        logging.warning(f"Module not found: {config.package_path}")
-        return
+        spec = importlib.util.find_spec(package_path)
+    except (ImportError, ValueError):
+        spec = None
 
-    modules: list[str] = [
+    if spec is None or spec.submodule_search_locations is None:
+        return None
+
+    return [
         name
-        for _, name, _ in pkgutil.iter_modules(
-            mod.__spec__.submodule_search_locations
-        )
+        for _, name, _ in pkgutil.iter_modules(spec.submodule_search_locations)
     ]
 
-    setup_init(config, modules)
-    set_default_reference_implementation_postfix(config, modules)
-    set_validate_func(config, modules)
+
+def _package_locations(package_path: str) -> list[str]:
+    spec = importlib.util.find_spec(package_path)
+    return list(spec.submodule_search_locations)
+
+
+def _find_module_source(locations: list[str], module_name: str) -> str:
+    """Finds python source of the package module without importing it.
+
+    Returns: path to the source file or empty string if module has no python
+        source, e.g. it is a native extension.
+    """
+    rel_path = os.path.join(*module_name.split("."))
+
+    for location in locations:
+        for path in [
+            os.path.join(location, rel_path + ".py"),
+            os.path.join(location, rel_path, "__init__.py"),
+        ]:
+            if os.path.isfile(path):
+                return path
+
+    return ""
+
+
+def discover_benchmark_implementations(
+    config: Benchmark,
+    modules: list[str],
+) -> list[BenchmarkImplementation]:
+    """Discovers all implementations of the benchmark from its source files.
+
+    Implementation function is looked up by parsing module source. If module
+    does not have python source (e.g. native extension), function name is left
+    empty and gets resolved once module is imported.
+
+    Args:
+        config: Benchmark configuration object.
+        modules: List of modules in benchmark implementation dir.
+
+    Returns: list of discovered implementations.
+    """
+    locations = _package_locations(config.package_path)
+    discovered: list[BenchmarkImplementation] = []
 
     for module in modules:
         module_name, postfix = discover_module_name_and_postfix(module, config)
 
-        if (
-            implementations
-            and (postfix not in implementations)
-            and (postfix != config.reference_implementation_postfix)
-            or (config.init and config.init.module_name.endswith(module_name))
-        ):
+        if config.init and config.init.module_name.endswith(module_name):
             continue
 
-        func_name: str = None
-        package_path: str = f"{config.package_path}.{module_name}"
-
-        try:
-            impl_mod = importlib.import_module(package_path)
-
-            for func in [
-                module,
-                f"{module}_{postfix}",
-                config.module_name,
-                f"{config.module_name}_{postfix}",
-                "kernel",
-                re.sub(r"[0-9]", "", config.module_name),
-            ]:
-                if hasattr(impl_mod, func):
-                    func_name = func
-                    break
-        except Exception as e:
-            logging.warn(f"Could not import module: {e}")
-            import traceback
-
-            traceback.print_exc()
-            continue
+        func_name: str = ""
+        source_path = _find_module_source(locations, module_name)
+
+        if source_path:
+            try:
+                names = module_top_level_names(source_path)
+            except (OSError, SyntaxError, ValueError) as e:
+                logging.warning(f"Could not parse module {source_path}: {e}")
+                continue
+
+            func_name = next(
+                (
+                    func
+                    for func in implementation_func_names(
+                        config, module, postfix
+                    )
+                    if func in names
+                ),
+                None,
+            )
 
-        config.implementations.append(
+        discovered.append(
             BenchmarkImplementation(
                 postfix=postfix,
                 func_name=func_name,
                 module_name=module_name,
-                package_path=package_path,
+                package_path=f"{config.package_path}.{module_name}",
             )
         )
 
+    return discovered
+
+
+def _benchmark_signature(config: Benchmark) -> list:
+    """Returns modification times of the benchmark sources.
+
+    It is used to detect that manifest entry of the benchmark is outdated.
+    """
+    signature = []
+
+    for location in sorted(_package_locations(config.package_path)):
+        for root, dirs, files in os.walk(location):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for file in sorted(files):
+                if file.endswith(".py"):
+                    path = os.path.join(root, file)
+                    signature.append(
+                        [
+                            os.path.relpath(path, location),
+                            os.stat(path).st_mtime_ns,
+                        ]
+                    )
+
+    return signature
+
+
+def read_manifest(manifest: str) -> dict[str, dict]:
+    """Reads manifest file with discovered implementations.
+
+    Args:
+        manifest: path to the manifest file.
+
+    Returns: dictionary of manifest entries keyed by benchmark package path.
+        Empty if manifest does not exist or could not be read.
+    """
+    try:
+        with open(manifest) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        logging.warning(f"Could not read implementation manifest {manifest}")
+        return {}
+
+
+def write_manifest(manifest: str, entries: dict[str, dict]) -> None:
+    """Writes manifest file with discovered implementations.
+
+    Args:
+        manifest: path to the manifest file.
+        entries: dictionary of manifest entries keyed by benchmark package
+            path.
+    """
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(manifest)), exist_ok=True)
+        tmp_manifest = f"{manifest}.{os.getpid()}.tmp"
+        with open(tmp_manifest, "w") as file:
+            json.dump(entries, file, indent=2, sort_keys=True)
+        os.replace(tmp_manifest, manifest)
+    except OSError:
+        logging.warning(f"Could not write implementation manifest {manifest}")
+
+
+def read_benchmark_implementations(
+    config: Benchmark,
+    implementations: set[str] = None,
+    cached_implementations: dict[str, dict] = None,
+    discovered_implementations: dict[str, dict] = None,
+) -> None:
+    """Read and discover implementation modules and functions.
+
+    Modules are not imported, see discover_benchmark_implementations.
+
+    Args:
+        config: Benchmark configuration object where settings should be
+            populated.
+        implementations: List of postfixes to load. It does not affect
+            initialization discovery.
+        cached_implementations: Manifest entries to take implementations from
+            if benchmark sources did not change.
+        discovered_implementations: Dictionary to put manifest entry of the
+            benchmark into.
+    """
+    if config.implementations:
+        return
+
+    modules = _find_package_modules(config.package_path)
+    if modules is None:
+        logging.warning(f"Module not found: {config.package_path}")
+        return
+
+    setup_init(config, modules)
+    set_default_reference_implementation_postfix(config, modules)
+    set_validate_func(config, modules)
+
+    discovered = None
+    signature = None
+
+    if cached_implementations is not None:
+        signature = _benchmark_signature(config)
+        entry = cached_implementations.get(config.package_path, {})
+        if entry.get("signature") == signature:
+            discovered = [
+                BenchmarkImplementation(**impl)
+                for impl in entry.get("implementations", [])
+            ]
+
+    if discovered is None:
+        discovered = discover_benchmark_implementations(config, modules)
+
+    if discovered_implementations is not None:
+        discovered_implementations[config.package_path] = {
+            "signature": signature or _benchmark_signature(config),
+            "implementations": [
+                dataclasses.asdict(impl) for impl in discovered
+            ],
+        }
+
+    config.implementations += [
+        impl
+        for impl in discovered
+        if not implementations
+        or impl.postfix in implementations
+        or impl.postfix == config.reference_implementation_postfix
+    ]
+
 
 def set_validate_func(
     config: Benchmark,
@@ -432,14 +600,6 @@ def set_validate_func(
 
         config.validate_package_path = validate_package_path
 
-    val_mod = importlib.import_module(config.validate_package_path)
-
-    if not hasattr(val_mod, config.validate_func_name):
-        logging.fatal(
-            f"validation function '{config.validate_func_name}' not found for "
-            + f"{config.module_name} at '{validate_package_path}'"
-        )
-
 
 def set_default_reference_implementation_postfix(
     config: Benchmark,
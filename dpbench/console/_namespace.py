@@ -5,16 +5,21 @@
 """Namespace class for parsed arguments."""
 
 import argparse
-from typing import Union
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from dpbench.infrastructure.scaling import Sweep
 
 
 class Namespace(argparse.Namespace):
     """Namespace class for parsed arguments."""
 
     benchmarks: set[str]
-    implementations: list[str]
+    implementations: Union[list[str], None]
     all_implementations: bool
     preset: str
+    sweep: Union["Sweep", None]
+    threads: Union[list[int], None]
     sycl_device: str
     dpbench: bool
     npbench: bool
@@ -25,8 +30,12 @@ class Namespace(argparse.Namespace):
     run_id: Union[int, None]
     last_run: bool
     results_db: str
+    results_db_wal: bool
+    manifest: Union[str, None]
     save: bool
-    repeat: int
+    repeat: Union[int, str]
+    target_rsd: float
+    time_budget: float
     timeout: float
     precision: Union[str, None]
     program: str
@@ -34,6 +43,34 @@ class Namespace(argparse.Namespace):
     comparisons: list[str]
     log_level: str
     skip_expected_failures: bool
+    jobs: int
+    cpu_affinity: str
+    isolation: bool
+    numa_node: int
+    drop_page_cache: bool
+    cache_dir: str
+    reference_cache: bool
+    reference_cache_size: float
+    input_cache: bool
+    input_cache_size: float
+    shared_inputs: bool
+    jit_cache: bool
+    db_batch_size: int
+    perf_counters: bool
+    calibrate: bool
+    memory_tracking: bool
+    device_timing: bool
+    profile: Union[str, None]
+    profile_top: int
+    baseline_run: Union[str, None]
+    candidate_run: Union[int, None]
+    regression_threshold: float
+    significance: float
+    changed_only: bool
+    trend: bool
+    trend_runs: int
+    trend_html: Union[str, None]
+    machine: Union[str, None]
 
 
 class CommaSeparateStringAction(argparse.Action):
@@ -56,3 +93,21 @@ class CommaSeparateStringListAction(argparse.Action):
     def __call__(self, _, namespace, values, __):
         """Split values into list of strings."""
         setattr(namespace, self.dest, values.split(","))
+
+
+def percent_type(value: str) -> float:
+    """Parses percent value like 2% or 2 into fraction.
+
+    This function supposed to be used as type of argparse argument.
+    """
+    try:
+        percent = float(value.removesuffix("%"))
+    except ValueError:
+        percent = 0
+
+    if percent <= 0:
+        raise argparse.ArgumentTypeError(
+            f"expected positive percent value, got {value}"
+        )
+
+    return percent / 100
@@ -44,6 +44,7 @@ def execute_config(args: Namespace):
         with_npbench=True,
         with_polybench=True,
         with_rodinia=True,
+        manifest=args.manifest,
     )
 
     color_output = args.color
@@ -17,6 +17,9 @@ from .config import add_config_arguments, execute_config
 from .report import add_report_arguments, execute_report
 from .run import add_run_arguments, execute_run
 
+# Implementations to run if none were requested explicitly.
+DEFAULT_IMPLEMENTATIONS = {"python", "numpy"}
+
 
 def parse_args() -> Namespace:
     """Parse console arguments into dpbench Namespace."""
@@ -38,9 +41,10 @@ def parse_args() -> Namespace:
         type=str,
         action=CommaSeparateStringListAction,
         nargs="?",
-        default={"python", "numpy"},
+        default=None,
         help="Comma separated list of implementations. Use "
-        + "--all-implementations to load all available implementations.",
+        + "--all-implementations to load all available implementations."
+        + " Defaults to python,numpy; report defaults to all implementations.",
     )
     parser.add_argument(
         "-a",
@@ -75,6 +79,23 @@ def parse_args() -> Namespace:
         default="results.db",
         help="Path to a database to store results.",
     )
+    parser.add_argument(
+        "--results-db-wal",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="If set, database uses WAL journal that commits faster. It is"
+        + " persisted in the database file and does not work on network"
+        + " file systems.",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        nargs="?",
+        default=None,
+        help="Path to a manifest file with discovered benchmark"
+        + " implementations. It is generated on the first use and refreshed"
+        + " once benchmark sources change.",
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -121,7 +142,9 @@ def main():
         from dpbench.infrastructure.reporter import update_run_id
 
         dpbi.create_results_table(db_file=args.results_db)
-        conn = dpbi.create_connection(db_file=args.results_db)
+        conn = dpbi.create_connection(
+            db_file=args.results_db, wal=args.results_db_wal
+        )
 
     if args.last_run:
         if args.run_id is not None:
@@ -130,6 +153,8 @@ def main():
 
     if args.all_implementations:
         args.implementations = {}
+    elif args.implementations is None and args.program != "report":
+        args.implementations = set(DEFAULT_IMPLEMENTATIONS)
     if args.program == "run":
         execute_run(args, conn)
     elif args.program == "report":
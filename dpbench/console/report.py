@@ -5,10 +5,12 @@
 """Report subcommand package."""
 
 import argparse
+import logging
+import sys
 
 import sqlalchemy
 
-from ._namespace import CommaSeparateStringListAction, Namespace
+from ._namespace import CommaSeparateStringListAction, Namespace, percent_type
 
 
 def add_report_arguments(parser: argparse.ArgumentParser):
@@ -35,6 +37,159 @@ def add_report_arguments(parser: argparse.ArgumentParser):
         help="Sets the summary reports to output in CSV format",
     )
 
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        nargs="?",
+        default=0,
+        help="Number of the hottest functions to show for each profiled"
+        + " result. 0 disables the profile section.",
+    )
+
+    parser.add_argument(
+        "--baseline-run",
+        type=str,
+        nargs="?",
+        default=None,
+        help="Run id or last-N (N most recent runs before the candidate on"
+        + " the same machine) to detect regressions against. Report exits"
+        + " with non-zero code if any regression is detected.",
+    )
+
+    parser.add_argument(
+        "--candidate-run",
+        type=int,
+        nargs="?",
+        default=None,
+        help="Run id to check for regressions. Defaults to --run-id or the"
+        + " latest run.",
+    )
+
+    parser.add_argument(
+        "--regression-threshold",
+        type=percent_type,
+        nargs="?",
+        default="5%",
+        help="Minimal change of median execution time that is reported as"
+        + " regression or improvement, e.g. 5%%.",
+    )
+
+    parser.add_argument(
+        "--significance",
+        type=float,
+        nargs="?",
+        default=0.05,
+        help="Significance level of the Mann-Whitney U test and of the"
+        + " bootstrap confidence interval of the median ratio.",
+    )
+
+    parser.add_argument(
+        "--changed-only",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if only regressions and improvements should be listed.",
+    )
+
+    parser.add_argument(
+        "--trend",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if median execution times over many runs and their change"
+        + " points should be reported instead of a single run.",
+    )
+
+    parser.add_argument(
+        "--trend-runs",
+        type=int,
+        nargs="?",
+        default=30,
+        help="Number of the most recent runs to include in the trend.",
+    )
+
+    parser.add_argument(
+        "--trend-html",
+        type=str,
+        nargs="?",
+        default=None,
+        help="Path to write trend report with sparklines as HTML page.",
+    )
+
+    parser.add_argument(
+        "--machine",
+        type=str,
+        nargs="?",
+        default=None,
+        help="Fingerprint of the machine to report trend for. Defaults to the"
+        + " machine of the latest run.",
+    )
+
+
+def _execute_regression_report(args: Namespace, conn: sqlalchemy.Engine):
+    """Compares candidate run with baseline runs.
+
+    Exits with code 1 if any regression is detected and with code 2 if
+    baseline runs could not be resolved.
+    """
+    from dpbench.infrastructure.regression import (
+        compare_runs,
+        resolve_baseline_runs,
+    )
+    from dpbench.infrastructure.reporter import (
+        generate_header,
+        generate_regression_report,
+        update_run_id,
+    )
+
+    candidate_run_id = args.candidate_run
+    if candidate_run_id is None:
+        candidate_run_id = update_run_id(conn, args.run_id)
+
+    try:
+        baseline_run_ids = resolve_baseline_runs(
+            conn, args.baseline_run, candidate_run_id
+        )
+    except ValueError as e:
+        logging.error(f"Invalid --baseline-run {args.baseline_run}: {e}")
+        sys.exit(2)
+
+    comparisons = compare_runs(
+        conn,
+        baseline_run_ids,
+        candidate_run_id,
+        threshold=args.regression_threshold,
+        alpha=args.significance,
+        confidence=1 - args.significance,
+    )
+
+    generate_header(conn, candidate_run_id)
+    regressions = generate_regression_report(
+        comparisons,
+        baseline_run_ids,
+        candidate_run_id,
+        report_csv=args.csv,
+        changed_only=args.changed_only,
+    )
+
+    if regressions > 0:
+        logging.error(f"{regressions} performance regression(s) detected")
+        sys.exit(1)
+
+
+def _execute_trend_report(args: Namespace, conn: sqlalchemy.Engine):
+    """Reports median execution times over the most recent runs."""
+    from dpbench.infrastructure.reporter import generate_trend_report
+    from dpbench.infrastructure.trend import resolve_machine_id
+
+    generate_trend_report(
+        conn,
+        report_csv=args.csv,
+        last_runs=args.trend_runs,
+        machine_id=resolve_machine_id(conn, args.machine),
+        benchmarks=args.benchmarks,
+        implementations=set(args.implementations or []),
+        html_path=args.trend_html,
+    )
+
 
 def execute_report(args: Namespace, conn: sqlalchemy.Engine):
     """Execute report sub command.
@@ -65,10 +220,19 @@ def execute_report(args: Namespace, conn: sqlalchemy.Engine):
         for i in range(0, len(args.comparisons), 2)
     ]
 
+    if args.baseline_run is not None:
+        _execute_regression_report(args, conn)
+        return
+
+    if args.trend:
+        _execute_trend_report(args, conn)
+        return
+
     args.run_id = update_run_id(conn, args.run_id)
     print_report(
         conn=conn,
         run_id=args.run_id,
         comparison_pairs=comparison_pairs,
         csv=args.csv,
+        profile_top=args.profile_top,
     )
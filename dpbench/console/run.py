@@ -6,16 +6,109 @@
 
 import argparse
 import logging
+import os
+from typing import Union
 
 import sqlalchemy
 
 import dpbench.config as cfg
 import dpbench.infrastructure as dpbi
-from dpbench.infrastructure.benchmark_runner import BenchmarkRunner, RunConfig
-from dpbench.infrastructure.datamodel import Postfix, store_postfix
+from dpbench.infrastructure.benchmark_runner import (
+    BenchmarkRunner,
+    RunConfig,
+    split_cpu_affinity,
+)
+from dpbench.infrastructure.cache import default_cache_dir
+from dpbench.infrastructure.datamodel import (
+    Postfix,
+    ResultWriter,
+    store_postfixes,
+)
 from dpbench.infrastructure.frameworks.fabric import build_framework
+from dpbench.infrastructure.isolation import IsolationProfile
+from dpbench.infrastructure.platform_info import (
+    collect_environment_info,
+    collect_machine_info,
+)
+from dpbench.infrastructure.profiler import PROFILERS, make_profile_path
+from dpbench.infrastructure.roofline import measure_peak
+from dpbench.infrastructure.scaling import Sweep, add_sweep_presets, parse_sweep
+from dpbench.infrastructure.stats import ConvergenceCriteria
 
-from ._namespace import Namespace
+from ._namespace import Namespace, percent_type
+
+_DURATION_UNITS = {"ms": 1e-3, "s": 1, "m": 60, "h": 3600}
+
+
+def _repeat_type(value: str):
+    """Parses number of repeats, that is either positive integer or auto."""
+    if value == "auto":
+        return value
+
+    try:
+        repeat = int(value)
+    except ValueError:
+        repeat = 0
+
+    if repeat < 1:
+        raise argparse.ArgumentTypeError(
+            f"expected positive integer or auto, got {value}"
+        )
+
+    return repeat
+
+
+def _duration_type(value: str) -> float:
+    """Parses duration like 30s, 500ms, 2m or 30 into seconds."""
+    number, scale = value, 1
+    for unit in sorted(_DURATION_UNITS, key=len, reverse=True):
+        if value.endswith(unit):
+            number, scale = value.removesuffix(unit), _DURATION_UNITS[unit]
+            break
+
+    try:
+        duration = float(number) * scale
+    except ValueError:
+        duration = 0
+
+    if duration <= 0:
+        raise argparse.ArgumentTypeError(
+            f"expected positive duration, got {value}"
+        )
+
+    return duration
+
+
+def _sweep_type(value: str) -> Sweep:
+    """Parses sweep specification like npoints=2**10..2**24."""
+    try:
+        return parse_sweep(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _threads_type(value: str) -> list[int]:
+    """Parses comma separated thread counts like 1,2,4 or auto.
+
+    auto expands to powers of two up to the number of available cpus and the
+    number of available cpus itself.
+    """
+    if value == "auto":
+        cpus = len(os.sched_getaffinity(0))
+        threads = {1 << i for i in range(cpus.bit_length())} | {cpus}
+        return sorted(threads)
+
+    try:
+        threads = sorted({int(t) for t in value.split(",")})
+    except ValueError:
+        threads = []
+
+    if not threads or threads[0] < 1:
+        raise argparse.ArgumentTypeError(
+            f"expected comma separated positive integers or auto, got {value}"
+        )
+
+    return threads
 
 
 def add_run_arguments(parser: argparse.ArgumentParser):
@@ -33,6 +126,26 @@ def add_run_arguments(parser: argparse.ArgumentParser):
         default="S",
         help="Preset to use for benchmark execution.",
     )
+    parser.add_argument(
+        "--sweep",
+        type=_sweep_type,
+        nargs="?",
+        default=None,
+        help="Sweep preset parameter over geometric range name=start..stop"
+        + "[:factor], e.g. npoints=2**10..2**24. Each point is a copy of"
+        + " --preset with the parameter replaced and is stored as a separate"
+        + " result. Factor defaults to 2.",
+    )
+    parser.add_argument(
+        "--threads",
+        type=_threads_type,
+        nargs="?",
+        default=None,
+        help="Comma separated thread counts to run each implementation with,"
+        + " e.g. 1,2,4,8, or auto for powers of two up to the number of"
+        + " available cpus. Limits Numba, OpenMP, BLAS and SYCL CPU device"
+        + " threads. Each thread count is stored as a separate result.",
+    )
     parser.add_argument(
         "-s",
         "--validate",
@@ -70,10 +183,30 @@ def add_run_arguments(parser: argparse.ArgumentParser):
     parser.add_argument(
         "-r",
         "--repeat",
-        type=int,
+        type=_repeat_type,
         nargs="?",
         default=10,
-        help="Number of repeats for each benchmark.",
+        help="Number of repeats for each benchmark. If auto, benchmark is"
+        + " repeated until timings converge to --target-rsd or"
+        + " --time-budget runs out.",
+    )
+    parser.add_argument(
+        "--target-rsd",
+        type=percent_type,
+        nargs="?",
+        default="2%",
+        help="Target relative standard deviation (or relative half width of"
+        + " the median confidence interval) of execution times for"
+        + " --repeat auto, e.g. 2%%.",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=_duration_type,
+        nargs="?",
+        default="30s",
+        help="Maximum time spent on repetitions of each benchmark for"
+        + " --repeat auto, e.g. 30s, 500ms or 2m. It is limited to half of"
+        + " the timeout.",
     )
     parser.add_argument(
         "-t",
@@ -116,6 +249,153 @@ def add_run_arguments(parser: argparse.ArgumentParser):
         default=True,
         help="Either to save execution into database.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        default=1,
+        const=os.cpu_count(),
+        help="Number of framework processes that run benchmarks concurrently."
+        + " Uses the number of cpus if no value is given.",
+    )
+    parser.add_argument(
+        "--cpu-affinity",
+        choices=["auto", "none"],
+        type=str,
+        nargs="?",
+        default="none",
+        help="Pin each job to its own disjoint set of cores. 'auto' splits"
+        + " available cores evenly between jobs.",
+    )
+    parser.add_argument(
+        "--isolation",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if framework processes should be isolated to reduce timing"
+        + " noise: pinned to cpus of --numa-node with memory bound to it,"
+        + " page cache dropped before each benchmark where permitted and"
+        + " cpu frequency governor checked. Settings are recorded in run"
+        + " metadata.",
+    )
+    parser.add_argument(
+        "--numa-node",
+        type=int,
+        nargs="?",
+        default=0,
+        help="NUMA node to isolate framework processes on with --isolation.",
+    )
+    parser.add_argument(
+        "--drop-page-cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Set if page cache should be dropped before each benchmark with"
+        + " --isolation. Requires root permissions.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        nargs="?",
+        default=default_cache_dir(),
+        help="Directory to store dpbench caches in.",
+    )
+    parser.add_argument(
+        "--reference-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if reference outputs should be cached and reused across"
+        + " implementations and runs.",
+    )
+    parser.add_argument(
+        "--reference-cache-size",
+        type=float,
+        nargs="?",
+        default=16.0,
+        help="Maximum size of the reference output cache in GB. Least recently"
+        + " used outputs are evicted first.",
+    )
+    parser.add_argument(
+        "--input-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if generated input data should be cached on disk and"
+        + " shared between framework processes as read-only memory maps.",
+    )
+    parser.add_argument(
+        "--input-cache-size",
+        type=float,
+        nargs="?",
+        default=64.0,
+        help="Maximum size of the input data cache in GB. Least recently"
+        + " used inputs are evicted first.",
+    )
+    parser.add_argument(
+        "--shared-inputs",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if input data should be generated once in the main process"
+        + " and handed off to framework processes through shared memory.",
+    )
+    parser.add_argument(
+        "--jit-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if JIT compiled implementations should be cached on disk"
+        + " and reused across runs. Cache is invalidated once implementation"
+        + " source changes.",
+    )
+    parser.add_argument(
+        "--perf-counters",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if cycles, instructions, last level cache misses and"
+        + " estimated memory bandwidth should be collected for each"
+        + " repetition. Requires Linux perf_event_open access.",
+    )
+    parser.add_argument(
+        "--memory-tracking",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if peak RSS and peak traced allocation should be measured"
+        + " in separate untimed repetitions, because tracing allocations"
+        + " slows down execution.",
+    )
+    parser.add_argument(
+        "--device-timing",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if device span of each repetition, from completion of"
+        + " earlier work to completion of the last kernel, should be"
+        + " measured with SYCL event profiling. Benchmark arrays are"
+        + " allocated on a queue with profiling enabled.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=PROFILERS,
+        type=str,
+        nargs="?",
+        default=None,
+        help="Profiler to run untimed repetitions with after the timed ones."
+        + " Profiles are written into the profiles directory next to the"
+        + " results database. Profiling does not affect measured times.",
+    )
+    parser.add_argument(
+        "--calibrate",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Set if host peak GFLOP/s and GB/s should be measured with"
+        + " DGEMM and STREAM triad kernels before the run. It is used by"
+        + " the roofline report.",
+    )
+    parser.add_argument(
+        "--db-batch-size",
+        type=int,
+        nargs="?",
+        default=64,
+        help="Number of results to buffer before committing them into"
+        + " database. Buffered results are also committed after each"
+        + " benchmark.",
+    )
 
 
 def _find_framework_config(implementation: str) -> cfg.Framework:
@@ -129,6 +409,176 @@ def _find_framework_config(implementation: str) -> cfg.Framework:
     return framework
 
 
+def _create_runner(
+    args: Namespace,
+    result_writer: ResultWriter = None,
+    isolation: IsolationProfile = None,
+) -> BenchmarkRunner:
+    """Creates benchmark runner according to the concurrency arguments."""
+    if args.jobs < 1:
+        raise ValueError("--jobs must be a positive number")
+
+    cpu_sets = None
+    if args.cpu_affinity == "auto":
+        cpu_sets = split_cpu_affinity(
+            args.jobs, isolation.cpus if isolation else None
+        )
+        args.jobs = len(cpu_sets)
+    elif args.jobs > 1:
+        logging.warning(
+            "Concurrent jobs are not pinned to cores, measurements may"
+            + " interfere. Use --cpu-affinity=auto to avoid it."
+        )
+
+    return BenchmarkRunner(
+        cpu_sets=cpu_sets,
+        result_writer=result_writer,
+        isolation=isolation,
+    )
+
+
+def _store_postfixes(args: Namespace, conn: sqlalchemy.Engine):
+    """Stores description of the requested implementations into database."""
+    implementation_descriptions = {
+        impl.postfix: impl.description for impl in cfg.GLOBAL.implementations
+    }
+    postfixes = []
+    for implementation in args.implementations:
+        framework_config = _find_framework_config(implementation)
+
+        if not framework_config:
+            logging.error(
+                f"Could not find framework for {implementation} implementation"
+            )
+            continue
+
+        framework = build_framework(framework_config)
+
+        postfixes.append(
+            Postfix(
+                run_id=args.run_id,
+                postfix=implementation,
+                description=implementation_descriptions[implementation],
+                device=framework.device_info,
+            )
+        )
+
+    store_postfixes(conn=conn, postfixes=postfixes)
+
+
+def _store_platform(args: Namespace, conn: sqlalchemy.Engine):
+    """Stores machine and software environment the run is executed on."""
+    if not args.save or not conn:
+        return
+
+    try:
+        dpbi.store_run_machine(
+            conn, args.run_id, collect_machine_info().Machine()
+        )
+        dpbi.store_run_metadata(conn, args.run_id, collect_environment_info())
+    except Exception:
+        logging.exception("Failed to collect platform information")
+
+
+def _calibrate(args: Namespace, conn: sqlalchemy.Engine):
+    """Measures host peak performance and stores it into the run record."""
+    if not args.calibrate or not conn:
+        return
+
+    logging.info("Measuring host peak performance")
+    peak = measure_peak()
+    print(f"Host peak: {peak.gflops:.1f} GFLOP/s, {peak.gbps:.1f} GB/s")
+    dpbi.store_machine_peak(conn, args.run_id, peak.gflops, peak.gbps)
+
+
+def _create_isolation(
+    args: Namespace, conn: sqlalchemy.Engine
+) -> Union[IsolationProfile, None]:
+    """Creates isolation profile and stores its settings into database.
+
+    Returns: isolation profile or None if isolation was not requested.
+    """
+    if not args.isolation:
+        return None
+
+    isolation = IsolationProfile.for_numa_node(
+        args.numa_node, drop_page_cache=args.drop_page_cache
+    )
+    settings = isolation.describe()
+    logging.info(f"Isolation settings: {settings}")
+    if conn:
+        dpbi.store_run_metadata(conn, args.run_id, settings)
+
+    return isolation
+
+
+def _profile_dir(args: Namespace) -> str:
+    """Returns directory to write profiles of the run into."""
+    return os.path.join(
+        os.path.dirname(os.path.abspath(args.results_db)),
+        "profiles",
+        f"run_{args.run_id}" if args.run_id is not None else "unsaved",
+    )
+
+
+def _create_run_config(
+    args: Namespace,
+    conn: sqlalchemy.Engine,
+    benchmark: cfg.Benchmark,
+    framework: cfg.Framework,
+    implementation: str,
+    preset: str,
+    threads: int = 0,
+) -> RunConfig:
+    """Creates run configuration for the benchmark implementation."""
+    return RunConfig(
+        conn=conn,
+        benchmark=benchmark,
+        framework=framework,
+        implementation=implementation,
+        preset=preset,
+        repeat=args.repeat if args.repeat != "auto" else 0,
+        validate=args.validate,
+        timeout=args.timeout,
+        precision=args.precision,
+        print_results=args.print_results,
+        run_id=args.run_id,
+        skip_expected_failures=args.skip_expected_failures,
+        reference_cache_dir=os.path.join(args.cache_dir, "reference")
+        if args.reference_cache
+        else None,
+        reference_cache_size=int(args.reference_cache_size * 1024**3),
+        input_cache_dir=os.path.join(args.cache_dir, "input")
+        if args.input_cache
+        else None,
+        input_cache_size=int(args.input_cache_size * 1024**3),
+        shared_inputs=args.shared_inputs,
+        threads=threads,
+        jit_cache_dir=os.path.join(args.cache_dir, "jit")
+        if args.jit_cache
+        else None,
+        convergence=ConvergenceCriteria(
+            target_rsd=args.target_rsd,
+            time_budget=args.time_budget,
+        )
+        if args.repeat == "auto"
+        else None,
+        perf_counters=args.perf_counters,
+        memory_tracking=args.memory_tracking,
+        device_timing=args.device_timing,
+        profile=args.profile,
+        profile_path=make_profile_path(
+            _profile_dir(args),
+            args.profile,
+            benchmark.module_name,
+            implementation,
+            preset if not threads else f"{preset}_t{threads}",
+        )
+        if args.profile
+        else None,
+    )
+
+
 def execute_run(args: Namespace, conn: sqlalchemy.Engine):
     """Execute run sub command.
 
@@ -145,6 +595,7 @@ def execute_run(args: Namespace, conn: sqlalchemy.Engine):
         with_npbench=args.npbench,
         with_polybench=args.polybench,
         with_rodinia=args.rodinia,
+        manifest=args.manifest,
     )
 
     if args.all_implementations:
@@ -159,38 +610,39 @@ def execute_run(args: Namespace, conn: sqlalchemy.Engine):
     if args.save and args.run_id is None:
         args.run_id = dpbi.create_run(conn)
 
-    runner = BenchmarkRunner()
+    _store_platform(args, conn)
+    _calibrate(args, conn)
+    isolation = _create_isolation(args, conn)
 
-    implementation_descriptions = {
-        impl.postfix: impl.description for impl in cfg.GLOBAL.implementations
-    }
-    for implementation in args.implementations:
-        framework_config = _find_framework_config(implementation)
+    result_writer = None
+    if conn:
+        result_writer = ResultWriter(conn, batch_size=args.db_batch_size)
 
-        if not framework_config:
-            logging.error(
-                f"Could not find framework for {implementation} implementation"
-            )
-            continue
+    runner = _create_runner(args, result_writer, isolation)
 
-        framework = build_framework(framework_config)
+    try:
+        _run_benchmarks(args, conn, runner)
+    finally:
+        runner.close_connections()
+        if result_writer:
+            result_writer.close()
 
-        store_postfix(
-            conn=conn,
-            postfix=Postfix(
-                run_id=args.run_id,
-                postfix=implementation,
-                description=implementation_descriptions[implementation],
-                device=framework.device_info,
-            ),
-        )
+
+def _run_benchmarks(
+    args: Namespace, conn: sqlalchemy.Engine, runner: BenchmarkRunner
+):
+    """Runs requested benchmarks and saves results into database."""
+    _store_postfixes(args, conn)
+
+    # Runs that are dispatched concurrently once all of them are collected.
+    pending_run_configs: list[RunConfig] = []
 
     for benchmark in cfg.GLOBAL.benchmarks:
-        print("")
-        print(
-            f"================ Benchmark {benchmark.name} ({benchmark.module_name}) ========================"
-        )
-        print("")
+        run_configs: list[RunConfig] = []
+
+        presets = [args.preset]
+        if args.sweep:
+            presets = add_sweep_presets(benchmark, args.preset, args.sweep)
 
         for implementation in args.implementations:
             framework = _find_framework_config(implementation)
@@ -202,21 +654,30 @@ def execute_run(args: Namespace, conn: sqlalchemy.Engine):
                 f"Running {benchmark.module_name} ({implementation}) on {framework.simple_name}"
             )
 
-            runner.run_benchmark_and_save(
-                RunConfig(
-                    conn=conn,
-                    benchmark=benchmark,
-                    framework=framework,
-                    implementation=implementation,
-                    preset=args.preset,
-                    repeat=args.repeat,
-                    validate=args.validate,
-                    timeout=args.timeout,
-                    precision=args.precision,
-                    print_results=args.print_results,
-                    run_id=args.run_id,
-                    skip_expected_failures=args.skip_expected_failures,
-                )
-            )
+            for preset in presets:
+                for threads in args.threads or [0]:
+                    run_configs.append(
+                        _create_run_config(
+                            args,
+                            conn,
+                            benchmark,
+                            framework,
+                            implementation,
+                            preset,
+                            threads,
+                        )
+                    )
+
+        if args.jobs > 1:
+            pending_run_configs += run_configs
+            continue
+
+        print("")
+        print(
+            f"================ Benchmark {benchmark.name} ({benchmark.module_name}) ========================"
+        )
+        print("")
+
+        runner.run_benchmarks_and_save(run_configs)
 
-    runner.close_connections()
+    runner.run_benchmarks_and_save(pending_run_configs, jobs=args.jobs)
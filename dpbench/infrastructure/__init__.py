@@ -5,13 +5,25 @@
 from .benchmark import Benchmark
 from .benchmark_results import BenchmarkResults
 from .datamodel import (
+    EXEC_TIME_SAMPLES,
     Base,
+    Machine,
     Result,
+    ResultWriter,
     Run,
+    RunMetadata,
+    Sample,
     create_connection,
     create_results_table,
     create_run,
+    read_run_machine,
+    read_run_metadata,
+    read_run_samples,
+    read_samples,
+    store_machine_peak,
     store_results,
+    store_run_machine,
+    store_run_metadata,
 )
 from .frameworks import (
     CupyFramework,
@@ -25,15 +37,30 @@ from .frameworks import (
 )
 from .reporter import (
     generate_comparison_report,
+    generate_compile_time_report,
+    generate_device_time_report,
+    generate_dispatch_report,
     generate_impl_summary_report,
+    generate_memory_report,
     generate_performance_report,
+    generate_profile_report,
+    generate_regression_report,
+    generate_roofline_report,
+    generate_scaling_report,
+    generate_thread_scaling_report,
+    generate_trend_report,
     get_unexpected_failures,
 )
 
 __all__ = [
     "Base",
+    "Machine",
     "Run",
+    "RunMetadata",
     "Result",
+    "ResultWriter",
+    "Sample",
+    "EXEC_TIME_SAMPLES",
     "Benchmark",
     "BenchmarkResults",
     "Framework",
@@ -48,8 +75,25 @@ __all__ = [
     "create_results_table",
     "create_run",
     "store_results",
+    "store_machine_peak",
+    "store_run_metadata",
+    "read_run_metadata",
+    "store_run_machine",
+    "read_run_machine",
+    "read_samples",
+    "read_run_samples",
     "generate_impl_summary_report",
     "generate_performance_report",
+    "generate_compile_time_report",
+    "generate_roofline_report",
+    "generate_memory_report",
+    "generate_device_time_report",
+    "generate_dispatch_report",
+    "generate_profile_report",
+    "generate_scaling_report",
+    "generate_thread_scaling_report",
     "generate_comparison_report",
+    "generate_regression_report",
+    "generate_trend_report",
     "get_unexpected_failures",
 ]
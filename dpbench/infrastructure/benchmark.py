@@ -4,13 +4,18 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-License-Identifier: BSD-3-Clause
 
+import functools
 import importlib
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 import numpy as np
 
 import dpbench.config as cfg
+from dpbench.config.benchmark import implementation_func_names
+
+from .cache import InputCache
+from .validation_modes import validate_outputs
 
 
 class Benchmark(object):
@@ -21,16 +26,20 @@ class Benchmark(object):
     def __init__(
         self,
         config: cfg.Benchmark,
+        input_cache: InputCache = None,
     ):
         """Reads benchmark information.
 
         Args:
             config: Benchmark configuration.
+            input_cache: Cache to load generated input data from. None means
+                input data is always generated.
         """
 
         # [preset] = benchmark input data
         self.bdata = dict()
         self.info: cfg.Benchmark = config
+        self.input_cache = input_cache
 
         self.initialize_fn = (
             getattr(
@@ -52,7 +61,25 @@ class Benchmark(object):
     def init_fn_name(self):
         return self.info.init.func_name if self.info.init else None
 
-    def get_validation_func(self):
+    def get_validation_func(self, precision: str = None):
+        """Returns function that validates outputs against reference.
+
+        Validation spec of bench_info takes priority over validation package.
+
+        Args:
+            precision: precision selected for the run, precision of the init
+                config is used if not set.
+        """
+        if self.info.validation:
+            if precision is None and self.info.init:
+                precision = self.info.init.precision
+
+            return functools.partial(
+                validate_outputs,
+                spec=self.info.validation,
+                precision=precision or "",
+            )
+
         mod = importlib.import_module(self.info.validate_package_path)
         validate_function = getattr(mod, self.info.validate_func_name)
 
@@ -74,7 +101,19 @@ class Benchmark(object):
 
         try:
             mod = importlib.import_module(implementation.package_path)
-            implementation_function = getattr(mod, implementation.func_name)
+            func_name = implementation.func_name
+            if func_name == "":
+                # Function name could not be discovered without import.
+                func_name = next(
+                    func
+                    for func in implementation_func_names(
+                        self.info,
+                        implementation.module_name.split(".")[0],
+                        implementation.postfix,
+                    )
+                    if hasattr(mod, func)
+                )
+            implementation_function = getattr(mod, func_name)
         except Exception:
             logging.error(
                 f"Failed to import benchmark module: {implementation.module_name}"
@@ -157,6 +196,16 @@ class Benchmark(object):
     def get_input_data(self, preset: str) -> Dict[str, Any]:
         return self.bdata[preset]
 
+    def set_input_data(self, preset: str, data: Dict[str, Any]):
+        """Sets already initialized benchmark data for the preset.
+
+        Args:
+           preset: The data-size preset (S, M, L).
+           data: Dictionary with benchmark inputs as key and initialized data
+                 as value.
+        """
+        self.bdata[preset] = data
+
     def initialize_input_data(
         self, preset: str, global_precision: str
     ) -> Dict[str, Any]:
@@ -192,7 +241,7 @@ class Benchmark(object):
 
         self._initialize_input_data_from_init(global_precision, data)
 
-        # 8. Update the benchmark data (self.bdata) with the generated data
+        # 9. Update the benchmark data (self.bdata) with the generated data
         #    for the provided preset.
         self.bdata[preset] = data
         return self.bdata[preset]
@@ -230,6 +279,11 @@ class Benchmark(object):
             init_input_args_val_list.append(data[arg])
 
         init_kws = dict(zip(init_input_args_list, init_input_args_val_list))
+
+        cache_key = self._get_input_cache_key(global_precision, init_kws)
+        if self._load_cached_input_data(cache_key, data):
+            return
+
         initialized_output = self.initialize_fn(**init_kws)
 
         # 6. Store the initialized output in the "data" dict. Note that the
@@ -264,3 +318,56 @@ class Benchmark(object):
                         )
                     }
                 )
+
+        # 8. Store the initialized output in the cache, so the next run can
+        #    load it instead of calling initialize_fn.
+        self._store_cached_input_data(cache_key, data)
+
+    def _get_input_cache_key(
+        self, global_precision: str, init_kws: dict[str, Any]
+    ) -> Union[str, None]:
+        """Builds input cache key for the initialization arguments.
+
+        Returns: cache key or None if input cache is disabled.
+        """
+        if not self.input_cache:
+            return None
+
+        return self.input_cache.make_input_key(
+            benchmark=self.bname,
+            init_package_path=self.init_mod_path,
+            init_args=init_kws,
+            precision=global_precision or self.info.init.precision,
+            dtypes=cfg.GLOBAL.dtypes,
+        )
+
+    def _load_cached_input_data(
+        self, cache_key: Union[str, None], data: Dict[str, Any]
+    ) -> bool:
+        """Populates benchmark data with initialized outputs from the cache.
+
+        Returns: True if data was found in the cache.
+        """
+        if cache_key is None:
+            return False
+
+        cached_output = self.input_cache.get(cache_key)
+        if cached_output is None:
+            return False
+
+        logging.info(f"Using cached input data for {self.bname}")
+        data.update(cached_output)
+
+        return True
+
+    def _store_cached_input_data(
+        self, cache_key: Union[str, None], data: Dict[str, Any]
+    ):
+        """Stores initialized outputs from the benchmark data into the cache."""
+        if cache_key is None:
+            return
+
+        self.input_cache.put(
+            cache_key,
+            {out: data[out] for out in self.info.init.output_args},
+        )
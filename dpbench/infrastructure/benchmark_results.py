@@ -6,7 +6,13 @@ from dataclasses import dataclass, field
 
 import numpy as np
 
-from dpbench.infrastructure.datamodel import Result
+from dpbench.infrastructure.datamodel import (
+    DEVICE_TIME_SAMPLES,
+    DISPATCH_TIME_SAMPLES,
+    EXEC_TIME_SAMPLES,
+    Result,
+    Sample,
+)
 from dpbench.infrastructure.enums import ErrorCodes, ValidationStatusCodes
 
 
@@ -20,9 +26,12 @@ class BenchmarkResults:
     impl_postfix: str
     preset: str
     input_size: int = 0
+    # Number of threads the run was limited to, 0 if default.
+    threads: int = 0
 
     setup_time: float = 0.0
     warmup_time: float = 0.0
+    compile_time: float = 0.0
     teardown_time: float = 0.0
 
     min_exec_time: float = 0.0
@@ -31,9 +40,75 @@ class BenchmarkResults:
     quartile75_exec_time: float = 0.0
     max_exec_time: float = 0.0
 
+    # Work done by single execution, 0 if unknown.
+    flops: float = 0.0
+    traffic_bytes: float = 0.0
+
     validation_state: ValidationStatusCodes = ValidationStatusCodes.NA
     error_state: ErrorCodes = ErrorCodes.UNIMPLEMENTED
     error_msg: str = "Not implemented"
+    profile_path: str = None
+    # Whether adaptive repetition converged, None for fixed repeat count.
+    converged: bool = None
+
+    # Hardware performance counter values per repetition keyed by the name.
+    counters: dict[str, list] = field(default_factory=dict)
+    # Host memory peaks in bytes per repetition keyed by the name.
+    memory: dict[str, list] = field(default_factory=dict)
+    # Times until implementation returned in nanoseconds per repetition.
+    # Execution times also cover waiting for asynchronous work to complete.
+    dispatch_times: list[float] = field(default_factory=list)
+    # Device spans in nanoseconds per repetition, including idle gaps between
+    # kernels. Empty if not measured.
+    device_times: list[float] = field(default_factory=list)
+
+    _exec_times: np.ndarray = field(default=None, init=False, repr=False)
+
+    @property
+    def first_run_time(self):
+        """Returns time of the warmup execution without compilation.
+
+        It still includes first-touch allocations, device queue creation, etc.
+        """
+        return max(int(self.warmup_time) - int(self.compile_time), 0)
+
+    @property
+    def gflops(self) -> float:
+        """Returns achieved GFLOP/s of the median execution."""
+        if self.median_exec_time <= 0:
+            return 0.0
+        return self.flops / self.median_exec_time
+
+    @property
+    def gbps(self) -> float:
+        """Returns achieved GB/s of the median execution."""
+        if self.median_exec_time <= 0:
+            return 0.0
+        return self.traffic_bytes / self.median_exec_time
+
+    @property
+    def peak_rss(self) -> int:
+        """Returns peak resident set size over all repetitions in bytes."""
+        return max(self.memory.get("peak_rss", []), default=0)
+
+    @property
+    def peak_alloc(self) -> int:
+        """Returns peak traced allocation over all repetitions in bytes."""
+        return max(self.memory.get("peak_alloc", []), default=0)
+
+    @property
+    def median_dispatch_time(self) -> float:
+        """Returns median dispatch-only time, 0 if not measured."""
+        if len(self.dispatch_times) == 0:
+            return 0.0
+        return float(np.median(self.dispatch_times))
+
+    @property
+    def median_device_time(self) -> float:
+        """Returns median device span, 0 if not measured."""
+        if len(self.device_times) == 0:
+            return 0.0
+        return float(np.median(self.device_times))
 
     @property
     def exec_times(self):
@@ -47,7 +122,8 @@ class BenchmarkResults:
 
     @exec_times.setter
     def exec_times(self, exec_times):
-        if not exec_times:
+        self._exec_times = np.asarray(exec_times, dtype=np.float64)
+        if len(exec_times) == 0:
             exec_times = [0.0]
         quartiles = np.percentile(exec_times, [25, 50, 75])
         self.min_exec_time = min(exec_times)
@@ -56,7 +132,13 @@ class BenchmarkResults:
         self.quartile75_exec_time = quartiles[2]
         self.max_exec_time = max(exec_times)
 
-    def Result(self, run_id: int, benchmark_name, framework_version) -> Result:
+    def Result(
+        self,
+        run_id: int,
+        benchmark_name,
+        framework_version,
+        platform: str = "n/a",
+    ) -> Result:
         if self.error_state == ErrorCodes.UNIMPLEMENTED:
             error_state_str = "Unimplemented"
         elif self.error_state == ErrorCodes.NO_FRAMEWORK:
@@ -76,14 +158,14 @@ class BenchmarkResults:
             run_id=run_id,
             benchmark=benchmark_name,
             implementation=self.impl_postfix,
-            # TODO: platform
-            platform="TODO",
+            platform=platform,
             framework_version=framework_version,
             error_state=error_state_str,
             problem_preset=self.preset,
             input_size=self.input_size,
             setup_time=self.setup_time,
             warmup_time=self.warmup_time,
+            compile_time=self.compile_time,
             repeats=str(self.repeats),
             min_exec_time=self.min_exec_time,
             max_exec_time=self.max_exec_time,
@@ -94,8 +176,38 @@ class BenchmarkResults:
             validated="Success"
             if self.validation_state == ValidationStatusCodes.SUCCESS
             else "Fail",
+            flops=self.flops,
+            traffic_bytes=self.traffic_bytes,
+            gflops=self.gflops,
+            gbps=self.gbps,
+            peak_rss=self.peak_rss,
+            peak_alloc=self.peak_alloc,
+            median_dispatch_time=self.median_dispatch_time,
+            median_device_time=self.median_device_time,
+            profile_path=self.profile_path,
+            threads=self.threads,
+            converged=self.converged,
+            samples=self._samples(),
         )
 
+    def _samples(self) -> list[Sample]:
+        """Returns per-repetition samples of all measured values."""
+        timings = {
+            EXEC_TIME_SAMPLES: self._exec_times,
+            DISPATCH_TIME_SAMPLES: self.dispatch_times,
+            DEVICE_TIME_SAMPLES: self.device_times,
+        }
+
+        return [
+            Sample.from_array(name, values)
+            for name, values in {
+                **timings,
+                **self.counters,
+                **self.memory,
+            }.items()
+            if values is not None and len(values) > 0
+        ]
+
     def _format_ns(self, time_in_ns: int):
         time = int(time_in_ns)
         assert time >= 0
@@ -125,6 +237,8 @@ class BenchmarkResults:
             print("input size:", self.input_size)
             print("setup time:", self._format_ns(self.setup_time))
             print("warmup time:", self._format_ns(self.warmup_time))
+            print("compile time:", self._format_ns(self.compile_time))
+            print("first run time:", self._format_ns(self.first_run_time))
             print("teardown time:", self._format_ns(self.teardown_time))
             print("max execution times:", self._format_ns(self.max_exec_time))
             print("min execution times:", self._format_ns(self.min_exec_time))
@@ -132,18 +246,47 @@ class BenchmarkResults:
                 "median execution times:",
                 self._format_ns(self.median_exec_time),
             )
-            warmup_ovhd_time = int(self.warmup_time) - int(
+            warmup_ovhd_time = int(self.first_run_time) - int(
                 self.median_exec_time
             )
             print(
-                "warmup overhead time (warmup time - median execution time):",
+                "warmup overhead time (first run time - median execution time):",
                 self._format_ns(warmup_ovhd_time)
                 if warmup_ovhd_time > 0
                 else "N/A",
             )
+            self._print_optional_measurements()
+            if self.profile_path:
+                print("profile:", self.profile_path)
             print("repeats:", self.repeats)
+            if self.converged is not None:
+                print("converged:", self.converged)
             print("preset:", self.preset)
+            if self.threads:
+                print("threads:", self.threads)
             print("validated:", self.validation_state)
         else:
             print("error states:", self.error_state)
             print("error msg:", self.error_msg)
+
+    def _print_optional_measurements(self):
+        """Prints measurements that are only collected on request."""
+        if self.dispatch_times:
+            print(
+                "median dispatch times:",
+                self._format_ns(self.median_dispatch_time),
+            )
+        if self.device_times:
+            print(
+                "median device span:",
+                self._format_ns(self.median_device_time),
+            )
+        if self.flops > 0:
+            print("GFLOP/s:", round(self.gflops, 3))
+        if self.traffic_bytes > 0:
+            print("GB/s:", round(self.gbps, 3))
+        for name, values in self.counters.items():
+            print(f"median {name}:", np.median(values))
+        if self.memory:
+            print("peak rss:", self.peak_rss)
+            print("peak allocation:", self.peak_alloc)
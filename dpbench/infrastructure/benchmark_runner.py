@@ -7,20 +7,48 @@ import inspect
 import logging
 import multiprocessing as mp
 import multiprocessing.connection as mpc
-from dataclasses import dataclass
-from typing import Any, Union
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Union
 
 import sqlalchemy
 
 import dpbench.config as cfg
 from dpbench.infrastructure.benchmark import Benchmark
 from dpbench.infrastructure.benchmark_results import BenchmarkResults
-from dpbench.infrastructure.datamodel import store_results
+from dpbench.infrastructure.cache import InputCache, ReferenceCache
+from dpbench.infrastructure.datamodel import ResultWriter, store_results
 from dpbench.infrastructure.enums import ErrorCodes, ValidationStatusCodes
 from dpbench.infrastructure.frameworks import Framework
 from dpbench.infrastructure.frameworks.fabric import build_framework
+from dpbench.infrastructure.isolation import (
+    IsolationProfile,
+    drop_page_cache,
+    parse_cpu_list,
+)
+from dpbench.infrastructure.memory import MemoryTracker
+from dpbench.infrastructure.perf_counters import (
+    PerfCounters,
+    estimate_memory_bandwidth,
+)
+from dpbench.infrastructure.profiler import Profiler, get_profiler_class
+from dpbench.infrastructure.roofline import estimate_work
+from dpbench.infrastructure.shared_data import (
+    attach_data,
+    close_segments,
+    share_data,
+)
+from dpbench.infrastructure.stats import ConvergenceCriteria
 from dpbench.infrastructure.timer import timer
 
+# Number of untimed repetitions host memory is tracked in. Peaks of the
+# repetitions are stored as samples.
+MEMORY_TRACKING_REPEAT = 3
+
 """
 Send on process creation:
     Framework configuration: so the process can set it up.
@@ -45,6 +73,20 @@ class BaseRunConfig:
     validate: bool = True
     precision: str = None
     print_results: bool = True
+    reference_cache_dir: str = None
+    reference_cache_size: int = 0
+    input_cache_dir: str = None
+    input_cache_size: int = 0
+    shared_input_data: dict = None
+    jit_cache_dir: str = None
+    convergence: ConvergenceCriteria = None
+    perf_counters: bool = False
+    memory_tracking: bool = False
+    device_timing: bool = False
+    profile: str = None
+    profile_path: str = None
+    # Number of threads the process is limited to, 0 if default.
+    threads: int = 0
 
     @classmethod
     def from_instance(cls, instance):
@@ -67,18 +109,99 @@ class RunConfig(BaseRunConfig):
     timeout: float = 200.0
     run_id: int = None
     skip_expected_failures: bool = False
+    shared_inputs: bool = False
+
+
+def _read_cpu_siblings(cpu: int) -> set[int]:
+    """Reads set of logical cpus that share the same core with cpu."""
+    path = f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list"
+
+    try:
+        with open(path) as file:
+            return parse_cpu_list(file.read())
+    except OSError:
+        return {cpu}
+
+
+def thread_count_env(threads: int) -> dict[str, str]:
+    """Returns environment variables that limit threading runtimes.
+
+    It covers Numba and OpenMP thread pools, BLAS libraries used by NumPy and
+    the SYCL CPU device runtime. Variables must be set before the runtimes
+    spin up their thread pools.
+
+    Args:
+        threads: number of threads.
+
+    Returns: dictionary of environment variables.
+    """
+    return {
+        "NUMBA_NUM_THREADS": str(threads),
+        "OMP_NUM_THREADS": str(threads),
+        "MKL_NUM_THREADS": str(threads),
+        "OPENBLAS_NUM_THREADS": str(threads),
+        "DPCPP_CPU_NUM_CUS": str(threads),
+        "DPCPP_CPU_PLACES": "cores",
+        "DPCPP_CPU_CU_AFFINITY": "close",
+    }
+
+
+def split_cpu_affinity(jobs: int, cpus: set[int] = None) -> list[set[int]]:
+    """Splits cpus available to the current process into disjoint sets.
+
+    Logical cpus of the same physical core always land in the same set, so
+    workers pinned to different sets do not share cores.
+
+    Args:
+        jobs: number of sets to split cpus into.
+        cpus: cpus to split. Defaults to the cpus available to the current
+            process.
+
+    Returns: list of cpu sets. It may be shorter than jobs if there are not
+        enough cores available.
+    """
+    available = cpus or os.sched_getaffinity(0)
+
+    cores: list[set[int]] = []
+    for cpu in sorted(available):
+        if any(cpu in core for core in cores):
+            continue
+        cores.append(_read_cpu_siblings(cpu) & available)
+
+    if len(cores) < jobs:
+        logging.warning(
+            f"Only {len(cores)} cores are available for {jobs} jobs"
+        )
+        jobs = len(cores)
+
+    chunk, remainder = divmod(len(cores), jobs)
+
+    cpu_sets = []
+    start = 0
+    for job in range(jobs):
+        end = start + chunk + (1 if job < remainder else 0)
+        cpu_sets.append(set().union(*cores[start:end]))
+        start = end
+
+    return cpu_sets
 
 
 class BenchmarkRunner:
     """Benchmark runner that delegates runs between processes.
 
     It creates process for each framework to avoid conflicts in framework
-    imports.
+    imports. When several workers are used, each worker gets its own process
+    for each framework, so independent benchmarks can run concurrently.
+    Runs limited to different thread counts get different processes as well,
+    because threading runtimes are configured on process start.
     """
 
     def __init__(
         self,
         method: str = "spawn",
+        cpu_sets: list[set[int]] = None,
+        result_writer: ResultWriter = None,
+        isolation: IsolationProfile = None,
     ) -> None:
         """Creates BenchmarkRunner. No processes get spawn at this point.
 
@@ -86,14 +209,30 @@ class BenchmarkRunner:
             method: method for sub process creations. Currently only spawn is
                 supported. We need to get rid of GLOBAL config to get support
                 for 'fork' method.
+            cpu_sets: cpu sets to pin worker processes to. Worker with index i
+                is pinned to cpu_sets[i]. None or empty list means no pinning.
+            result_writer: buffered writer to save results with. If None,
+                every result is committed to database right away.
+            isolation: isolation profile applied to every framework process.
+                Per worker cpu sets narrow down its cpus.
         """
         self._ctx = mp.get_context(method)
+        self._cpu_sets = cpu_sets or []
+        self._result_writer = result_writer
+        self._isolation = isolation
+        # Used when run config has no timeout, e.g. bare -t or -t 0.
+        self._default_timeout = RunConfig.timeout
         self._framework_processes: dict[
-            str, tuple[mp.Process, mpc.Connection]
+            tuple[str, int, int], tuple[mp.Process, mpc.Connection]
         ] = {}
+        # Input data shared with framework processes and number of pending
+        # runs that use it.
+        self._shared_input_data: dict[tuple, tuple[dict, list]] = {}
+        self._shared_input_usages: dict[tuple, int] = {}
+        self._shared_input_lock = threading.Lock()
 
     def get_process(
-        self, framework: cfg.Framework
+        self, framework: cfg.Framework, worker: int = 0, threads: int = 0
     ) -> tuple[mp.Process, mpc.Connection]:
         """Get process with connection to it using caching.
 
@@ -103,63 +242,179 @@ class BenchmarkRunner:
 
         Args:
             framework: framework to which return the process.
+            worker: index of the worker that owns the process.
+            threads: number of threads the process is limited to, 0 means
+                default number of threads.
 
         Returns: tuple of process and connection pip to control it.
         """
         p, conn = self._framework_processes.get(
-            framework.simple_name, (None, None)
+            (framework.simple_name, worker, threads), (None, None)
         )
         if not p:
-            return self.create_process(framework)
+            return self.create_process(framework, worker, threads)
         return p, conn
 
-    def kill_process(self, framework: cfg.Framework) -> None:
+    def kill_process(
+        self, framework: cfg.Framework, worker: int = 0, threads: int = 0
+    ) -> None:
         """Kill the process for framework and closes connection.
 
         Args:
             framework: framework to which kill the process.
+            worker: index of the worker that owns the process.
+            threads: number of threads the process is limited to.
         """
-        logging.info(f"Killing process for {framework.simple_name}")
-        p, conn = self._framework_processes.get(
-            framework.simple_name, (None, None)
+        logging.info(
+            f"Killing process for {framework.simple_name} (worker {worker})"
         )
+        key = (framework.simple_name, worker, threads)
+        p, conn = self._framework_processes.get(key, (None, None))
         if not p:
             return
         p.kill()
         p.join()
         conn.close()
-        del self._framework_processes[framework.simple_name]
+        del self._framework_processes[key]
 
     def create_process(
-        self, framework: cfg.Framework
+        self, framework: cfg.Framework, worker: int = 0, threads: int = 0
     ) -> tuple[mp.Process, mpc.Connection]:
         """Create a process and updates cache for it.
 
         Args:
             framework: framework to which create the process.
+            worker: index of the worker that owns the process.
+            threads: number of threads to limit threading runtimes of the
+                process to, 0 means default number of threads.
         """
-        logging.info(f"Creating new process for {framework.simple_name}")
+        logging.info(
+            f"Creating new process for {framework.simple_name} (worker {worker})"
+        )
         parent_conn, child_conn = self._ctx.Pipe()
         p = self._ctx.Process(target=BenchmarkRunner.runner, args=(child_conn,))
-        self._framework_processes[framework.simple_name] = (p, parent_conn)
+        self._framework_processes[(framework.simple_name, worker, threads)] = (
+            p,
+            parent_conn,
+        )
 
         p.start()
 
         parent_conn.send(logging.root.level)
         parent_conn.send(framework)
         parent_conn.send(cfg.GLOBAL.dtypes)
+        parent_conn.send(
+            self._cpu_sets[worker] if worker < len(self._cpu_sets) else None
+        )
+        parent_conn.send(threads)
+        parent_conn.send(self._isolation)
 
         return (p, parent_conn)
 
     def close_connections(self):
         """Closes all opened connections and processes."""
-        for framework_name, proc in self._framework_processes.items():
+        for key, proc in self._framework_processes.items():
+            framework_name, worker, _ = key
             p, c = proc
 
-            logging.info(f"Closing connection to {framework_name}")
+            logging.info(
+                f"Closing connection to {framework_name} (worker {worker})"
+            )
             c.close()
             p.join()
 
+        for _, segments in self._shared_input_data.values():
+            close_segments(segments, unlink=True)
+        self._shared_input_data.clear()
+
+    @staticmethod
+    def _shared_input_data_key(rc: RunConfig) -> tuple:
+        return (rc.benchmark.module_name, rc.preset, rc.precision)
+
+    def _get_shared_input_data(self, rc: RunConfig) -> Union[dict, None]:
+        """Returns descriptors of the benchmark input data in shared memory.
+
+        Input data is generated once and shared between all the runs of the
+        benchmark with the same preset and precision.
+
+        Args:
+            rc: runtime configuration.
+
+        Returns: dictionary with data descriptors or None if data could not be
+            generated. In that case framework process generates data itself.
+        """
+        key = self._shared_input_data_key(rc)
+
+        with self._shared_input_lock:
+            if key not in self._shared_input_data:
+                input_cache = None
+                if rc.input_cache_dir:
+                    input_cache = InputCache(
+                        rc.input_cache_dir, max_size=rc.input_cache_size
+                    )
+
+                try:
+                    bench = Benchmark(rc.benchmark, input_cache=input_cache)
+                    data = bench.initialize_input_data(rc.preset, rc.precision)
+                    self._shared_input_data[key] = share_data(data)
+                except Exception:
+                    logging.exception(
+                        "Failed to generate shared input data for "
+                        + rc.benchmark.module_name
+                    )
+                    return None
+
+            return self._shared_input_data[key][0]
+
+    def _add_shared_input_data_usages(self, rcs: list[RunConfig]):
+        with self._shared_input_lock:
+            for rc in rcs:
+                if not rc.shared_inputs:
+                    continue
+                key = self._shared_input_data_key(rc)
+                self._shared_input_usages[key] = (
+                    self._shared_input_usages.get(key, 0) + 1
+                )
+
+    def _release_shared_input_data(self, rc: RunConfig):
+        """Destroys shared input data once no pending runs use it."""
+        if not rc.shared_inputs:
+            return
+
+        key = self._shared_input_data_key(rc)
+
+        with self._shared_input_lock:
+            usages = self._shared_input_usages.pop(key, 0) - 1
+            if usages > 0:
+                self._shared_input_usages[key] = usages
+                return
+
+            _, segments = self._shared_input_data.pop(key, (None, []))
+            close_segments(segments, unlink=True)
+
+    @staticmethod
+    def _set_up_process(
+        cpu_set: set[int], threads: int, isolation: IsolationProfile
+    ) -> None:
+        """Applies isolation, cpu affinity and thread limits to the process.
+
+        It must be called before any threading runtime is loaded.
+        """
+        if isolation:
+            isolation.apply()
+
+        if cpu_set:
+            logging.info(f"Pinning process to cpus {sorted(cpu_set)}")
+            os.sched_setaffinity(0, cpu_set)
+            # Threading runtimes size their pools on the first use, so make
+            # them respect the affinity unless user configured them already.
+            for env_var in ["NUMBA_NUM_THREADS", "OMP_NUM_THREADS"]:
+                os.environ.setdefault(env_var, str(len(cpu_set)))
+
+        if threads:
+            logging.info(f"Limiting threading runtimes to {threads} threads")
+            os.environ.update(thread_count_env(threads))
+
     @staticmethod
     def runner(c: mpc.Connection) -> None:
         """Static method that is the root for new process."""
@@ -175,6 +430,12 @@ class BenchmarkRunner:
 
         framework_config: cfg.Framework = c.recv()
         cfg.GLOBAL.dtypes = c.recv()
+        cpu_set: set[int] = c.recv()
+        threads: int = c.recv()
+        isolation: IsolationProfile = c.recv()
+
+        BenchmarkRunner._set_up_process(cpu_set, threads, isolation)
+
         logging.info(f"Setting up the framework {framework_config.simple_name}")
 
         framework = build_framework(framework_config)
@@ -212,11 +473,22 @@ class BenchmarkRunner:
             logging.info(
                 f"Running benchmark {rc.benchmark.short_name} for {rc.implementation}, {rc.preset}"
             )
+            input_data, segments = (
+                attach_data(rc.shared_input_data)
+                if rc.shared_input_data
+                else (None, [])
+            )
+
             benchmark_results, _ = BenchmarkRunner.run_benchmark(
                 rc,
                 framework,
+                input_data,
             )
 
+            # Drop references to the shared arrays before closing segments.
+            del input_data
+            close_segments(segments)
+
             benchmark_results.print(framework.fname, framework.version())
 
             c.send(benchmark_results)
@@ -228,24 +500,33 @@ class BenchmarkRunner:
     def run_benchmark(
         rc: BaseRunConfig,
         framework: Framework,
+        input_data: dict = None,
     ) -> tuple[BenchmarkResults, dict]:
         """Static method to run benchmark.
 
         framework: framework that should be used during execution.
+        input_data: already generated input data. If not provided, input data
+            is generated by the benchmark initialization function.
         """
         logging.info(
             f"Running {rc.benchmark.module_name} on {framework.fname} ({type(framework)})"
         )
-        bench = Benchmark(rc.benchmark)
-        bench.initialize_input_data(rc.preset, rc.precision)
-
-        results = BenchmarkResults(rc.repeat, rc.implementation, rc.preset)
+        bench = _create_benchmark(rc, input_data)
+        results = BenchmarkResults(
+            rc.repeat, rc.implementation, rc.preset, threads=rc.threads
+        )
 
         if not framework:
             results.error_state = ErrorCodes.NO_FRAMEWORK
             results.error_msg = "No framework"
             return (results, {})
 
+        ref_output = None
+
+        def _reference():
+            nonlocal ref_output
+            ref_output = _exec_reference(bench, rc)
+
         output = _exec(
             bench,
             framework,
@@ -255,45 +536,35 @@ class BenchmarkRunner:
             results,
             # copy output if we want to validate results
             rc.validate,
+            rc.jit_cache_dir,
+            rc.convergence,
+            rc.perf_counters,
+            rc.memory_tracking,
+            rc.profile,
+            rc.profile_path,
+            rc.device_timing,
+            # Reference runs on host while inputs are copied to the device.
+            _reference if rc.validate else None,
         )
 
         if results.error_state != ErrorCodes.SUCCESS:
             return (results, {})
 
-        if rc.validate and results.error_state == ErrorCodes.SUCCESS:
-            ref_framework = build_framework(rc.ref_framework)
-            # TODO: don't run it for every framework, but run it only once.
-            ref_output = _exec_simple(
-                bench,
-                ref_framework,
-                rc.benchmark.reference_implementation_postfix,
-                rc.preset,
-            )
-
-            if ref_output:
-                try:
-                    results.validation_state = ValidationStatusCodes.SUCCESS
-                    validate = bench.get_validation_func()
-                    validated = validate(ref_output, output)
-                except Exception as e:
-                    logging.error(f"Exception during validation {e.args}")
-                    validated = False
-
-            if not ref_output or not validated:
-                results.validation_state = ValidationStatusCodes.FAILURE
-                results.error_state = ErrorCodes.FAILED_VALIDATION
-                results.error_msg = "Validation failed"
+        if rc.validate:
+            _validate_output(bench, rc, ref_output, output, results)
 
         return (results, output)
 
     def run_benchmark_in_sub_process(
         self,
         rc: RunConfig,
+        worker: int = 0,
     ) -> BenchmarkResults:
         """Runs benchmark in sub process.
 
         Args:
             rc: running configuration.
+            worker: index of the worker which process should run benchmark.
 
         The method blocks workflow and waits for the result, but executes it in
         separate process.
@@ -322,9 +593,19 @@ class BenchmarkRunner:
 
             return results
 
-        _, conn = self.get_process(rc.framework)
+        _, conn = self.get_process(rc.framework, worker, rc.threads)
 
         brc = BaseRunConfig.from_instance(rc)
+        timeout = rc.timeout if rc.timeout else self._default_timeout
+
+        if brc.convergence:
+            brc.convergence = brc.convergence.fit_timeout(timeout)
+
+        if self._isolation and self._isolation.drop_page_cache:
+            drop_page_cache()
+
+        if rc.shared_inputs:
+            brc.shared_input_data = self._get_shared_input_data(rc)
 
         if rc.validate:
             brc.ref_framework: cfg.Framework = [
@@ -336,7 +617,7 @@ class BenchmarkRunner:
 
         conn.send(brc)
 
-        if conn.poll(rc.timeout if rc.timeout else self._default_timeout):
+        if conn.poll(timeout):
             try:
                 results: BenchmarkResults = conn.recv()
             except EOFError:
@@ -345,14 +626,14 @@ class BenchmarkRunner:
                 results.error_msg = "Core dump"
 
                 results.print()
-                self.kill_process(rc.framework)
+                self.kill_process(rc.framework, worker, rc.threads)
         else:
             results = BenchmarkResults(0, rc.implementation, rc.preset)
             results.error_state = ErrorCodes.EXECUTION_TIMEOUT
             results.error_msg = "Execution timed out"
 
             results.print()
-            self.kill_process(rc.framework)
+            self.kill_process(rc.framework, worker, rc.threads)
 
         return results
 
@@ -367,48 +648,176 @@ class BenchmarkRunner:
         Args:
             rc: runtime configuration.
         """
-        results = self.run_benchmark_in_sub_process(rc)
+        try:
+            results = self.run_benchmark_in_sub_process(rc)
+        finally:
+            self._release_shared_input_data(rc)
+
+        self.save_results(rc, results)
+
+    def run_benchmarks_and_save(
+        self,
+        rcs: list[RunConfig],
+        jobs: int = 1,
+    ):
+        """Runs several benchmarks concurrently and saves results into database.
+
+        Each run is dispatched to the first available worker. Worker runs
+        benchmark in its own framework process, so at most jobs framework
+        processes are executing benchmarks at the same time. Results are saved
+        from the calling thread as soon as they are ready and buffered results
+        are flushed once all runs are finished.
+
+        Args:
+            rcs: list of runtime configurations.
+            jobs: number of workers.
+        """
+        try:
+            self._run_benchmarks_and_save(rcs, jobs)
+        finally:
+            if self._result_writer:
+                self._result_writer.flush()
+
+    def _run_benchmarks_and_save(
+        self,
+        rcs: list[RunConfig],
+        jobs: int,
+    ):
+        self._add_shared_input_data_usages(rcs)
+
+        if jobs <= 1:
+            for rc in rcs:
+                self.run_benchmark_and_save(rc)
+            return
+
+        workers = queue.SimpleQueue()
+        for worker in range(jobs):
+            workers.put(worker)
 
+        def _run(rc: RunConfig) -> BenchmarkResults:
+            worker = workers.get()
+            try:
+                return self.run_benchmark_in_sub_process(rc, worker)
+            finally:
+                workers.put(worker)
+                self._release_shared_input_data(rc)
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(_run, rc): rc for rc in rcs}
+
+            for future in as_completed(futures):
+                self.save_results(futures[future], future.result())
+
+    def save_results(self, rc: RunConfig, results: BenchmarkResults):
+        """Saves benchmark results into database.
+
+        Saves result if connection to database was provided.
+
+        Args:
+            rc: runtime configuration that was used to get results.
+            results: results of the run.
+        """
         if rc.conn:
             framework = build_framework(rc.framework)
-
-            store_results(
-                rc.conn,
-                results.Result(
-                    run_id=rc.run_id,
-                    benchmark_name=rc.benchmark.module_name,
-                    framework_version=framework.fname
-                    + " "
-                    + framework.version()
-                    if framework
-                    and results.error_state != ErrorCodes.UNIMPLEMENTED
-                    else "n/a",
-                ),
+            results.threads = rc.threads
+
+            result = results.Result(
+                run_id=rc.run_id,
+                benchmark_name=rc.benchmark.module_name,
+                framework_version=framework.fname + " " + framework.version()
+                if framework and results.error_state != ErrorCodes.UNIMPLEMENTED
+                else "n/a",
+                platform=framework.device_info
+                if framework and framework.device_info
+                else "n/a",
             )
 
+            if self._result_writer:
+                self._result_writer.add(result)
+            else:
+                store_results(rc.conn, result)
+
 
 def _set_input_args(
-    bench: Benchmark, framework: Framework, np_input_data: dict
+    bench: Benchmark,
+    framework: Framework,
+    np_input_data: dict,
+    asynchronous: bool = False,
 ):
+    """Copies input arguments to the framework.
+
+    If asynchronous is set, copies may still be in flight on return and
+    framework.wait_copies must be called before inputs are used.
+    """
     inputs = dict()
+    copy_to = (
+        framework.copy_to_async_func()
+        if asynchronous
+        else framework.copy_to_func()
+    )
 
     for arg in bench.info.input_args:
         if arg in bench.info.array_args:
-            inputs[arg] = framework.copy_to_func()(np_input_data[arg])
+            inputs[arg] = copy_to(np_input_data[arg])
         else:
             inputs[arg] = np_input_data[arg]
 
     return inputs
 
 
-def _reset_output_args(
+def _snapshot_output_args(
     bench: Benchmark, framework: Framework, inputs: dict, np_input_data: dict
+) -> dict:
+    """Keeps pristine copies of output arguments in framework memory.
+
+    Copies are used to restore output arguments between repetitions without
+    copying from host. Returns empty dict if framework can not copy arrays in
+    place or there is not enough memory for the copies.
+    """
+    if framework.copy_in_place_func() is None:
+        return {}
+
+    copy_to = framework.copy_to_func()
+    pristine = dict()
+    try:
+        for arg in bench.info.output_args:
+            if inputs.get(arg, None) is None:
+                continue
+            if arg in bench.info.array_args:
+                pristine[arg] = copy_to(np_input_data[arg])
+    except Exception:
+        logging.warning(
+            "Failed to keep copies of output arguments, they are copied"
+            + " from host between repetitions",
+            exc_info=True,
+        )
+        return {}
+
+    return pristine
+
+
+def _reset_output_args(
+    bench: Benchmark,
+    framework: Framework,
+    inputs: dict,
+    np_input_data: dict,
+    pristine: dict = None,
 ):
+    """Restores output arguments overwritten by the implementation.
+
+    Arguments with pristine copy are copied in place from it, the rest are
+    copied from host into new arrays.
+    """
+    copy_in_place = framework.copy_in_place_func() if pristine else None
+
     for arg in bench.info.output_args:
         overwritten_data = inputs.get(arg, None)
         if overwritten_data is None or arg not in bench.info.array_args:
             continue
-        inputs[arg] = framework.copy_to_func()(np_input_data[arg])
+        if copy_in_place is not None and arg in pristine:
+            copy_in_place(overwritten_data, pristine[arg])
+        else:
+            inputs[arg] = framework.copy_to_func()(np_input_data[arg])
 
 
 def _array_size(array: Any) -> int:
@@ -437,6 +846,96 @@ def _exec_simple(
         return None
 
 
+def _create_benchmark(
+    rc: BaseRunConfig, input_data: Union[dict, None]
+) -> Benchmark:
+    """Creates benchmark with input data of the preset.
+
+    Input data is generated by the benchmark initialization function if it
+    is not provided.
+    """
+    input_cache = None
+    if rc.input_cache_dir:
+        input_cache = InputCache(
+            rc.input_cache_dir, max_size=rc.input_cache_size
+        )
+
+    bench = Benchmark(rc.benchmark, input_cache=input_cache)
+    if input_data is not None:
+        bench.set_input_data(rc.preset, input_data)
+    else:
+        bench.initialize_input_data(rc.preset, rc.precision)
+
+    return bench
+
+
+def _validate_output(
+    bench: Benchmark,
+    rc: BaseRunConfig,
+    ref_output: Union[dict, None],
+    output: dict,
+    results: BenchmarkResults,
+) -> None:
+    """Validates output against reference output and updates results."""
+    validated = False
+    if ref_output:
+        try:
+            results.validation_state = ValidationStatusCodes.SUCCESS
+            validate = bench.get_validation_func(rc.precision)
+            validated = validate(ref_output, output)
+        except Exception as e:
+            logging.error(f"Exception during validation {e.args}")
+
+    if not validated:
+        results.validation_state = ValidationStatusCodes.FAILURE
+        results.error_state = ErrorCodes.FAILED_VALIDATION
+        results.error_msg = "Validation failed"
+
+
+def _exec_reference(bench: Benchmark, rc: BaseRunConfig) -> Union[dict, None]:
+    """Executes reference implementation to get expected output.
+
+    If reference cache is enabled, output is taken from the cache when
+    available and stored into the cache otherwise, so the reference
+    implementation runs only once for all implementations under test.
+    """
+    ref_postfix = rc.benchmark.reference_implementation_postfix
+
+    cache = None
+    if rc.reference_cache_dir:
+        ref_impl = next(
+            impl
+            for impl in bench.info.implementations
+            if impl.postfix == ref_postfix
+        )
+        input_data = bench.get_input_data(preset=rc.preset)
+
+        cache = ReferenceCache(
+            rc.reference_cache_dir, max_size=rc.reference_cache_size
+        )
+        key = cache.make_reference_key(
+            benchmark=bench.bname,
+            preset=rc.preset,
+            precision=rc.precision,
+            reference_postfix=ref_postfix,
+            reference_package_path=ref_impl.package_path,
+            input_data={arg: input_data[arg] for arg in bench.info.input_args},
+        )
+
+        ref_output = cache.get(key)
+        if ref_output is not None:
+            logging.info(f"Using cached reference output for {bench.bname}")
+            return ref_output
+
+    ref_framework = build_framework(rc.ref_framework)
+    ref_output = _exec_simple(bench, ref_framework, ref_postfix, rc.preset)
+
+    if cache and ref_output:
+        cache.put(key, ref_output)
+
+    return ref_output
+
+
 def _exec(
     bench: Benchmark,
     framework: Framework,
@@ -445,6 +944,14 @@ def _exec(
     repeat: int,
     results: BenchmarkResults,
     copy_output: bool,
+    jit_cache_dir: str = None,
+    convergence: ConvergenceCriteria = None,
+    perf_counters: bool = False,
+    memory_tracking: bool = False,
+    profile: str = None,
+    profile_path: str = None,
+    device_timing: bool = False,
+    overlap: Callable[[], Any] = None,
 ) -> Union[dict, None]:
     """Executes a benchmark for a given implementation.
 
@@ -469,46 +976,358 @@ def _exec(
         args : Input arguments to benchmark implementation function.
         results : A benchmark results where timing and other results are stored.
         copy_output : A flag that controls copying output.
+        jit_cache_dir : Directory for the persistent JIT cache. None means JIT
+            cache is not used.
+        convergence : Stop criteria of the adaptive repetition. If set, repeat
+            is ignored and benchmark is repeated until timings converge or
+            time budget runs out.
+        perf_counters : A flag that controls collection of hardware
+            performance counters for each repetition.
+        memory_tracking : A flag that controls tracking of peak host memory.
+            Memory is tracked in separate repetitions that are not timed,
+            because tracing allocations slows down execution.
+        profile : Name of the profiler to run untimed repetitions with after
+            the timed ones. None means no profiling.
+        profile_path : Path to write profile artefact to.
+        device_timing : A flag that controls measurement of device execution
+            time for each repetition. Ignored by frameworks without device
+            timing support.
+        overlap : Host work to run while inputs are copied to the device,
+            e.g. reference implementation. It is not included in setup time.
     """
     np_input_data = bench.get_input_data(preset=preset)
 
+    # Must be enabled before inputs are allocated on the device.
+    if device_timing and not framework.enable_device_timing():
+        logging.warning(f"{framework.fname} does not support device timing")
+        device_timing = False
+
     with timer() as t:
-        inputs = _set_input_args(bench, framework, np_input_data)
+        inputs = _set_input_args(
+            bench, framework, np_input_data, asynchronous=True
+        )
     results.setup_time = t.get_elapsed_time()
 
+    if overlap:
+        overlap()
+
+    with timer() as t:
+        framework.wait_copies()
+    results.setup_time += t.get_elapsed_time()
+
     results.input_size = 0
     for arg in bench.info.array_args:
         results.input_size += _array_size(bench.bdata[preset][arg])
 
+    results.flops, results.traffic_bytes = estimate_work(
+        bench.info, preset, bench.bdata[preset]
+    )
+
     impl_fn = bench.get_implementation(impl_postfix)
 
-    # Warmup
-    with timer() as t:
+    if jit_cache_dir:
+        framework.enable_jit_cache(impl_fn, jit_cache_dir)
+
+    # Counters must be opened before warmup, so they are inherited by the
+    # threads framework creates on the first execution.
+    counters = None
+    if perf_counters:
+        try:
+            counters = PerfCounters()
+        except OSError as e:
+            logging.warning(f"Hardware performance counters unavailable: {e}")
+
+    profiler = None
+    if profile:
+        os.makedirs(os.path.dirname(profile_path), exist_ok=True)
+        profiler = get_profiler_class(profile)(profile_path)
+
+    try:
+        return _exec_repeat(
+            bench,
+            framework,
+            impl_fn,
+            inputs,
+            np_input_data,
+            repeat,
+            results,
+            copy_output,
+            convergence,
+            counters,
+            memory_tracking,
+            profiler,
+            device_timing,
+        )
+    finally:
+        if counters:
+            counters.close()
+
+
+def _exec_memory_tracked(
+    bench: Benchmark,
+    framework: Framework,
+    impl_fn,
+    inputs: dict,
+    np_input_data: dict,
+    pristine: dict,
+) -> dict[str, list]:
+    """Executes untimed repetitions with host memory tracking.
+
+    Allocations are traced only during these repetitions, so the slowdown
+    of tracing does not affect execution times. Output arguments are reset
+    after every repetition.
+
+    Returns: memory peaks per repetition keyed by the name.
+    """
+    memory = MemoryTracker()
+    memory_values = []
+
+    try:
+        for _ in range(MEMORY_TRACKING_REPEAT):
+            memory.start()
+            framework.execute(impl_fn, inputs)
+            framework.synchronize()
+            memory_values.append(memory.stop())
+
+            _reset_output_args(
+                bench, framework, inputs, np_input_data, pristine
+            )
+    finally:
+        memory.close()
+
+    return {
+        name: [values[name] for values in memory_values]
+        for name in memory_values[0]
+    }
+
+
+@dataclass
+class _RepeatTimings:
+    """Measurements of the timed repetitions, one value per repetition."""
+
+    exec_times: list[int] = field(default_factory=list)
+    dispatch_times: list[int] = field(default_factory=list)
+    device_times: list[int] = field(default_factory=list)
+    counter_values: list[dict] = field(default_factory=list)
+
+
+def _exec_warmup(
+    bench: Benchmark,
+    framework: Framework,
+    impl_fn,
+    inputs: dict,
+    np_input_data: dict,
+    pristine: dict,
+    results: BenchmarkResults,
+) -> bool:
+    """Executes the first repetition that also compiles the implementation.
+
+    Returns: False if execution failed.
+    """
+    with timer() as t, framework.compile_timer() as compile_stats:
         try:
             framework.execute(impl_fn, inputs)
+            framework.synchronize()
         except Exception:
             logging.exception("Benchmark execution failed at the warmup step.")
             results.error_state = ErrorCodes.FAILED_EXECUTION
             results.error_msg = "Execution failed"
-            return
+            return False
 
     results.warmup_time = t.get_elapsed_time()
+    results.compile_time = compile_stats.compile_time
+
+    _reset_output_args(bench, framework, inputs, np_input_data, pristine)
 
-    _reset_output_args(bench, framework, inputs, np_input_data)
+    return True
 
-    exec_times = [0] * repeat
 
+def _exec_timed(
+    bench: Benchmark,
+    framework: Framework,
+    impl_fn,
+    inputs: dict,
+    np_input_data: dict,
+    pristine: dict,
+    repeat: int,
+    convergence: ConvergenceCriteria,
+    counters: PerfCounters,
+    device_timing: bool,
+) -> tuple[_RepeatTimings, Any]:
+    """Executes timed repetitions until repeat count or convergence.
+
+    Returns: (timings, value returned by the last repetition).
+    """
+    timings = _RepeatTimings()
     retval = None
-    for i in range(repeat):
-        with timer() as t:
+    start_time = time.perf_counter()
+    # Convergence check sorts all samples, so it is done on geometrically
+    # growing number of samples to keep the overhead linear.
+    next_check = convergence.min_repeat if convergence else 0
+
+    while True:
+        # Execution time covers completion of the device work, dispatch
+        # time only returning from the implementation.
+        with framework.device_timer() as device_stats, timer(
+            counters=counters
+        ) as t:
             retval = framework.execute(impl_fn, inputs)
-        exec_times[i] = t.get_elapsed_time()
+            timings.dispatch_times.append(t.get_split_time())
+            framework.synchronize()
+        timings.exec_times.append(t.get_elapsed_time())
+        if device_timing:
+            timings.device_times.append(device_stats.device_time)
+        timings.counter_values.append(t.get_counter_values())
+
+        n = len(timings.exec_times)
+        if convergence is None:
+            done = n >= repeat
+        else:
+            done = convergence.exhausted(n, time.perf_counter() - start_time)
+            if not done and n >= next_check:
+                done = convergence.converged(timings.exec_times)
+                next_check = max(n + 1, int(n * 1.1))
 
         # Do not reset the output from the last repeat
-        if i < repeat - 1:
-            _reset_output_args(bench, framework, inputs, np_input_data)
+        if done:
+            break
+
+        _reset_output_args(bench, framework, inputs, np_input_data, pristine)
+
+    return timings, retval
+
+
+def _exec_profiled(
+    bench: Benchmark,
+    framework: Framework,
+    impl_fn,
+    inputs: dict,
+    np_input_data: dict,
+    pristine: dict,
+    profiler: Profiler,
+    repeat: int,
+    results: BenchmarkResults,
+    retval,
+) -> Any:
+    """Executes untimed repetitions under profiler.
+
+    Profiling slows down execution, so it is done after the timed
+    repetitions and does not affect stored timings. Output of the last
+    profiled repetition replaces output of the timed ones.
+
+    Returns: value returned by the last repetition, retval if profiler
+        failed to start.
+    """
+    try:
+        profiler.start()
+    except Exception:
+        logging.exception("Failed to start profiler")
+        return retval
+
+    try:
+        for _ in range(repeat):
+            _reset_output_args(
+                bench, framework, inputs, np_input_data, pristine
+            )
+            retval = framework.execute(impl_fn, inputs)
+            framework.synchronize()
+    finally:
+        profiler.stop()
+
+    results.profile_path = profiler.path
+
+    return retval
+
+
+def _collect_results(
+    results: BenchmarkResults,
+    timings: _RepeatTimings,
+    convergence: ConvergenceCriteria,
+    counters: PerfCounters,
+) -> None:
+    """Stores measurements of the timed repetitions into results."""
+    exec_times = timings.exec_times
+
+    if convergence:
+        results.converged = convergence.converged(exec_times)
+        if not results.converged:
+            logging.warning(
+                "Timings did not converge within time budget after"
+                + f" {len(exec_times)} repetitions"
+            )
 
     results.exec_times = exec_times
+    results.dispatch_times = timings.dispatch_times
+    results.device_times = timings.device_times
+    results.repeats = len(exec_times)
+
+    if counters:
+        results.counters = {
+            name: [values[name] for values in timings.counter_values]
+            for name in counters.names
+        }
+        if "llc_misses" in results.counters:
+            results.counters["memory_bandwidth"] = estimate_memory_bandwidth(
+                results.counters["llc_misses"], exec_times
+            ).tolist()
+
+
+def _exec_repeat(
+    bench: Benchmark,
+    framework: Framework,
+    impl_fn,
+    inputs: dict,
+    np_input_data: dict,
+    repeat: int,
+    results: BenchmarkResults,
+    copy_output: bool,
+    convergence: ConvergenceCriteria,
+    counters: PerfCounters,
+    memory_tracking: bool,
+    profiler: Profiler,
+    device_timing: bool = False,
+) -> Union[dict, None]:
+    """Executes warmup and timed repetitions of the implementation."""
+    pristine = _snapshot_output_args(bench, framework, inputs, np_input_data)
+
+    if not _exec_warmup(
+        bench, framework, impl_fn, inputs, np_input_data, pristine, results
+    ):
+        return
+
+    if memory_tracking:
+        results.memory = _exec_memory_tracked(
+            bench, framework, impl_fn, inputs, np_input_data, pristine
+        )
+
+    timings, retval = _exec_timed(
+        bench,
+        framework,
+        impl_fn,
+        inputs,
+        np_input_data,
+        pristine,
+        repeat,
+        convergence,
+        counters,
+        device_timing,
+    )
+
+    _collect_results(results, timings, convergence, counters)
+
+    if profiler:
+        retval = _exec_profiled(
+            bench,
+            framework,
+            impl_fn,
+            inputs,
+            np_input_data,
+            pristine,
+            profiler,
+            results.repeats,
+            results,
+            retval,
+        )
 
     # Get the output data
     results.teardown_time = 0.0
@@ -530,9 +1349,11 @@ def _exec_copy_output(
 ) -> dict:
     output_arrays = dict()
     with timer() as t:
+        copy_from = fmwrk.copy_from_async_func()
         for out_arg in bench.info.output_args:
             if out_arg in bench.info.array_args:
-                output_arrays[out_arg] = fmwrk.copy_from_func()(inputs[out_arg])
+                output_arrays[out_arg] = copy_from(inputs[out_arg])
+        fmwrk.wait_copies()
 
     # Special case: if the benchmark implementation returns anything, then
     # add that to the results dict
@@ -5,11 +5,267 @@
 """Validation tools for comparing arrays."""
 
 import logging
+import math
+from dataclasses import dataclass, field
 from numbers import Number
-from typing import Union
+from typing import Iterator, Union
 
 import numpy as np
 
+# Number of elements compared at once. Scratch buffers of this size are
+# allocated once per pair of arrays, so memory used by validation does not
+# grow with the size of the output.
+CHUNK_SIZE = 1 << 20
+# Number of the first mismatching indices to report.
+MAX_REPORTED_MISMATCHES = 5
+# Tolerances of np.allclose.
+RTOL = 1e-05
+ATOL = 1e-08
+
+
+@dataclass
+class ArrayDiff:
+    """Error statistics of actual array compared to the expected one.
+
+    Attributes:
+        size: number of compared elements.
+        mismatches: number of elements that are not close in the np.allclose
+            sense.
+        max_abs_error: maximum absolute error.
+        max_rel_error: maximum element-wise relative error over nonzero
+            expected elements.
+        max_ulp_error: maximum error in units in the last place of expected
+            elements, None if expected values are not real floating point.
+        norm_rel_error: norm of the error relative to norm of the expected
+            array.
+        first_mismatches: indices of the first mismatching elements.
+    """
+
+    size: int = 0
+    mismatches: int = 0
+    max_abs_error: float = 0.0
+    max_rel_error: float = 0.0
+    max_ulp_error: Union[float, None] = None
+    norm_rel_error: float = 0.0
+    first_mismatches: list[tuple[int, ...]] = field(default_factory=list)
+
+    def describe(self) -> str:
+        """Returns summary of the errors for logging."""
+        summary = (
+            f"{self.mismatches}/{self.size} elements mismatch,"
+            + f" max abs error {self.max_abs_error:.6g},"
+            + f" max rel error {self.max_rel_error:.6g},"
+        )
+        if self.max_ulp_error is not None:
+            summary += f" max ulp error {self.max_ulp_error:.6g},"
+        summary += f" norm rel error {self.norm_rel_error:.6g}"
+        if self.first_mismatches:
+            summary += f", first mismatches at {self.first_mismatches}"
+
+        return summary
+
+
+def _iter_blocks(
+    expected: np.ndarray,
+    actual: np.ndarray,
+    chunk_size: int,
+    offset: int = 0,
+) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+    """Splits arrays of the same shape into flat blocks.
+
+    Each block has at most chunk_size elements. Blocks are views of whole
+    rows where possible, so at most chunk_size elements are copied to flatten
+    non-contiguous blocks.
+
+    Yields: (flat index of the first element, expected block, actual block).
+    """
+    if expected.ndim <= 1:
+        expected = expected.reshape(-1)
+        actual = actual.reshape(-1)
+        for start in range(0, expected.size, chunk_size):
+            stop = start + chunk_size
+            yield offset + start, expected[start:stop], actual[start:stop]
+        return
+
+    row = math.prod(expected.shape[1:])
+    if row > chunk_size:
+        for i in range(expected.shape[0]):
+            yield from _iter_blocks(
+                expected[i], actual[i], chunk_size, offset + i * row
+            )
+        return
+
+    rows = chunk_size // row
+    for start in range(0, expected.shape[0], rows):
+        stop = start + rows
+        yield (
+            offset + start * row,
+            expected[start:stop].reshape(-1),
+            actual[start:stop].reshape(-1),
+        )
+
+
+def _max(value: float, block: np.ndarray) -> float:
+    """Returns maximum of value and block, NaN if any of them is NaN."""
+    return float(np.maximum(value, np.max(block)))
+
+
+def _unravel(flat: np.ndarray, shape: tuple[int, ...]) -> list[tuple]:
+    """Converts flat indices into indices of array of the shape."""
+    if not shape:
+        return [()] * len(flat)
+
+    return [
+        tuple(int(i) for i in index)
+        for index in zip(*np.unravel_index(flat, shape))
+    ]
+
+
+def compare_arrays(
+    expected: Union[Number, np.ndarray],
+    actual: Union[Number, np.ndarray],
+    rtol: float = RTOL,
+    atol: float = ATOL,
+    ulp: float = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> ArrayDiff:
+    """Compares arrays in a single pass over fixed size blocks.
+
+    Errors are accumulated block by block into preallocated scratch buffers,
+    so no temporaries of the full array size are created.
+
+    Args:
+        expected: reference values.
+        actual: values to check.
+        rtol: relative tolerance of element-wise comparison.
+        atol: absolute tolerance of element-wise comparison.
+        ulp: if set, floating point elements within ulp units in the last
+            place of expected value are also close.
+        chunk_size: number of elements compared at once.
+
+    Returns: error statistics.
+    """
+    expected = np.asarray(expected)
+    actual = np.asarray(actual)
+
+    if expected.shape != actual.shape:
+        shape = np.broadcast_shapes(expected.shape, actual.shape)
+        expected = np.broadcast_to(expected, shape)
+        actual = np.broadcast_to(actual, shape)
+
+    diff = ArrayDiff(size=expected.size)
+    if expected.size == 0:
+        return diff
+
+    if expected.dtype.kind not in "biufc" or actual.dtype.kind not in "biufc":
+        _compare_exact(expected, actual, diff)
+    else:
+        _compare_numeric(expected, actual, diff, rtol, atol, ulp, chunk_size)
+
+    return diff
+
+
+def _compare_exact(expected: np.ndarray, actual: np.ndarray, diff: ArrayDiff):
+    """Compares non-numeric arrays, any difference mismatches all elements."""
+    if not np.array_equal(expected, actual):
+        diff.mismatches = diff.size
+        diff.max_abs_error = diff.max_rel_error = math.inf
+        diff.norm_rel_error = math.inf
+
+
+def _record_mismatches(
+    diff: ArrayDiff, mask: np.ndarray, start: int, shape: tuple[int, ...]
+):
+    """Counts mismatches of the block and records the first indices."""
+    mismatches = int(np.count_nonzero(mask))
+    if not mismatches:
+        return
+
+    missing = MAX_REPORTED_MISMATCHES - len(diff.first_mismatches)
+    if missing > 0:
+        flat = np.flatnonzero(mask)[:missing] + start
+        diff.first_mismatches += _unravel(flat, shape)
+    diff.mismatches += mismatches
+
+
+def _compare_numeric(
+    expected: np.ndarray,
+    actual: np.ndarray,
+    diff: ArrayDiff,
+    rtol: float,
+    atol: float,
+    ulp: Union[float, None],
+    chunk_size: int,
+):
+    """Accumulates error statistics of numeric arrays block by block."""
+    float_ref = expected.dtype.kind == "f"
+    if float_ref:
+        diff.max_ulp_error = 0.0
+
+    n = min(chunk_size, expected.size)
+    err = np.empty(n, dtype=np.result_type(expected, actual, np.float64))
+    abs_err = np.empty(n, dtype=np.float64)
+    scratch = np.empty(n, dtype=np.float64)
+    ratio = np.empty(n, dtype=np.float64)
+    mask = np.empty(n, dtype=np.bool_)
+
+    sum_sq_err = sum_sq_ref = sum_sq_val = 0.0
+    # inf - inf and division by tiny ulps are expected, errors are reported
+    # as NaN and inf.
+    with np.errstate(invalid="ignore", over="ignore"):
+        for start, e, a in _iter_blocks(expected, actual, n):
+            size = e.size
+            d, ad, s, r, m = (
+                buf[:size] for buf in (err, abs_err, scratch, ratio, mask)
+            )
+
+            np.subtract(e, a, out=d, dtype=d.dtype)
+            np.absolute(d, out=ad)
+            # Equal values, including infinities, have no error.
+            np.equal(e, a, out=m)
+            np.copyto(ad, 0, where=m)
+            sum_sq_err += float(np.dot(ad, ad))
+            diff.max_abs_error = _max(diff.max_abs_error, ad)
+
+            # Closeness of np.allclose: |e - a| <= atol + rtol * |a|. NaN
+            # errors are never close.
+            np.absolute(a, out=s)
+            sum_sq_val += float(np.dot(s, s))
+            np.multiply(s, rtol, out=s)
+            np.add(s, atol, out=s)
+            if ulp and float_ref:
+                np.spacing(e, out=r)
+                np.absolute(r, out=r)
+                np.multiply(r, ulp, out=r)
+                np.maximum(s, r, out=s)
+            # Infinities are only close to themselves.
+            for block in (e, a):
+                np.isfinite(block, out=m)
+                np.logical_not(m, out=m)
+                np.copyto(s, 0, where=m)
+            np.less_equal(ad, s, out=m)
+            np.logical_not(m, out=m)
+            _record_mismatches(diff, m, start, expected.shape)
+
+            np.absolute(e, out=s)
+            sum_sq_ref += float(np.dot(s, s))
+
+            np.greater(s, 0, out=m)
+            r.fill(0)
+            np.divide(ad, s, out=r, where=m)
+            diff.max_rel_error = _max(diff.max_rel_error, r)
+
+            if float_ref:
+                np.spacing(e, out=s)
+                np.absolute(s, out=s)
+                np.greater(ad, 0, out=m)
+                r.fill(0)
+                np.divide(ad, s, out=r, where=m)
+                diff.max_ulp_error = _max(diff.max_ulp_error, r)
+
+    norm_ref = math.sqrt(sum_sq_ref) or math.sqrt(sum_sq_val)
+    diff.norm_rel_error = math.sqrt(sum_sq_err) / norm_ref if norm_ref else 0.0
+
 
 def validate(
     expected: dict[str, any],
@@ -27,16 +283,12 @@ def validate(
     """
     valid = True
     for key in expected.keys():
-        valid = valid and validate_two_lists_of_array(
+        if not validate_two_lists_of_array(
             expected[key], actual[key], rel_error=rel_error
-        )
-        if not valid:
-            logging.error(
-                (
-                    "Output did not match for {0}. "
-                    + "Expected: {1} Actual: {2}"
-                ).format(key, expected[key], actual[key])
-            )
+        ):
+            logging.error(f"Output did not match for {key}")
+            valid = False
+            break
 
     return valid
 
@@ -50,7 +302,8 @@ def validate_two_lists_of_array(
 
     Compares two arrays or two lists of arrays and validates if
     the arrays in each list have data that are either the same or close
-    enough.
+    enough, that is either all elements are close in the np.allclose sense
+    or relative error of the whole array is below rel_error.
 
     Args:
         expected: list of arrays with the reference results of a specific
@@ -66,16 +319,12 @@ def validate_two_lists_of_array(
     if not isinstance(actual, (tuple, list)):
         actual = [actual]
     valid = True
-    for r, v in zip(expected, actual):
-        if not np.allclose(r, v):
-            re = relative_error(r, v)
-            if re < rel_error:
-                continue
-            valid = False
-            logging.error("Relative error: {}".format(re))
-            # return False
-    if not valid:
-        logging.error("{} did not validate!")
+    for i, (r, v) in enumerate(zip(expected, actual)):
+        diff = compare_arrays(r, v)
+        if diff.mismatches == 0 or diff.norm_rel_error < rel_error:
+            continue
+        valid = False
+        logging.error(f"Array {i} did not validate: {diff.describe()}")
     return valid
 
 
@@ -90,11 +339,4 @@ def relative_error(
 
     Returns: relative error.
     """
-    ref_norm = np.linalg.norm(ref)
-    if ref_norm == 0:
-        val_norm = np.linalg.norm(val)
-        if val_norm == 0:
-            return 0.0
-        ref_norm = val_norm
-
-    return np.linalg.norm(ref - val) / ref_norm
+    return compare_arrays(ref, val).norm_rel_error
@@ -0,0 +1,339 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""On-disk caches of benchmark data stored as NumPy .npy files."""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import tempfile
+from numbers import Number
+from typing import Any, Union
+
+import numpy as np
+
+_META_FILE = "meta.json"
+
+
+def default_cache_dir() -> str:
+    """Returns default directory for dpbench caches.
+
+    It is $DPBENCH_CACHE_DIR if set, otherwise $XDG_CACHE_HOME/dpbench or
+    ~/.cache/dpbench.
+    """
+    cache_dir = os.getenv("DPBENCH_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "dpbench")
+
+
+def hash_data(data: dict[str, Any]) -> str:
+    """Calculates digest of the data dictionary.
+
+    Arrays are hashed by dtype, shape and content, everything else by repr.
+
+    Args:
+        data: dictionary to calculate digest for.
+
+    Returns: hex digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+
+    for key, value in data.items():
+        h.update(key.encode())
+        if isinstance(value, np.ndarray):
+            h.update(f"{value.dtype.str}{value.shape}".encode())
+            h.update(memoryview(np.ascontiguousarray(value)).cast("B"))
+        else:
+            h.update(repr(value).encode())
+
+    return h.hexdigest()
+
+
+def hash_module_source(package_path: str) -> str:
+    """Calculates digest of the module source file without importing it.
+
+    Args:
+        package_path: full package path of the module.
+
+    Returns: hex digest or empty string if module source is not available.
+    """
+    try:
+        spec = importlib.util.find_spec(package_path)
+    except (ImportError, ValueError):
+        spec = None
+
+    if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+        return ""
+
+    with open(spec.origin, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+
+class NpyCache:
+    """Directory based cache of dictionaries with arrays.
+
+    Every entry is a directory with a meta file describing the structure of
+    the dictionary and a .npy file per array. Arrays are loaded as read-only
+    memory maps, so they are backed by the page cache and not copied into
+    process memory. Least recently used entries are evicted once the total
+    cache size exceeds max_size.
+    """
+
+    def __init__(self, path: str, max_size: int = 0) -> None:
+        """Creates cache in the directory.
+
+        Args:
+            path: cache directory. It is created if it does not exist.
+            max_size: maximum size of the cache in bytes. 0 means unlimited.
+        """
+        self.path = path
+        self.max_size = max_size
+
+        os.makedirs(self.path, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Builds cache key from the list of parts."""
+        return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Union[dict[str, Any], None]:
+        """Loads entry from the cache.
+
+        Args:
+            key: key of the entry.
+
+        Returns: cached dictionary or None if entry is not in the cache.
+        """
+        entry_path = os.path.join(self.path, key)
+        meta_path = os.path.join(entry_path, _META_FILE)
+
+        try:
+            with open(meta_path) as file:
+                meta = json.load(file)
+
+            data = {
+                name: self._decode(entry_path, desc)
+                for name, desc in meta.items()
+            }
+
+            # Modification time of the meta file tracks the last usage.
+            os.utime(meta_path)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return data
+
+    def put(self, key: str, data: dict[str, Any]) -> bool:
+        """Stores entry into the cache.
+
+        Args:
+            key: key of the entry.
+            data: dictionary to store.
+
+        Returns: True if entry was stored.
+        """
+        entry_path = os.path.join(self.path, key)
+        if os.path.isdir(entry_path):
+            return True
+
+        tmp_path = tempfile.mkdtemp(prefix=".tmp-", dir=self.path)
+        try:
+            files = []
+            meta = {
+                name: self._encode(tmp_path, value, files)
+                for name, value in data.items()
+            }
+
+            size = sum(
+                os.path.getsize(os.path.join(tmp_path, f)) for f in files
+            )
+            if self.max_size and size > self.max_size:
+                logging.info(
+                    f"Entry {key} of {size} bytes exceeds cache size limit"
+                )
+                return False
+
+            with open(os.path.join(tmp_path, _META_FILE), "w") as file:
+                json.dump(meta, file)
+
+            # Rename is atomic, so concurrent readers never see partially
+            # written entry. If other process stored the same entry first
+            # rename fails and we keep existing one.
+            try:
+                os.rename(tmp_path, entry_path)
+            except OSError:
+                pass
+        except TypeError as e:
+            logging.info(f"Could not cache entry {key}: {e}")
+            return False
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+        self._evict()
+
+        return True
+
+    def _encode(self, path: str, value: Any, files: list[str]) -> Any:
+        if isinstance(value, (tuple, list)):
+            return {
+                "kind": type(value).__name__,
+                "items": [self._encode(path, v, files) for v in value],
+            }
+
+        if isinstance(value, (np.ndarray, np.generic)):
+            if value.dtype.hasobject:
+                raise TypeError("object arrays are not supported")
+
+            file_name = f"{len(files)}.npy"
+            np.save(
+                os.path.join(path, file_name),
+                value,
+                allow_pickle=False,
+            )
+            files.append(file_name)
+
+            return {
+                "kind": "array" if isinstance(value, np.ndarray) else "scalar",
+                "file": file_name,
+            }
+
+        if value is None or isinstance(value, (bool, Number, str)):
+            return {"kind": "value", "value": value}
+
+        raise TypeError(f"{type(value)} is not supported")
+
+    def _decode(self, path: str, desc: dict[str, Any]) -> Any:
+        kind = desc["kind"]
+
+        if kind in {"tuple", "list"}:
+            items = [self._decode(path, d) for d in desc["items"]]
+            return tuple(items) if kind == "tuple" else items
+
+        if kind == "array":
+            return np.load(
+                os.path.join(path, desc["file"]),
+                mmap_mode="r",
+                allow_pickle=False,
+            )
+
+        if kind == "scalar":
+            return np.load(
+                os.path.join(path, desc["file"]), allow_pickle=False
+            )[()]
+
+        return desc["value"]
+
+    def _entry_size(self, entry_path: str) -> int:
+        return sum(
+            os.path.getsize(os.path.join(entry_path, f))
+            for f in os.listdir(entry_path)
+        )
+
+    def _evict(self):
+        """Removes least recently used entries to fit into size limit."""
+        if not self.max_size:
+            return
+
+        entries = []
+        for key in os.listdir(self.path):
+            entry_path = os.path.join(self.path, key)
+            try:
+                last_used = os.path.getmtime(
+                    os.path.join(entry_path, _META_FILE)
+                )
+                entries.append(
+                    (last_used, entry_path, self._entry_size(entry_path))
+                )
+            except OSError:
+                continue
+
+        total_size = sum(size for _, _, size in entries)
+
+        for _, entry_path, size in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            logging.info(f"Evicting cache entry {entry_path}")
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_size -= size
+
+
+class ReferenceCache(NpyCache):
+    """Cache of reference implementation outputs used for validation."""
+
+    def make_reference_key(
+        self,
+        benchmark: str,
+        preset: str,
+        precision: str,
+        reference_postfix: str,
+        reference_package_path: str,
+        input_data: dict[str, Any],
+    ) -> str:
+        """Builds key of the reference output.
+
+        Key includes hash of the reference implementation source, so cached
+        outputs get invalidated once reference implementation changes.
+
+        Args:
+            benchmark: benchmark module name.
+            preset: problem size preset.
+            precision: requested precision.
+            reference_postfix: postfix of the reference implementation.
+            reference_package_path: package path of the reference module.
+            input_data: inputs of the reference implementation.
+
+        Returns: cache key.
+        """
+        return self.make_key(
+            benchmark,
+            preset,
+            precision,
+            reference_postfix,
+            hash_module_source(reference_package_path),
+            hash_data(input_data),
+        )
+
+
+class InputCache(NpyCache):
+    """Cache of benchmark input data generated by initialization functions."""
+
+    def make_input_key(
+        self,
+        benchmark: str,
+        init_package_path: str,
+        init_args: dict[str, Any],
+        precision: str,
+        dtypes: dict[str, dict[str, str]],
+    ) -> str:
+        """Builds key of the generated input data.
+
+        Key includes hash of the initialization module source, so cached
+        inputs get invalidated once initialization changes.
+
+        Args:
+            benchmark: benchmark module name.
+            init_package_path: package path of the initialization module.
+            init_args: arguments of the initialization function, including
+                seed.
+            precision: precision enforced on the generated data.
+            dtypes: precision to dtype mapping.
+
+        Returns: cache key.
+        """
+        return self.make_key(
+            benchmark,
+            hash_module_source(init_package_path),
+            sorted(init_args.items()),
+            precision,
+            sorted(dtypes.items()),
+        )
@@ -2,10 +2,15 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import atexit
+import functools
 import logging
 import os
 import sqlite3
+import threading
+from typing import Optional
 
+import numpy as np
 from alembic import command
 from alembic.config import Config
 from sqlalchemy import (
@@ -13,11 +18,14 @@ from sqlalchemy import (
     Computed,
     Engine,
     ForeignKey,
+    Index,
     UniqueConstraint,
     and_,
     case,
     create_engine,
+    event,
     func,
+    select,
     text,
 )
 from sqlalchemy.orm import (
@@ -37,9 +45,31 @@ class Base(DeclarativeBase):
     pass
 
 
+class Machine(Base):
+    __tablename__ = "machines"
+
+    # Hash of the machine description, the same machine gets the same record.
+    fingerprint: Mapped[str] = mapped_column(unique=True)
+    hostname: Mapped[str]
+    cpu_model: Mapped[str]
+    architecture: Mapped[str]
+    sockets: Mapped[int]
+    cores: Mapped[int]
+    logical_cpus: Mapped[int]
+    memory_bytes: Mapped[int]
+    kernel: Mapped[str]
+    os: Mapped[str]
+
+
 class Run(Base):
     __tablename__ = "runs"
 
+    machine_id: Mapped[Optional[int]] = mapped_column(ForeignKey("machines.id"))
+
+    # Host peak measured by calibration kernels, 0 if not measured.
+    peak_gflops: Mapped[float] = mapped_column(server_default=text("0"))
+    peak_gbps: Mapped[float] = mapped_column(server_default=text("0"))
+
     # results: Mapped[list["Result"]] = relationship(back_populates="run")
 
 
@@ -98,6 +128,7 @@ class Result(Base):
     )
     setup_time: Mapped[float]
     warmup_time: Mapped[float]
+    compile_time: Mapped[float] = mapped_column(server_default=text("0"))
     repeats: Mapped[str]
     min_exec_time: Mapped[float]
     max_exec_time: Mapped[float]
@@ -106,12 +137,92 @@ class Result(Base):
     quartile75_exec_time: Mapped[float]
     teardown_time: Mapped[float]
     validated: Mapped[str]
+    flops: Mapped[float] = mapped_column(server_default=text("0"))
+    traffic_bytes: Mapped[float] = mapped_column(server_default=text("0"))
+    gflops: Mapped[float] = mapped_column(server_default=text("0"))
+    gbps: Mapped[float] = mapped_column(server_default=text("0"))
+    peak_rss: Mapped[int] = mapped_column(server_default=text("0"))
+    peak_alloc: Mapped[int] = mapped_column(server_default=text("0"))
+    # Median time until implementation returned, before waiting for the
+    # device work to complete.
+    median_dispatch_time: Mapped[float] = mapped_column(
+        server_default=text("0")
+    )
+    # Median device span of the benchmark execution from completion of
+    # earlier work to completion of the last kernel, including idle gaps
+    # between kernels. 0 if not measured.
+    median_device_time: Mapped[float] = mapped_column(server_default=text("0"))
+    profile_path: Mapped[Optional[str]]
+    # Number of threads the run was limited to, 0 if default.
+    threads: Mapped[int] = mapped_column(server_default=text("0"))
+    # Whether adaptive repetition converged, NULL for fixed repeat count.
+    converged: Mapped[Optional[bool]]
+    samples: Mapped[list["Sample"]] = relationship(back_populates="result")
 
     __table_args__ = (
-        UniqueConstraint("run_id", "benchmark", "implementation"),
+        UniqueConstraint(
+            "run_id",
+            "benchmark",
+            "implementation",
+            "problem_preset",
+            "threads",
+        ),
+        # Serves queries over many runs, e.g. trend report.
+        Index(
+            "ix_results_benchmark_implementation_problem_preset_run_id",
+            "benchmark",
+            "implementation",
+            "problem_preset",
+            "run_id",
+        ),
     )
 
 
+# Kind of the samples with execution time of every repetition. Hardware
+# performance counter and memory peak samples use their names as kinds.
+EXEC_TIME_SAMPLES = "exec_time"
+# Kind of the samples with dispatch-only time of every repetition.
+DISPATCH_TIME_SAMPLES = "dispatch_time"
+# Kind of the samples with device execution time of every repetition.
+DEVICE_TIME_SAMPLES = "device_time"
+
+
+class Sample(Base):
+    """Raw per-repetition measurements of the result.
+
+    Values are stored as little-endian float64 BLOB to keep the table compact.
+    """
+
+    __tablename__ = "samples"
+
+    result_id: Mapped[int] = mapped_column(ForeignKey("results.id"))
+    result: Mapped["Result"] = relationship(back_populates="samples")
+    kind: Mapped[str]
+    data: Mapped[bytes]
+
+    __table_args__ = (UniqueConstraint("result_id", "kind"),)
+
+    @classmethod
+    def from_array(cls, kind: str, values) -> "Sample":
+        """Creates sample record from the array-like of values."""
+        return cls(kind=kind, data=encode_samples(values))
+
+    @property
+    def values(self) -> np.ndarray:
+        """Returns samples as NumPy array."""
+        return decode_samples(self.data)
+
+
+class RunMetadata(Base):
+    __tablename__ = "run_metadata"
+
+    run_id: Mapped[int] = mapped_column(ForeignKey("runs.id"))
+    key: Mapped[str]
+    value: Mapped[str]
+
+    __table_args__ = (UniqueConstraint("run_id", "key"),)
+
+
 class Postfix(Base):
     __tablename__ = "postfixes"
 
@@ -123,15 +234,20 @@ class Postfix(Base):
     __table_args__ = (UniqueConstraint("run_id", "postfix"),)
 
 
-def create_connection(db_file) -> Engine:
+def create_connection(db_file, wal: bool = False) -> Engine:
     """create a database connection to the SQLite database
         specified by db_file
     :param db_file: database file
+    :param wal: use WAL journal. It is persisted in the database file and
+        does not work on network file systems.
     :return: Connection object or None
     """
     conn = None
     try:
         engine = create_engine(f"sqlite:///{db_file}")
+        event.listen(
+            engine, "connect", functools.partial(_set_sqlite_pragmas, wal)
+        )
 
         return engine
     except sqlite3.Error:
@@ -142,6 +258,24 @@ def create_connection(db_file) -> Engine:
     return conn
 
 
+def _set_sqlite_pragmas(wal: bool, dbapi_connection, connection_record):
+    """sets pragmas on every new sqlite connection.
+    WAL journal with NORMAL synchronous mode fsyncs only on checkpoints
+    instead of every commit. WAL requires shared memory that network file
+    systems do not provide, so it is used only if requested and rollback
+    journal is restored otherwise.
+    """
+    cursor = dbapi_connection.cursor()
+    if wal:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    else:
+        cursor.execute("PRAGMA journal_mode=DELETE")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
 def create_run(conn: Engine) -> int:
     """creates run record of the benchmarks and returns it's id
     :param conn: sqlalchemy engine
@@ -156,6 +290,101 @@ def create_run(conn: Engine) -> int:
         return run.id
 
 
+def store_machine_peak(
+    conn: Engine, run_id: int, peak_gflops: float, peak_gbps: float
+):
+    """stores measured host peak into run record.
+    :param conn: sqlalchemy engine
+    :param run_id: id of the run
+    :param peak_gflops: peak floating point performance in GFLOP/s
+    :param peak_gbps: peak memory bandwidth in GB/s
+    :return:
+    """
+    with Session(conn) as session:
+        run = session.get(Run, run_id)
+        run.peak_gflops = peak_gflops
+        run.peak_gbps = peak_gbps
+        session.commit()
+
+
+def store_run_metadata(conn: Engine, run_id: int, metadata: dict[str, str]):
+    """stores key value metadata of the run, replacing existing keys.
+    :param conn: sqlalchemy engine
+    :param run_id: id of the run
+    :param metadata: metadata values keyed by name
+    :return:
+    """
+    with Session(conn) as session:
+        existing = {
+            record.key: record
+            for record in session.scalars(
+                select(RunMetadata).where(RunMetadata.run_id == run_id)
+            )
+        }
+
+        for key, value in metadata.items():
+            if key in existing:
+                existing[key].value = str(value)
+            else:
+                session.add(
+                    RunMetadata(run_id=run_id, key=key, value=str(value))
+                )
+
+        session.commit()
+
+
+def read_run_metadata(conn: Engine, run_id: int) -> dict[str, str]:
+    """reads key value metadata of the run.
+    :param conn: sqlalchemy engine
+    :param run_id: id of the run
+    :return: metadata values keyed by name
+    """
+    with Session(conn) as session:
+        return {
+            record.key: record.value
+            for record in session.scalars(
+                select(RunMetadata).where(RunMetadata.run_id == run_id)
+            )
+        }
+
+
+def store_run_machine(conn: Engine, run_id: int, machine: Machine) -> int:
+    """links run to the machine record, creating it if it does not exist.
+    :param conn: sqlalchemy engine
+    :param run_id: id of the run
+    :param machine: machine record with fingerprint
+    :return: id of the machine
+    """
+    with Session(conn) as session:
+        machine_id = session.scalar(
+            select(Machine.id).where(Machine.fingerprint == machine.fingerprint)
+        )
+
+        if machine_id is None:
+            session.add(machine)
+            session.flush()
+            machine_id = machine.id
+
+        session.get(Run, run_id).machine_id = machine_id
+        session.commit()
+
+        return machine_id
+
+
+def read_run_machine(conn: Engine, run_id: int) -> Optional[Machine]:
+    """reads machine record the run was executed on.
+    :param conn: sqlalchemy engine
+    :param run_id: id of the run
+    :return: machine record or None if it was not recorded
+    """
+    with Session(conn, expire_on_commit=False) as session:
+        return session.scalar(
+            select(Machine)
+            .join(Run, Run.machine_id == Machine.id)
+            .where(Run.id == run_id)
+        )
+
+
 def create_results_table(db_file: str):
     """create sqlite database file and runs migrations to create all necessery tables.
     If file exists - it just updates it to the head version.
@@ -183,6 +412,163 @@ def store_results(conn: Engine, result: Result):
         session.commit()
 
 
+class ResultWriter:
+    """Buffered writer of the result records.
+
+    Keeps a single session open and commits buffered results in one
+    transaction once batch_size results are collected, on flush() or on
+    close(). Pending results are also flushed on interpreter exit, so they
+    are not lost if run gets interrupted by an exception.
+    """
+
+    def __init__(self, conn: Engine, batch_size: int = 64):
+        """Creates ResultWriter.
+
+        Args:
+            conn: sqlalchemy engine.
+            batch_size: number of results to buffer before committing them.
+        """
+        self._session = Session(conn, expire_on_commit=False)
+        self._batch_size = max(batch_size, 1)
+        self._pending: list[Result] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
+
+    def add(self, result: Result):
+        """adds result record to the buffer and flushes it if it is full.
+        :param result: result record to be inserted into db
+        :return:
+        """
+        with self._lock:
+            self._pending.append(result)
+            if len(self._pending) >= self._batch_size:
+                self._flush()
+
+    def flush(self):
+        """commits all buffered result records.
+        :return:
+        """
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending or self._closed:
+            return
+
+        try:
+            self._session.add_all(self._pending)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            logging.warning(
+                f"Failed to store batch of {len(self._pending)} results,"
+                + " storing them one by one",
+                exc_info=True,
+            )
+            self._store_one_by_one()
+        finally:
+            self._pending.clear()
+            self._session.expunge_all()
+
+    def _store_one_by_one(self):
+        """commits buffered results separately, so only failed ones are lost.
+        :return:
+        """
+        for result in self._pending:
+            try:
+                self._session.add(result)
+                self._session.commit()
+            except Exception:
+                self._session.rollback()
+                logging.exception(
+                    f"Failed to store result of {result.benchmark}"
+                    + f" {result.implementation} {result.problem_preset}"
+                    + " into database"
+                )
+
+    def close(self):
+        """flushes buffered result records and closes the session.
+        :return:
+        """
+        with self._lock:
+            self._flush()
+            if not self._closed:
+                self._session.close()
+                self._closed = True
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def encode_samples(values) -> bytes:
+    """encodes array-like of samples into BLOB.
+    :param values: array-like of samples
+    :return: little-endian float64 bytes
+    """
+    return np.ascontiguousarray(values, dtype="<f8").tobytes()
+
+
+def decode_samples(data: bytes) -> np.ndarray:
+    """decodes samples BLOB into NumPy array.
+    :param data: little-endian float64 bytes
+    :return: float64 array
+    """
+    return np.frombuffer(data, dtype="<f8")
+
+
+def read_samples(
+    conn: Engine, result_id: int, kind: str = EXEC_TIME_SAMPLES
+) -> np.ndarray:
+    """reads samples of the result record.
+    :param conn: sqlalchemy engine
+    :param result_id: id of the result record
+    :param kind: kind of the samples
+    :return: float64 array, empty if there are no samples
+    """
+    with Session(conn) as session:
+        data = session.scalar(
+            select(Sample.data).where(
+                Sample.result_id == result_id, Sample.kind == kind
+            )
+        )
+
+    return decode_samples(data if data is not None else b"")
+
+
+def read_run_samples(
+    conn: Engine, run_id: int, kind: str = EXEC_TIME_SAMPLES
+) -> dict[tuple[str, str, str, int], np.ndarray]:
+    """reads samples of all results in the run.
+    :param conn: sqlalchemy engine
+    :param run_id: id of the run
+    :param kind: kind of the samples
+    :return: dictionary of float64 arrays keyed by (benchmark, implementation,
+        problem_preset, threads)
+    """
+    sql = (
+        select(
+            Result.benchmark,
+            Result.implementation,
+            Result.problem_preset,
+            Result.threads,
+            Sample.data,
+        )
+        .join(Sample, Sample.result_id == Result.id)
+        .where(Result.run_id == run_id, Sample.kind == kind)
+    )
+
+    with Session(conn) as session:
+        return {
+            tuple(key): decode_samples(data)
+            for *key, data in session.execute(sql)
+        }
+
+
 def store_postfix(conn: Engine, postfix: Postfix):
     """creates postfix record in database.
     :param conn: sqlalchemy engine
@@ -198,3 +584,29 @@ def store_postfix(conn: Engine, postfix: Postfix):
         if existing_postfix is None:
             session.add(postfix)
             session.commit()
+
+
+def store_postfixes(conn: Engine, postfixes: list[Postfix]):
+    """creates missing postfix records in database in a single transaction.
+    :param conn: sqlalchemy engine
+    :param postfixes: postfix records to be inserted into db
+    :return:
+    """
+    with Session(conn) as session:
+        existing = {
+            tuple(row)
+            for row in session.execute(
+                select(Postfix.run_id, Postfix.postfix).where(
+                    Postfix.run_id.in_({p.run_id for p in postfixes})
+                )
+            )
+        }
+
+        for postfix in postfixes:
+            key = (postfix.run_id, postfix.postfix)
+            if key in existing:
+                continue
+            existing.add(key)
+            session.add(postfix)
+
+        session.commit()
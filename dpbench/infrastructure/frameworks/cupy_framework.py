@@ -40,3 +40,15 @@ class CupyFramework(Framework):
         import cupy
 
         return cupy.asnumpy
+
+    def copy_in_place_func(self) -> Callable:
+        """Returns the copy-method that copies device arrays in place."""
+        import cupy
+
+        return cupy.copyto
+
+    def synchronize(self) -> None:
+        """Waits for the work submitted to the current CUDA stream."""
+        import cupy
+
+        cupy.cuda.get_current_stream().synchronize()
@@ -3,13 +3,20 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from typing import Callable
+from typing import Callable, Iterator
 
 import dpctl
 
 import dpbench.config as cfg
 
-from .framework import Framework
+from .framework import DeviceTimeStats, Framework
+from .sycl_queue import (
+    AsyncCopier,
+    DeviceSpanTimer,
+    copy_in_place,
+    create_profiling_queue,
+    device_queue,
+)
 
 
 class DpnpFramework(Framework):
@@ -22,6 +29,13 @@ class DpnpFramework(Framework):
 
         super().__init__(fname, config)
 
+        # Queue benchmark arrays are allocated on, cached queue of the device
+        # if None.
+        self.sycl_queue = None
+        # Whether sycl_queue records profiling info for device_timer.
+        self._device_timing = False
+        self._copier = AsyncCopier()
+
         try:
             self.sycl_device = self.info.sycl_device
             self.device_info = dpctl.SyclDevice(self.sycl_device).name
@@ -67,9 +81,8 @@ class DpnpFramework(Framework):
                 dtype=ref_array.dtype,
                 order=order,
                 like=None,
-                device=self.sycl_device,
                 usm_type=None,
-                sycl_queue=None,
+                **self._placement(),
             )
 
         return _copy_to_func_impl
@@ -80,3 +93,69 @@ class DpnpFramework(Framework):
         import dpnp
 
         return dpnp.asnumpy
+
+    def copy_in_place_func(self) -> Callable:
+        """Returns the copy-method that copies device arrays in place."""
+        return copy_in_place
+
+    def copy_to_async_func(self) -> Callable:
+        """Returns the copy-method that starts copying the benchmark
+        arguments to device without waiting for the copy."""
+        copy_to = self.copy_to_func()
+
+        def _copy_to_async_impl(ref_array):
+            import dpnp
+
+            array = self._copier.to_device(
+                ref_array,
+                lambda shape, dtype, order: dpnp.empty(
+                    shape, dtype=dtype, order=order, **self._placement()
+                ),
+            )
+            return array if array is not None else copy_to(ref_array)
+
+        return _copy_to_async_impl
+
+    def copy_from_async_func(self) -> Callable:
+        """Returns the copy-method that starts copying the benchmark
+        arguments to host without waiting for the copy."""
+        copy_from = self.copy_from_func()
+
+        def _copy_from_async_impl(array):
+            host = self._copier.to_host(array)
+            return host if host is not None else copy_from(array)
+
+        return _copy_from_async_impl
+
+    def wait_copies(self) -> None:
+        """Waits for all copies started by asynchronous copy-methods."""
+        self._copier.wait()
+
+    def enable_device_timing(self) -> bool:
+        """Allocates arrays on the queue with profiling enabled, so work
+        submitted to it can be timed on the device."""
+        self.sycl_queue = create_profiling_queue(self.sycl_device)
+        self._device_timing = True
+        return True
+
+    def device_timer(self) -> Iterator[DeviceTimeStats]:
+        """Measures time of the device work with SYCL event profiling."""
+        if not self._device_timing:
+            return super().device_timer()
+
+        return DeviceSpanTimer(self.sycl_queue)
+
+    def synchronize(self) -> None:
+        """Waits for the work submitted to the queue of benchmark arrays."""
+        queue = self.sycl_queue
+        if queue is None:
+            queue = device_queue(self.sycl_device)
+
+        queue.wait()
+
+    def _placement(self) -> dict:
+        """Returns arguments that place new arrays on the framework queue."""
+        if self.sycl_queue is not None:
+            return {"device": None, "sycl_queue": self.sycl_queue}
+
+        return {"device": self.sycl_device, "sycl_queue": None}
@@ -5,14 +5,37 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
 from importlib.util import find_spec
-from typing import Any, Callable, Dict, final
+from typing import Any, Callable, Dict, Iterator, Union, final
 
 import pkg_resources
 
 import dpbench.config as cfg
 
 
+@dataclass
+class CompileStats:
+    """Compilation statistics collected by Framework.compile_timer."""
+
+    compile_time: int = 0
+
+
+@dataclass
+class DeviceTimeStats:
+    """Device execution statistics collected by Framework.device_timer.
+
+    Attributes:
+        device_time: span of the device work in nanoseconds from completion
+            of earlier work to completion of the last submitted kernel. It
+            includes idle gaps between kernels, so it is an upper bound of
+            the kernel execution time.
+    """
+
+    device_time: int = 0
+
+
 class Framework(object):
     """A class for reading and processing framework information."""
 
@@ -101,14 +124,103 @@ class Framework(object):
 
         return numpy.copy
 
+    def copy_in_place_func(self) -> Union[Callable, None]:
+        """Returns the copy-method copy(dest, src) that copies array src
+        into array dest of the same shape, both created by copy_to_func,
+        without allocating memory. It is used to restore output arguments
+        between repetitions from device-resident copies.
+
+        Frameworks that override copy_to_func must override it as well or
+        return None, then arguments are copied from host again.
+        """
+        import numpy
+
+        return numpy.copyto
+
+    def copy_to_async_func(self) -> Callable:
+        """Returns the copy-method that starts copying the benchmark
+        arguments from host to device without waiting for the copy to
+        complete. Arrays must not be used before wait_copies is called.
+
+        Frameworks without asynchronous copies copy synchronously.
+        """
+        return self.copy_to_func()
+
+    def copy_from_async_func(self) -> Callable:
+        """Returns the copy-method that starts copying the benchmark
+        arguments from device to host without waiting for the copy to
+        complete. Arrays must not be used before wait_copies is called.
+
+        Frameworks without asynchronous copies copy synchronously.
+        """
+        return self.copy_from_func()
+
+    def wait_copies(self) -> None:
+        """Waits for all copies started by asynchronous copy-methods."""
+        pass
+
+    def enable_device_timing(self) -> bool:
+        """Enables measurement of device execution time by device_timer.
+
+        It must be called before arrays are copied to the device, because
+        device work is timed on the queue arrays are allocated on.
+
+        :return: True if framework supports device timing.
+        """
+        return False
+
+    def enable_jit_cache(self, impl_fn: Callable, cache_dir: str) -> None:
+        """Enables persistent cache of JIT compiled code for implementation.
+
+        Frameworks that do not compile implementations ignore it.
+
+        :param impl_fn: A benchmark implementation.
+        :param cache_dir: Directory to store compiled code in.
+        """
+        pass
+
     def execute(self, impl_fn: Callable, input_args: Dict):
         """A wrapper for a framework to customize how a benchmark
         implementation should be executed.
 
+        Asynchronous frameworks may return before the submitted work is
+        completed, call synchronize to wait for it.
+
         :param impl: A benchmark implementation.
         """
         return impl_fn(**input_args)
 
+    def synchronize(self) -> None:
+        """Waits for the work submitted by the implementation to complete.
+
+        It is called inside the timed region after execute, so execution
+        time of asynchronous frameworks covers the device work. Synchronous
+        frameworks do nothing.
+        """
+        pass
+
+    @contextmanager
+    def compile_timer(self) -> Iterator[CompileStats]:
+        """Measures time the framework spends compiling implementation.
+
+        Wrap framework.execute call with it to separate compile time from
+        the execution time. compile_time of the yielded stats is set in
+        nanoseconds once the context exits. Frameworks that do not compile
+        implementations report zero.
+        """
+        yield CompileStats()
+
+    @contextmanager
+    def device_timer(self) -> Iterator[DeviceTimeStats]:
+        """Measures device span of the work submitted inside the context.
+
+        Wrap framework.execute call with it to report device execution
+        separately from host dispatch. device_time of the yielded stats is
+        set in nanoseconds once the context exits and device work is
+        completed. Frameworks without device timing report zero.
+        """
+        yield DeviceTimeStats()
+
     def __eq__(self, other):
         if not isinstance(other, type(self)):
             return NotImplemented
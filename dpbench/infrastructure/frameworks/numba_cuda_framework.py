@@ -2,11 +2,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Callable
+from typing import Callable, Iterator
 
 import dpbench.config as cfg
 
-from .framework import Framework
+from .framework import CompileStats, Framework
+from .numba_framework import enable_numba_jit_cache, numba_compile_timer
 
 
 class NumbaCudaFramework(Framework):
@@ -40,3 +41,24 @@ class NumbaCudaFramework(Framework):
         import cupy
 
         return cupy.asnumpy
+
+    def copy_in_place_func(self) -> Callable:
+        """Returns the copy-method that copies device arrays in place."""
+        import cupy
+
+        return cupy.copyto
+
+    def synchronize(self) -> None:
+        """Waits for the work submitted to the CUDA device, both by numba
+        kernels and by cupy."""
+        from numba import cuda
+
+        cuda.synchronize()
+
+    def enable_jit_cache(self, impl_fn: Callable, cache_dir: str) -> None:
+        """Enables persistent JIT cache for the implementation."""
+        enable_numba_jit_cache(impl_fn, cache_dir)
+
+    def compile_timer(self) -> Iterator[CompileStats]:
+        """Measures time spent by numba in JIT compilation."""
+        return numba_compile_timer()
@@ -4,9 +4,16 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-License-Identifier: BSD-3-Clause
 
+import inspect
+import logging
+import os
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
 import dpbench.config as cfg
+from dpbench.infrastructure.cache import hash_module_source
 
-from .framework import Framework
+from .framework import CompileStats, Framework
 
 _impl = {
     "object-mode": "o",
@@ -18,6 +25,56 @@ _impl = {
 }
 
 
+def enable_numba_jit_cache(impl_fn: Callable, cache_dir: str) -> None:
+    """Enables on-disk caching of numba dispatchers used by implementation.
+
+    Caching is enabled for the implementation function and for every numba
+    dispatcher defined in its module. Cache of each module is stored in the
+    subdirectory named after the hash of the module source, so the cache gets
+    invalidated once the implementation changes.
+
+    Args:
+        impl_fn: benchmark implementation function.
+        cache_dir: root directory of the cache.
+    """
+    import numba.core.config
+
+    module = inspect.getmodule(getattr(impl_fn, "py_func", impl_fn))
+    if module is None:
+        return
+
+    source_hash = hash_module_source(module.__name__) or "unknown"
+    numba.core.config.CACHE_DIR = os.path.join(cache_dir, source_hash)
+
+    for obj in [impl_fn, *vars(module).values()]:
+        enable_caching = getattr(obj, "enable_caching", None)
+        if isinstance(obj, type) or not callable(enable_caching):
+            continue
+
+        try:
+            enable_caching()
+        except Exception as e:
+            logging.debug(f"Could not enable caching for {obj}: {e}")
+
+
+@contextmanager
+def numba_compile_timer() -> Iterator[CompileStats]:
+    """Measures time spent by numba in JIT compilation.
+
+    Nested compilations are accounted only once. Loading from the JIT cache
+    does not count as compilation.
+    """
+    from numba.core.event import install_timer
+
+    stats = CompileStats()
+
+    def _set_compile_time(duration: float):
+        stats.compile_time = int(duration * 1_000_000_000)
+
+    with install_timer("numba:compile", _set_compile_time):
+        yield stats
+
+
 class NumbaFramework(Framework):
     """A class for reading and processing framework information."""
 
@@ -31,3 +88,11 @@ class NumbaFramework(Framework):
     @staticmethod
     def required_packages() -> list[str]:
         return ["numba"]
+
+    def enable_jit_cache(self, impl_fn: Callable, cache_dir: str) -> None:
+        """Enables persistent JIT cache for the implementation."""
+        enable_numba_jit_cache(impl_fn, cache_dir)
+
+    def compile_timer(self) -> Iterator[CompileStats]:
+        """Measures time spent by numba in JIT compilation."""
+        return numba_compile_timer()
@@ -3,13 +3,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Iterator
 
 import numpy as np
 
 import dpbench.config as cfg
 
-from .framework import Framework
+from .framework import CompileStats, Framework
+from .numba_framework import enable_numba_jit_cache, numba_compile_timer
 
 
 class NumbaMlirFramework(Framework):
@@ -72,3 +73,27 @@ class NumbaMlirFramework(Framework):
             return dpt.asnumpy
         else:
             return np.copy
+
+    def copy_in_place_func(self) -> Callable:
+        """Returns the copy-method that copies arrays in place."""
+        if self.sycl_device:
+            from .sycl_queue import copy_in_place
+
+            return copy_in_place
+        else:
+            return np.copyto
+
+    def synchronize(self) -> None:
+        """Waits for the work submitted to the device queue."""
+        if self.sycl_device:
+            from .sycl_queue import device_queue
+
+            device_queue(self.sycl_device).wait()
+
+    def enable_jit_cache(self, impl_fn: Callable, cache_dir: str) -> None:
+        """Enables persistent JIT cache for the implementation."""
+        enable_numba_jit_cache(impl_fn, cache_dir)
+
+    def compile_timer(self) -> Iterator[CompileStats]:
+        """Measures time spent by numba in JIT compilation."""
+        return numba_compile_timer()
@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Asynchronous copies and device timing on SYCL queues through dpctl."""
+
+from typing import Any, Callable, Union
+
+import dpctl
+import numpy as np
+
+from .framework import DeviceTimeStats
+
+
+def device_queue(sycl_device: str) -> dpctl.SyclQueue:
+    """Returns cached queue that dpnp and dpctl.tensor use for arrays
+    created on the device."""
+    import dpctl.tensor as dpt
+
+    return dpt.Device.create_device(sycl_device).sycl_queue
+
+
+def create_profiling_queue(sycl_device: str) -> dpctl.SyclQueue:
+    """Creates queue on the device that records profiling info of events."""
+    return dpctl.SyclQueue(sycl_device, property="enable_profiling")
+
+
+class DeviceSpanTimer:
+    """Context manager that measures device span of work submitted to queue.
+
+    Barriers are submitted to the queue on enter and on exit, so work of any
+    library that uses the queue, e.g. dpnp or numba_dpex kernels, is timed
+    without access to its events. Device time is the difference of the
+    profiling end timestamps of the barriers, that is the span from
+    completion of earlier work to completion of the last kernel. Unlike the
+    sum of kernel durations, the span includes device idle gaps between
+    kernels, e.g. while host dispatches the next one. Exit waits for the
+    device work to complete.
+    """
+
+    def __init__(self, queue: dpctl.SyclQueue):
+        self.queue = queue
+        self.stats = DeviceTimeStats()
+        self._start = None
+
+    def __enter__(self) -> DeviceTimeStats:
+        self._start = self.queue.submit_barrier()
+        return self.stats
+
+    def __exit__(self, *exc):
+        end = self.queue.submit_barrier()
+        end.wait()
+        self.stats.device_time = (
+            end.profiling_info_end - self._start.profiling_info_end
+        )
+
+
+def copy_in_place(dest: Any, src: Any) -> None:
+    """Copies dpctl or dpnp array src into array dest of the same shape on
+    the device without allocating memory.
+
+    Contiguous arrays of the same layout are copied with a single memcpy,
+    other arrays by dpctl.tensor element-wise copy.
+    """
+    dest_usm = _as_usm_ndarray(dest)
+    src_usm = _as_usm_ndarray(src)
+
+    order = _contiguous_order(dest_usm.flags)
+    if (
+        order is not None
+        and order == _contiguous_order(src_usm.flags)
+        and dest_usm.dtype == src_usm.dtype
+        and dest_usm.shape == src_usm.shape
+        and dest_usm.__sycl_usm_array_interface__["offset"] == 0
+        and src_usm.__sycl_usm_array_interface__["offset"] == 0
+    ):
+        if dest_usm.nbytes > 0:
+            dest_usm.sycl_queue.memcpy(
+                dest_usm.usm_data, src_usm.usm_data, dest_usm.nbytes
+            )
+        return
+
+    dest_usm[...] = src_usm
+
+
+def _as_usm_ndarray(array: Any) -> Any:
+    """Returns usm_ndarray of dpctl or dpnp array, None for other types."""
+    # dpctl.tensor takes long to import, so it is imported on first use.
+    import dpctl.tensor as dpt
+
+    if isinstance(array, dpt.usm_ndarray):
+        return array
+    if hasattr(array, "get_array"):
+        return array.get_array()
+
+    return None
+
+
+def _contiguous_order(flags) -> Union[str, None]:
+    if flags.c_contiguous:
+        return "C"
+    if flags.f_contiguous:
+        return "F"
+
+    return None
+
+
+class AsyncCopier:
+    """Copies contiguous arrays between host and USM memory without waiting
+    for the copies to complete.
+
+    Copies that can not be done asynchronously, e.g. of strided arrays, are
+    reported by returning None, so caller falls back to synchronous copy.
+    """
+
+    def __init__(self):
+        self._events: list[dpctl.SyclEvent] = []
+        # Host arrays must stay alive until their copies complete.
+        self._pending: list[Any] = []
+
+    def to_device(
+        self, ref_array: np.ndarray, empty: Callable[..., Any]
+    ) -> Any:
+        """Starts copying host array to the device.
+
+        Args:
+            ref_array: host array to copy.
+            empty: function empty(shape, dtype, order) that allocates
+                destination array on the device.
+
+        Returns: device array or None if array can not be copied
+            asynchronously.
+        """
+        order = _contiguous_order(ref_array.flags)
+        if order is None:
+            return None
+
+        array = empty(ref_array.shape, ref_array.dtype, order)
+        usm = _as_usm_ndarray(array)
+        if ref_array.nbytes > 0:
+            self._submit(usm.sycl_queue, usm.usm_data, ref_array, ref_array)
+
+        return array
+
+    def to_host(self, array: Any) -> Union[np.ndarray, None]:
+        """Starts copying device array to host.
+
+        Returns: host array or None if array can not be copied
+            asynchronously.
+        """
+        usm = _as_usm_ndarray(array)
+        if usm is None:
+            return None
+
+        order = _contiguous_order(usm.flags)
+        if order is None or usm.__sycl_usm_array_interface__["offset"] != 0:
+            return None
+
+        host = np.empty(usm.shape, dtype=usm.dtype, order=order)
+        if host.nbytes > 0:
+            self._submit(usm.sycl_queue, host, usm.usm_data, host)
+
+        return host
+
+    def _submit(
+        self,
+        queue: dpctl.SyclQueue,
+        dest: Any,
+        src: Any,
+        host: np.ndarray,
+    ):
+        self._events.append(queue.memcpy_async(dest, src, host.nbytes))
+        self._pending.append(host)
+
+    def wait(self):
+        """Waits for all started copies to complete."""
+        for event in self._events:
+            event.wait()
+
+        self._events.clear()
+        self._pending.clear()
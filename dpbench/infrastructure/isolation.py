@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Isolation of benchmark processes from the rest of the system."""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+from dataclasses import dataclass
+from typing import Union
+
+_SYS_NODE_CPULIST = "/sys/devices/system/node/node{node}/cpulist"
+_SYS_CPU_GOVERNOR = "/sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_governor"
+_PROC_DROP_CACHES = "/proc/sys/vm/drop_caches"
+# Value written to drop_caches that frees page cache, dentries and inodes.
+_DROP_ALL_CACHES = "3"
+
+PERFORMANCE_GOVERNOR = "performance"
+
+
+def parse_cpu_list(cpu_list: str) -> set[int]:
+    """Parses kernel cpu list format like 0-3,8,10-11 into set of cpus."""
+    cpus = set()
+    for cpu_range in cpu_list.strip().split(","):
+        if not cpu_range:
+            continue
+        first, _, last = cpu_range.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+
+    return cpus
+
+
+def read_numa_node_cpus(node: int) -> set[int]:
+    """Reads set of cpus that belong to the NUMA node.
+
+    Raises:
+        OSError: node does not exist or topology is not exposed by kernel.
+    """
+    with open(_SYS_NODE_CPULIST.format(node=node)) as file:
+        return parse_cpu_list(file.read())
+
+
+def read_cpu_governors(cpus: set[int]) -> dict[int, str]:
+    """Reads cpufreq scaling governors of the cpus.
+
+    Returns: governor keyed by cpu. Cpus without cpufreq support are skipped.
+    """
+    governors = {}
+    for cpu in sorted(cpus):
+        try:
+            with open(_SYS_CPU_GOVERNOR.format(cpu=cpu)) as file:
+                governors[cpu] = file.read().strip()
+        except OSError:
+            continue
+
+    return governors
+
+
+def check_cpu_governors(cpus: set[int]) -> str:
+    """Warns if cpus are not running performance governor.
+
+    Returns: comma separated governors in use, "n/a" if cpufreq is not
+        available.
+    """
+    governors = read_cpu_governors(cpus)
+    slow = sorted(
+        cpu for cpu, gov in governors.items() if gov != PERFORMANCE_GOVERNOR
+    )
+    if slow:
+        logging.warning(
+            f"Cpus {slow} do not use {PERFORMANCE_GOVERNOR} governor,"
+            + " frequency scaling may add noise to measurements"
+        )
+
+    return ",".join(sorted(set(governors.values()))) or "n/a"
+
+
+def can_drop_page_cache() -> bool:
+    """Returns True if current user is permitted to drop page cache."""
+    return os.access(_PROC_DROP_CACHES, os.W_OK)
+
+
+def drop_page_cache() -> bool:
+    """Writes dirty pages back and drops page cache.
+
+    Returns: True if cache was dropped.
+    """
+    os.sync()
+    try:
+        with open(_PROC_DROP_CACHES, "w") as file:
+            file.write(_DROP_ALL_CACHES)
+    except OSError as e:
+        logging.debug(f"Could not drop page cache: {e}")
+        return False
+
+    return True
+
+
+def _load_libnuma() -> Union[ctypes.CDLL, None]:
+    """Loads libnuma if it is installed and kernel supports NUMA."""
+    name = ctypes.util.find_library("numa")
+    if name is None:
+        return None
+
+    try:
+        libnuma = ctypes.CDLL(name, use_errno=True)
+    except OSError:
+        return None
+
+    if libnuma.numa_available() < 0:
+        return None
+
+    libnuma.numa_parse_nodestring.argtypes = [ctypes.c_char_p]
+    libnuma.numa_parse_nodestring.restype = ctypes.c_void_p
+    libnuma.numa_set_membind.argtypes = [ctypes.c_void_p]
+    libnuma.numa_set_membind.restype = None
+    libnuma.numa_bitmask_free.argtypes = [ctypes.c_void_p]
+    libnuma.numa_bitmask_free.restype = None
+
+    return libnuma
+
+
+def libnuma_available() -> bool:
+    """Returns True if memory can be bound to NUMA node with libnuma."""
+    return _load_libnuma() is not None
+
+
+def bind_memory_to_numa_node(node: int) -> bool:
+    """Restricts memory allocations of the calling process to NUMA node.
+
+    Memory policy is inherited by threads created afterwards, so it should be
+    set before threading runtimes spin up.
+
+    Returns: True if memory was bound.
+    """
+    libnuma = _load_libnuma()
+    if libnuma is None:
+        logging.warning(
+            "libnuma is not available, memory is not bound to NUMA node"
+        )
+        return False
+
+    nodemask = libnuma.numa_parse_nodestring(str(node).encode())
+    if not nodemask:
+        logging.warning(f"NUMA node {node} does not exist")
+        return False
+
+    try:
+        libnuma.numa_set_membind(nodemask)
+    finally:
+        libnuma.numa_bitmask_free(nodemask)
+
+    return True
+
+
+@dataclass
+class IsolationProfile:
+    """Settings that isolate framework processes from each other and from the
+    rest of the system to reduce run-to-run variance.
+
+    Attributes:
+        cpus: cpus framework processes are allowed to run on. None means no
+            restriction.
+        numa_node: NUMA node to bind memory of framework processes to. None
+            means default memory policy.
+        drop_page_cache: drop page cache before every benchmark run.
+    """
+
+    cpus: set[int] = None
+    numa_node: int = None
+    drop_page_cache: bool = False
+
+    @classmethod
+    def for_numa_node(
+        cls, node: int, drop_page_cache: bool = True
+    ) -> "IsolationProfile":
+        """Creates profile that keeps processes on cpus and memory of node.
+
+        Cpus are limited to the ones available to the current process.
+
+        Raises:
+            ValueError: no cpus of the node are available.
+        """
+        try:
+            cpus = read_numa_node_cpus(node) & os.sched_getaffinity(0)
+        except OSError as e:
+            if node != 0:
+                raise ValueError(f"NUMA node {node} is not available: {e}")
+            # Kernels without NUMA support expose single implicit node.
+            cpus = os.sched_getaffinity(0)
+
+        if not cpus:
+            raise ValueError(f"No cpus of NUMA node {node} are available")
+
+        return cls(cpus=cpus, numa_node=node, drop_page_cache=drop_page_cache)
+
+    def apply(self) -> None:
+        """Applies profile to the calling process."""
+        if self.cpus:
+            logging.info(f"Pinning process to cpus {sorted(self.cpus)}")
+            os.sched_setaffinity(0, self.cpus)
+
+        if self.numa_node is not None:
+            logging.info(f"Binding memory to NUMA node {self.numa_node}")
+            bind_memory_to_numa_node(self.numa_node)
+
+    def describe(self) -> dict[str, str]:
+        """Checks host and returns active settings of the profile.
+
+        Settings that could not be applied on this host are reported as such,
+        e.g. memory binding without libnuma or page cache dropping without
+        permissions.
+        """
+        cpus = self.cpus or os.sched_getaffinity(0)
+
+        settings = {
+            "isolation.cpus": ",".join(str(cpu) for cpu in sorted(cpus)),
+            "isolation.cpu_governor": check_cpu_governors(cpus),
+        }
+
+        if self.numa_node is not None:
+            settings["isolation.numa_node"] = str(self.numa_node)
+            settings["isolation.memory_binding"] = (
+                "bound" if libnuma_available() else "unavailable"
+            )
+
+        if self.drop_page_cache:
+            permitted = can_drop_page_cache()
+            if not permitted:
+                logging.warning(
+                    "Page cache can not be dropped without root permissions"
+                )
+            settings["isolation.drop_page_cache"] = (
+                "enabled" if permitted else "not permitted"
+            )
+
+        return settings
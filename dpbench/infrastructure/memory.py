@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Host memory high-water mark tracking."""
+
+import logging
+import tracemalloc
+
+_PROC_STATUS = "/proc/self/status"
+_PROC_CLEAR_REFS = "/proc/self/clear_refs"
+# Value written to clear_refs that resets peak resident set size (VmHWM).
+_CLEAR_REFS_RESET_HWM = "5"
+
+
+def read_peak_rss() -> int:
+    """Returns peak resident set size of the current process in bytes.
+
+    Returns: VmHWM value or 0 if it is not available.
+    """
+    try:
+        with open(_PROC_STATUS) as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+
+    return 0
+
+
+def reset_peak_rss() -> bool:
+    """Resets peak resident set size of the current process to the current one.
+
+    Returns: True if peak was reset.
+    """
+    try:
+        with open(_PROC_CLEAR_REFS, "w") as file:
+            file.write(_CLEAR_REFS_RESET_HWM)
+    except OSError:
+        return False
+
+    return True
+
+
+class MemoryTracker:
+    """Tracks host memory peaks of the code section.
+
+    Peak allocation is tracked with tracemalloc, so it covers Python objects
+    and NumPy arrays, but not memory allocated by native libraries or device
+    memory. Peak RSS covers everything mapped into the process, but it is only
+    reset between sections if the kernel supports VmHWM reset through
+    /proc/self/clear_refs. Otherwise it is the peak since process start.
+
+    :Example:
+        .. code-block:: python
+            memory = MemoryTracker()
+
+            memory.start()
+            s = [x for x in range(10000)]
+            print(memory.stop())
+
+            memory.close()
+    """
+
+    def __init__(self) -> None:
+        """Starts tracemalloc unless it is already tracing."""
+        self._owns_tracemalloc = not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start()
+
+        self._can_reset_rss = reset_peak_rss()
+        if not self._can_reset_rss:
+            logging.warning(
+                "Peak RSS can not be reset, it is reported since process start"
+            )
+
+        self._baseline = 0
+
+    def start(self) -> None:
+        """Resets memory peaks."""
+        if self._can_reset_rss:
+            reset_peak_rss()
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def stop(self) -> dict[str, int]:
+        """Returns memory peaks since the last start in bytes.
+
+        Returns: dictionary with peak_alloc, that is peak of traced memory
+            allocated on top of memory allocated before start, and peak_rss.
+        """
+        _, peak = tracemalloc.get_traced_memory()
+
+        return {
+            "peak_alloc": max(peak - self._baseline, 0),
+            "peak_rss": read_peak_rss(),
+        }
+
+    def close(self) -> None:
+        """Stops tracemalloc if it was started by the tracker."""
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
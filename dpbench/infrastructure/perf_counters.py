@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Hardware performance counters based on Linux perf_event_open syscall."""
+
+import ctypes
+import fcntl
+import logging
+import os
+import platform
+import struct
+
+import numpy as np
+
+# perf_event_open syscall numbers for supported architectures.
+_SYSCALL_PERF_EVENT_OPEN = {
+    "x86_64": 298,
+    "i386": 336,
+    "i686": 336,
+    "aarch64": 241,
+    "riscv64": 241,
+    "ppc64le": 319,
+    "ppc64": 319,
+    "s390x": 331,
+}
+
+_PERF_TYPE_HARDWARE = 0
+
+_PERF_COUNT_HW_CPU_CYCLES = 0
+_PERF_COUNT_HW_INSTRUCTIONS = 1
+# Kernel maps it to the last level cache misses on most of the CPUs.
+_PERF_COUNT_HW_CACHE_MISSES = 3
+
+_PERF_FORMAT_TOTAL_TIME_ENABLED = 1 << 0
+_PERF_FORMAT_TOTAL_TIME_RUNNING = 1 << 1
+
+_ATTR_FLAG_DISABLED = 1 << 0
+_ATTR_FLAG_INHERIT = 1 << 1
+_ATTR_FLAG_EXCLUDE_KERNEL = 1 << 5
+_ATTR_FLAG_EXCLUDE_HV = 1 << 6
+
+_PERF_FLAG_FD_CLOEXEC = 1 << 3
+
+_PERF_EVENT_IOC_ENABLE = 0x2400
+_PERF_EVENT_IOC_DISABLE = 0x2401
+_PERF_EVENT_IOC_RESET = 0x2403
+
+# Size of the memory transaction caused by a single last level cache miss.
+CACHE_LINE_SIZE = 64
+
+DEFAULT_EVENTS = {
+    "cycles": (_PERF_TYPE_HARDWARE, _PERF_COUNT_HW_CPU_CYCLES),
+    "instructions": (_PERF_TYPE_HARDWARE, _PERF_COUNT_HW_INSTRUCTIONS),
+    "llc_misses": (_PERF_TYPE_HARDWARE, _PERF_COUNT_HW_CACHE_MISSES),
+}
+
+
+class _PerfEventAttr(ctypes.Structure):
+    """First version of the perf_event_attr structure (PERF_ATTR_SIZE_VER0).
+
+    Kernel accepts older structure sizes, and fields of the later versions
+    are not needed for counting.
+    """
+
+    _fields_ = [
+        ("type", ctypes.c_uint32),
+        ("size", ctypes.c_uint32),
+        ("config", ctypes.c_uint64),
+        ("sample_period", ctypes.c_uint64),
+        ("sample_type", ctypes.c_uint64),
+        ("read_format", ctypes.c_uint64),
+        ("flags", ctypes.c_uint64),
+        ("wakeup_events", ctypes.c_uint32),
+        ("bp_type", ctypes.c_uint32),
+        ("config1", ctypes.c_uint64),
+    ]
+
+
+def _perf_event_open(type: int, config: int) -> int:
+    """Opens counter for the calling process and threads it creates later."""
+    syscall_number = _SYSCALL_PERF_EVENT_OPEN.get(platform.machine())
+    if syscall_number is None:
+        raise OSError(
+            f"perf_event_open is not supported on {platform.machine()}"
+        )
+
+    attr = _PerfEventAttr()
+    attr.type = type
+    attr.size = ctypes.sizeof(_PerfEventAttr)
+    attr.config = config
+    attr.read_format = (
+        _PERF_FORMAT_TOTAL_TIME_ENABLED | _PERF_FORMAT_TOTAL_TIME_RUNNING
+    )
+    attr.flags = (
+        _ATTR_FLAG_DISABLED
+        | _ATTR_FLAG_INHERIT
+        | _ATTR_FLAG_EXCLUDE_KERNEL
+        | _ATTR_FLAG_EXCLUDE_HV
+    )
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    fd = libc.syscall(
+        syscall_number,
+        ctypes.byref(attr),
+        0,  # pid: calling process
+        -1,  # cpu: any
+        -1,  # group_fd: no group
+        _PERF_FLAG_FD_CLOEXEC,
+    )
+    if fd < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+
+    return fd
+
+
+class PerfCounters:
+    """Set of hardware performance counters of the current process.
+
+    Counters are inherited by threads created after counters were opened, so
+    they should be opened before the first execution that spins up threading
+    runtime of the framework.
+
+    :Example:
+        .. code-block:: python
+            counters = PerfCounters()
+
+            counters.start()
+            s = [x for x in range(10000)]
+            print(counters.stop())
+
+            counters.close()
+    """
+
+    def __init__(self, events: dict[str, tuple[int, int]] = None) -> None:
+        """Opens counters. Events that are not supported are skipped.
+
+        Args:
+            events: dictionary of (type, config) event pairs keyed by the
+                counter name. Defaults to DEFAULT_EVENTS.
+
+        Raises:
+            OSError: none of the events could be opened.
+        """
+        self._fds: dict[str, int] = {}
+
+        error = None
+        for name, (type, config) in (events or DEFAULT_EVENTS).items():
+            try:
+                self._fds[name] = _perf_event_open(type, config)
+            except OSError as e:
+                logging.warning(f"Could not open {name} perf counter: {e}")
+                error = e
+
+        if not self._fds:
+            raise error or OSError("No perf counters requested")
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the opened counters."""
+        return list(self._fds)
+
+    def start(self) -> None:
+        """Resets and enables all counters."""
+        for fd in self._fds.values():
+            fcntl.ioctl(fd, _PERF_EVENT_IOC_RESET, 0)
+        for fd in self._fds.values():
+            fcntl.ioctl(fd, _PERF_EVENT_IOC_ENABLE, 0)
+
+    def stop(self) -> dict[str, int]:
+        """Disables all counters and returns their values.
+
+        Values are scaled up if kernel had to multiplex counters.
+        """
+        for fd in self._fds.values():
+            fcntl.ioctl(fd, _PERF_EVENT_IOC_DISABLE, 0)
+
+        values = {}
+        for name, fd in self._fds.items():
+            value, enabled, running = struct.unpack("QQQ", os.read(fd, 24))
+            if running and running < enabled:
+                value = int(value * enabled / running)
+            values[name] = value
+
+        return values
+
+    def close(self) -> None:
+        """Closes all counters."""
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+
+
+def estimate_memory_bandwidth(
+    llc_misses: list[int], exec_times: list[int]
+) -> np.ndarray:
+    """Estimates memory bandwidth from last level cache misses.
+
+    Every miss is counted as a single cache line transfer, so hardware
+    prefetching and write backs are not taken into account.
+
+    Args:
+        llc_misses: number of cache misses per repetition.
+        exec_times: execution time per repetition in nanoseconds.
+
+    Returns: bandwidth per repetition in bytes per second.
+    """
+    exec_times = np.maximum(np.asarray(exec_times, dtype=np.float64), 1)
+    return (
+        np.asarray(llc_misses, dtype=np.float64) * CACHE_LINE_SIZE * 1e9
+    ) / exec_times
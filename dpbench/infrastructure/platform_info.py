@@ -0,0 +1,196 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Platform and software environment of the benchmark run."""
+
+import glob
+import hashlib
+import importlib.metadata
+import logging
+import os
+import platform
+import socket
+import sys
+from dataclasses import asdict, dataclass
+
+from dpbench.infrastructure.datamodel import Machine
+
+# Distributions which versions affect measurements.
+PACKAGES = [
+    "numpy",
+    "scipy",
+    "scikit-learn",
+    "numba",
+    "numba-dpex",
+    "numba-mlir",
+    "dpnp",
+    "dpctl",
+    "cupy",
+    "llvmlite",
+]
+
+# Prefixes of environment variables that configure threading runtimes,
+# device selection and JIT compilers.
+ENV_PREFIXES = [
+    "NUMBA_",
+    "OMP_",
+    "KMP_",
+    "MKL_",
+    "OPENBLAS_",
+    "DPCPP_",
+    "SYCL_",
+    "ONEAPI_",
+    "DPNP_",
+    "DPCTL_",
+    "ZE_",
+    "CUDA_VISIBLE_DEVICES",
+]
+
+_SYS_CPU_TOPOLOGY = "/sys/devices/system/cpu/cpu[0-9]*/topology"
+
+
+@dataclass
+class MachineInfo:
+    """Hardware and operating system of the host."""
+
+    hostname: str = ""
+    cpu_model: str = ""
+    architecture: str = ""
+    sockets: int = 0
+    cores: int = 0
+    logical_cpus: int = 0
+    memory_bytes: int = 0
+    kernel: str = ""
+    os: str = ""
+
+    @property
+    def fingerprint(self) -> str:
+        """Returns hash that identifies the machine across runs."""
+        return hashlib.sha256(
+            repr(sorted(asdict(self).items())).encode()
+        ).hexdigest()[:16]
+
+    def Machine(self) -> Machine:
+        """Returns database record of the machine."""
+        return Machine(fingerprint=self.fingerprint, **asdict(self))
+
+
+def _read_topology() -> tuple[int, int]:
+    """Reads number of sockets and physical cores from sysfs.
+
+    Returns: (sockets, cores) or (0, 0) if topology is not exposed.
+    """
+    packages = set()
+    cores = set()
+    for topology in glob.glob(_SYS_CPU_TOPOLOGY):
+        try:
+            with open(os.path.join(topology, "physical_package_id")) as file:
+                package = int(file.read())
+            with open(os.path.join(topology, "core_id")) as file:
+                core = int(file.read())
+        except (OSError, ValueError):
+            continue
+        packages.add(package)
+        cores.add((package, core))
+
+    return len(packages), len(cores)
+
+
+def _read_os_name() -> str:
+    """Returns human readable name of the operating system."""
+    try:
+        return platform.freedesktop_os_release()["PRETTY_NAME"]
+    except (OSError, KeyError, AttributeError):
+        return platform.platform()
+
+
+def collect_machine_info() -> MachineInfo:
+    """Collects hardware and operating system description of the host."""
+    import cpuinfo
+
+    sockets, cores = _read_topology()
+
+    try:
+        memory_bytes = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError):
+        memory_bytes = 0
+
+    return MachineInfo(
+        hostname=socket.gethostname(),
+        cpu_model=cpuinfo.get_cpu_info().get("brand_raw", ""),
+        architecture=platform.machine(),
+        sockets=sockets,
+        cores=cores,
+        logical_cpus=os.cpu_count() or 0,
+        memory_bytes=memory_bytes,
+        kernel=platform.release(),
+        os=_read_os_name(),
+    )
+
+
+def _blas_vendor() -> str:
+    """Returns name of the BLAS library NumPy was built with."""
+    import numpy as np
+
+    try:
+        config = np.show_config(mode="dicts")
+        blas = config["Build Dependencies"]["blas"]
+        return " ".join(
+            str(blas[k]) for k in ["name", "version"] if blas.get(k)
+        )
+    except (TypeError, KeyError):
+        pass
+
+    # NumPy before 1.25 exposes build configuration as module attributes.
+    config = getattr(np, "__config__", None)
+    for section in ["blas_opt_info", "blas_ilp64_opt_info", "blas_mkl_info"]:
+        info = getattr(config, section, None) or {}
+        if info.get("libraries"):
+            return ",".join(info["libraries"])
+
+    return "n/a"
+
+
+def _dpbench_version() -> tuple[str, str]:
+    """Returns version and git revision of dpbench."""
+    from dpbench import _version
+
+    versions = _version.get_versions()
+    revision = versions.get("full-revisionid") or "n/a"
+    if versions.get("dirty"):
+        revision += "-dirty"
+
+    return versions.get("version", "n/a"), revision
+
+
+def collect_environment_info() -> dict[str, str]:
+    """Collects software environment of the current process.
+
+    Returns: dictionary with python.*, package.*, blas.vendor, dpbench.* and
+        env.* entries.
+    """
+    info = {
+        "python.version": platform.python_version(),
+        "python.implementation": platform.python_implementation(),
+        "python.executable": sys.executable,
+    }
+
+    for package in PACKAGES:
+        try:
+            info[f"package.{package}"] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+
+    try:
+        info["blas.vendor"] = _blas_vendor()
+    except Exception as e:
+        logging.warning(f"Could not detect BLAS vendor: {e}")
+
+    info["dpbench.version"], info["dpbench.git_sha"] = _dpbench_version()
+
+    for name, value in sorted(os.environ.items()):
+        if any(name.startswith(prefix) for prefix in ENV_PREFIXES):
+            info[f"env.{name}"] = value
+
+    return info
@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Profilers that capture hot path of the benchmark repetitions."""
+
+import logging
+import os
+import re
+import shutil
+import signal
+import subprocess
+import time
+from abc import ABC, abstractmethod
+
+PROFILERS = ["cprofile", "pyinstrument", "perf"]
+
+
+class Profiler(ABC):
+    """Profiler that writes profile artefact into the file on stop."""
+
+    extension: str = ""
+
+    def __init__(self, path: str) -> None:
+        """Creates profiler.
+
+        Args:
+            path: path to the profile artefact.
+        """
+        self.path = path
+
+    @abstractmethod
+    def start(self) -> None:
+        """Starts profiling."""
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stops profiling and writes profile artefact."""
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def top_functions(path: str, n: int) -> list[tuple[str, float]]:
+        """Reads profile artefact and returns the hottest functions.
+
+        Args:
+            path: path to the profile artefact.
+            n: number of functions to return.
+
+        Returns: list of (function, self time percent) sorted by self time.
+        """
+        pass
+
+
+class CProfileProfiler(Profiler):
+    """Deterministic profiler of Python functions based on cProfile."""
+
+    extension = "prof"
+
+    def start(self) -> None:
+        import cProfile
+
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+        self._profile.dump_stats(self.path)
+
+    @staticmethod
+    def top_functions(path: str, n: int) -> list[tuple[str, float]]:
+        import pstats
+
+        stats = pstats.Stats(path)
+        total = stats.total_tt or 1
+
+        functions = [
+            (f"{func} ({os.path.basename(file)}:{line})", tottime)
+            for (file, line, func), (_, _, tottime, _, _) in stats.stats.items()
+        ]
+        functions.sort(key=lambda f: f[1], reverse=True)
+
+        return [(func, t / total * 100) for func, t in functions[:n]]
+
+
+class PyinstrumentProfiler(Profiler):
+    """Sampling profiler of Python call stacks based on pyinstrument."""
+
+    extension = "pyisession"
+
+    def start(self) -> None:
+        from pyinstrument import Profiler as _Profiler
+
+        self._profiler = _Profiler()
+        self._profiler.start()
+
+    def stop(self) -> None:
+        session = self._profiler.stop()
+        session.save(self.path)
+
+    @staticmethod
+    def top_functions(path: str, n: int) -> list[tuple[str, float]]:
+        from pyinstrument.session import Session
+
+        root = Session.load(path).root_frame()
+        if root is None:
+            return []
+
+        self_times: dict[str, float] = {}
+        frames = [root]
+        while frames:
+            frame = frames.pop()
+            name = (
+                f"{frame.function} ({os.path.basename(frame.file_path or '')}"
+                + f":{frame.line_no})"
+            )
+            self_times[name] = self_times.get(name, 0.0) + frame.self_time
+            frames.extend(frame.children)
+
+        total = root.time or 1
+        functions = sorted(self_times.items(), key=lambda f: f[1], reverse=True)
+
+        return [(func, t / total * 100) for func, t in functions[:n]]
+
+
+class PerfProfiler(Profiler):
+    """Sampling profiler of native call stacks based on Linux perf.
+
+    perf record is attached to the current process, so JIT compiled code is
+    only symbolized if JIT compiler emits perf maps, e.g. with
+    NUMBA_ENABLE_PROFILING=1.
+    """
+
+    extension = "perf.data"
+
+    def start(self) -> None:
+        perf = shutil.which("perf")
+        if perf is None:
+            raise RuntimeError("perf executable was not found")
+
+        self._process = subprocess.Popen(
+            [perf, "record", "-g", "-o", self.path, "-p", str(os.getpid())],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        # Give perf time to attach before the profiled code starts.
+        time.sleep(0.5)
+        if self._process.poll() is not None:
+            raise RuntimeError(
+                "perf record failed: " + self._process.stderr.read().decode()
+            )
+
+    def stop(self) -> None:
+        self._process.send_signal(signal.SIGINT)
+        try:
+            self._process.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            logging.warning("perf record did not stop in time, killing it")
+            self._process.kill()
+            self._process.wait()
+
+    @staticmethod
+    def top_functions(path: str, n: int) -> list[tuple[str, float]]:
+        output = subprocess.run(
+            [
+                shutil.which("perf") or "perf",
+                "report",
+                "--stdio",
+                "--no-children",
+                "--sort",
+                "symbol",
+                "-i",
+                path,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        functions = []
+        for line in output.splitlines():
+            match = re.match(r"\s*([\d.]+)%\s+\[.\]\s+(.+)", line)
+            if match:
+                functions.append(
+                    (match.group(2).strip(), float(match.group(1)))
+                )
+            if len(functions) >= n:
+                break
+
+        return functions
+
+
+_PROFILER_CLASSES = {
+    "cprofile": CProfileProfiler,
+    "pyinstrument": PyinstrumentProfiler,
+    "perf": PerfProfiler,
+}
+
+
+def get_profiler_class(kind: str) -> type[Profiler]:
+    """Returns profiler class by its name."""
+    return _PROFILER_CLASSES[kind]
+
+
+def get_profiler_class_by_path(path: str) -> type[Profiler]:
+    """Returns profiler class that has written profile artefact."""
+    return next(
+        cls
+        for cls in _PROFILER_CLASSES.values()
+        if path.endswith("." + cls.extension)
+    )
+
+
+def make_profile_path(
+    profile_dir: str,
+    kind: str,
+    benchmark: str,
+    implementation: str,
+    preset: str,
+) -> str:
+    """Returns path to the profile artefact of the benchmark run."""
+    cls = get_profiler_class(kind)
+
+    return os.path.join(
+        profile_dir,
+        f"{benchmark}_{implementation}_{preset}.{cls.extension}",
+    )
@@ -0,0 +1,291 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Performance regression detection between runs."""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from . import datamodel as dm
+
+# Minimal number of samples on each side to apply statistical tests. Fewer
+# samples can not be classified.
+MIN_SAMPLES = 3
+
+REGRESSION = "regression"
+IMPROVEMENT = "improvement"
+UNCHANGED = "unchanged"
+INSUFFICIENT_SAMPLES = "insufficient samples"
+
+_LAST_N_RUNS = re.compile(r"last-(\d+)")
+
+# (benchmark, implementation, problem_preset, threads)
+TimingKey = tuple[str, str, str, int]
+
+
+@dataclass
+class Comparison:
+    """Comparison of timings of the same benchmark in two sets of runs.
+
+    Attributes:
+        ratio: ratio of candidate median to baseline median. Values above 1
+            mean candidate is slower.
+        ci_low, ci_high: bootstrap confidence interval of the ratio. Equal to
+            ratio if there are not enough samples.
+        p_value: p-value of two-sided Mann-Whitney U test, None if there are
+            not enough samples.
+    """
+
+    benchmark: str
+    implementation: str
+    preset: str
+    threads: int
+    baseline_median: float
+    candidate_median: float
+    ratio: float
+    ci_low: float
+    ci_high: float
+    p_value: Union[float, None]
+    status: str
+
+
+def bootstrap_ratio_ci(
+    baseline: np.ndarray,
+    candidate: np.ndarray,
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: int = 0,
+) -> tuple[float, float]:
+    """Calculates bootstrap percentile interval of the ratio of medians.
+
+    Args:
+        baseline: baseline timings.
+        candidate: candidate timings.
+        confidence: confidence level of the interval.
+        resamples: number of bootstrap resamples.
+        seed: seed of the random generator, so reports are reproducible.
+
+    Returns: lower and upper bounds of candidate to baseline median ratio.
+    """
+    rng = np.random.default_rng(seed)
+
+    def _medians(samples: np.ndarray) -> np.ndarray:
+        indices = rng.integers(0, len(samples), (resamples, len(samples)))
+        return np.median(samples[indices], axis=1)
+
+    ratios = _medians(candidate) / _medians(baseline)
+    tail = (1 - confidence) / 2 * 100
+
+    lower, upper = np.percentile(ratios, [tail, 100 - tail])
+
+    return float(lower), float(upper)
+
+
+def mann_whitney_p_value(baseline: np.ndarray, candidate: np.ndarray) -> float:
+    """Returns p-value of two-sided Mann-Whitney U test."""
+    from scipy.stats import mannwhitneyu
+
+    return float(
+        mannwhitneyu(baseline, candidate, alternative="two-sided").pvalue
+    )
+
+
+def compare_timings(
+    baseline: np.ndarray,
+    candidate: np.ndarray,
+    threshold: float = 0.05,
+    alpha: float = 0.05,
+    confidence: float = 0.95,
+) -> tuple[float, float, float, Union[float, None], str]:
+    """Classifies change of timings between baseline and candidate.
+
+    Change is a regression (improvement) if median ratio exceeds 1 + threshold
+    (falls below 1 - threshold), whole confidence interval of the ratio lies
+    above (below) 1 and Mann-Whitney U test rejects equality at alpha. If
+    either side has less than MIN_SAMPLES samples, change is not classified
+    and status is INSUFFICIENT_SAMPLES.
+
+    Args:
+        baseline: baseline timings.
+        candidate: candidate timings.
+        threshold: relative change of median to report.
+        alpha: significance level of the test.
+        confidence: confidence level of the ratio interval.
+
+    Returns: (ratio, ci_low, ci_high, p_value, status).
+    """
+    ratio = float(np.median(candidate) / np.median(baseline))
+
+    if min(len(baseline), len(candidate)) < MIN_SAMPLES:
+        return ratio, ratio, ratio, None, INSUFFICIENT_SAMPLES
+
+    ci_low, ci_high = bootstrap_ratio_ci(baseline, candidate, confidence)
+    p_value = mann_whitney_p_value(baseline, candidate)
+    significant = p_value < alpha
+
+    if significant and ratio > 1 + threshold and ci_low > 1:
+        status = REGRESSION
+    elif significant and ratio < 1 - threshold and ci_high < 1:
+        status = IMPROVEMENT
+    else:
+        status = UNCHANGED
+
+    return ratio, ci_low, ci_high, p_value, status
+
+
+def read_timings(
+    conn: sqlalchemy.Engine, run_ids: list[int]
+) -> dict[TimingKey, np.ndarray]:
+    """Reads execution times of successful results of the runs.
+
+    Timings of the same benchmark in several runs are pooled. Results stored
+    without per-repetition samples contribute their median.
+
+    Args:
+        conn: database connection.
+        run_ids: ids of the runs.
+
+    Returns: timings in nanoseconds keyed by (benchmark, implementation,
+        problem_preset, threads).
+    """
+    sql = (
+        sqlalchemy.select(
+            dm.Result.benchmark,
+            dm.Result.implementation,
+            dm.Result.problem_preset,
+            dm.Result.threads,
+            dm.Result.median_exec_time,
+            dm.Sample.data,
+        )
+        .outerjoin(
+            dm.Sample,
+            sqlalchemy.and_(
+                dm.Sample.result_id == dm.Result.id,
+                dm.Sample.kind == dm.EXEC_TIME_SAMPLES,
+            ),
+        )
+        .where(
+            dm.Result.run_id.in_(run_ids),
+            dm.Result.error_state == "Success",
+        )
+    )
+
+    timings: dict[TimingKey, list[np.ndarray]] = {}
+    with Session(conn) as session:
+        for *key, median, data in session.execute(sql):
+            samples = (
+                dm.decode_samples(data)
+                if data is not None
+                else np.array([median], dtype=np.float64)
+            )
+            timings.setdefault(tuple(key), []).append(samples)
+
+    return {key: np.concatenate(samples) for key, samples in timings.items()}
+
+
+def resolve_baseline_runs(
+    conn: sqlalchemy.Engine, baseline: str, candidate_run_id: int
+) -> list[int]:
+    """Resolves baseline specification into run ids.
+
+    Args:
+        conn: database connection.
+        baseline: run id or last-N, that is N most recent runs before the
+            candidate. If machine of the candidate is known, only runs on the
+            same machine are considered.
+        candidate_run_id: id of the candidate run.
+
+    Returns: list of run ids.
+
+    Raises:
+        ValueError: specification is not valid or no runs were found.
+    """
+    if baseline.isdigit():
+        return [int(baseline)]
+
+    match = _LAST_N_RUNS.fullmatch(baseline)
+    if not match or int(match.group(1)) < 1:
+        raise ValueError(f"expected run id or last-N, got {baseline}")
+
+    with Session(conn) as session:
+        candidate = session.get(dm.Run, candidate_run_id)
+        if candidate is None:
+            raise ValueError(f"run {candidate_run_id} does not exist")
+
+        sql = (
+            sqlalchemy.select(dm.Run.id)
+            .where(dm.Run.id < candidate_run_id)
+            .order_by(dm.Run.id.desc())
+            .limit(int(match.group(1)))
+        )
+        if candidate.machine_id is not None:
+            sql = sql.where(dm.Run.machine_id == candidate.machine_id)
+
+        run_ids = list(session.scalars(sql))
+
+    if not run_ids:
+        raise ValueError(f"no baseline runs found for {baseline}")
+
+    return run_ids
+
+
+def compare_runs(
+    conn: sqlalchemy.Engine,
+    baseline_run_ids: list[int],
+    candidate_run_id: int,
+    threshold: float = 0.05,
+    alpha: float = 0.05,
+    confidence: float = 0.95,
+) -> list[Comparison]:
+    """Compares every benchmark present in both baseline and candidate.
+
+    Args:
+        conn: database connection.
+        baseline_run_ids: ids of the baseline runs. Their timings are pooled.
+        candidate_run_id: id of the candidate run.
+        threshold: relative change of median to report.
+        alpha: significance level of the test.
+        confidence: confidence level of the ratio interval.
+
+    Returns: comparisons sorted by benchmark, implementation, preset and
+        threads.
+    """
+    baseline = read_timings(conn, baseline_run_ids)
+    candidate = read_timings(conn, [candidate_run_id])
+
+    missing = sorted(set(baseline) - set(candidate))
+    if missing:
+        logging.warning(
+            f"Candidate run has no successful results for {missing}"
+        )
+
+    comparisons = []
+    for key in sorted(set(baseline) & set(candidate)):
+        base, cand = baseline[key], candidate[key]
+        if np.median(base) <= 0:
+            continue
+
+        ratio, ci_low, ci_high, p_value, status = compare_timings(
+            base, cand, threshold, alpha, confidence
+        )
+        comparisons.append(
+            Comparison(
+                *key,
+                baseline_median=float(np.median(base)),
+                candidate_median=float(np.median(cand)),
+                ratio=ratio,
+                ci_low=ci_low,
+                ci_high=ci_high,
+                p_value=p_value,
+                status=status,
+            )
+        )
+
+    return comparisons
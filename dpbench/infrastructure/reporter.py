@@ -19,11 +19,47 @@ from sqlalchemy.orm import Session
 import dpbench.config as cfg
 
 from . import datamodel as dm
+from .profiler import get_profiler_class_by_path
+from .regression import (
+    IMPROVEMENT,
+    INSUFFICIENT_SAMPLES,
+    MIN_SAMPLES,
+    REGRESSION,
+    Comparison,
+)
+from .roofline import MachinePeak, attainable_gflops
+from .scaling import (
+    SWEEP_PRESET_SEPARATOR,
+    find_crossovers,
+    fit_scaling_exponent,
+    parse_sweep_preset,
+    strong_scaling,
+)
+from .trend import SERIES_COLUMNS, read_trend, sparkline_svg, summarize_trend
+
+# Implementation is reported as asynchronous if its dispatch-only time is
+# below this fraction of the completed time.
+ASYNC_DISPATCH_RATIO = 0.95
+
+# Results of a run are reported per benchmark, preset and thread count, so
+# results of strong scaling runs with different thread counts do not collapse
+# into one cell.
+_RESULT_KEY = [dm.Result.benchmark, dm.Result.problem_preset, dm.Result.threads]
 
 __all__ = [
     "generate_impl_summary_report",
     "generate_performance_report",
+    "generate_compile_time_report",
+    "generate_roofline_report",
+    "generate_memory_report",
+    "generate_device_time_report",
+    "generate_dispatch_report",
+    "generate_profile_report",
+    "generate_scaling_report",
+    "generate_thread_scaling_report",
     "generate_comparison_report",
+    "generate_regression_report",
+    "generate_trend_report",
 ]
 
 
@@ -79,6 +115,41 @@ def generate_header(conn: sqlalchemy.Engine, run_id: int):
         print(f"Report for {created_at} run")
         print("==================================")
 
+    generate_platform(conn, run_id)
+
+
+def generate_platform(conn: sqlalchemy.Engine, run_id: int):
+    """prints machine and software environment of the run if recorded"""
+    machine = dm.read_run_machine(conn, run_id)
+    if machine is None:
+        return
+
+    BYTES_IN_GIGABYTE: Final[float] = 1024**3
+
+    print(
+        f"Machine: {machine.hostname} ({machine.fingerprint}),"
+        + f" {machine.cpu_model}, {machine.sockets} sockets,"
+        + f" {machine.cores} cores, {machine.logical_cpus} cpus,"
+        + f" {machine.memory_bytes / BYTES_IN_GIGABYTE:.1f}GB"
+    )
+    print(f"OS: {machine.os}, kernel {machine.kernel}")
+
+    metadata = dm.read_run_metadata(conn, run_id)
+    packages = [
+        f"{key.removeprefix('package.')} {value}"
+        for key, value in metadata.items()
+        if key.startswith("package.")
+    ]
+    if "python.version" in metadata:
+        packages.insert(0, f"python {metadata['python.version']}")
+    if packages:
+        print("Packages: " + ", ".join(packages))
+    if "blas.vendor" in metadata:
+        print(f"BLAS: {metadata['blas.vendor']}")
+    if "dpbench.git_sha" in metadata:
+        print(f"dpbench: {metadata['dpbench.git_sha']}")
+    print("")
+
 
 def generate_legend(conn: sqlalchemy.Engine, run_id: int) -> list[str]:
     """prints legend section and returns implementation list"""
@@ -110,10 +181,20 @@ def generate_legend(conn: sqlalchemy.Engine, run_id: int) -> list[str]:
     return legends["postfix"].values.tolist()
 
 
-def generate_summary(data: pd.DataFrame, report_csv: bool):
-    """prints summary section"""
-    print("Summary of current implementation")
-    print("=================================")
+def generate_summary(
+    data: pd.DataFrame,
+    report_csv: bool,
+    title: str = "Summary of current implementation",
+):
+    """prints summary section
+
+    Threads column is omitted if no result was limited in threads.
+    """
+    if "threads" in data and (data["threads"] == 0).all():
+        data = data.drop("threads", axis=1)
+
+    print(title)
+    print("=" * len(title))
 
     if report_csv:
         print(data.to_csv(index=False))
@@ -130,8 +211,7 @@ def generate_impl_summary_report(
     """generate implementation summary report with status of each benchmark"""
     columns = [
         func.max(dm.Result.input_size_human).label("input_size"),
-        dm.Result.benchmark,
-        dm.Result.problem_preset,
+        *_RESULT_KEY,
     ]
 
     for impl in implementations:
@@ -151,10 +231,7 @@ def generate_impl_summary_report(
 
     sql = (
         sqlalchemy.select(*columns)
-        .group_by(
-            dm.Result.benchmark,
-            dm.Result.problem_preset,
-        )
+        .group_by(*_RESULT_KEY)
         .where(
             dm.Result.run_id == run_id,
         )
@@ -175,10 +252,44 @@ def generate_performance_report(
     report_csv: bool,
 ):
     """generate performance report with median times for each benchmark"""
+    generate_time_report(
+        conn,
+        run_id=run_id,
+        implementations=implementations,
+        report_csv=report_csv,
+        time_column=dm.Result.median_exec_time,
+    )
+
+
+def generate_compile_time_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    implementations: list[str],
+    report_csv: bool,
+):
+    """generate report with JIT compile times for each benchmark"""
+    generate_time_report(
+        conn,
+        run_id=run_id,
+        implementations=implementations,
+        report_csv=report_csv,
+        time_column=dm.Result.compile_time,
+        title="Compile time of current implementation",
+    )
+
+
+def generate_time_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    implementations: list[str],
+    report_csv: bool,
+    time_column: sqlalchemy.Column,
+    title: str = "Summary of current implementation",
+):
+    """generate report with times from time_column for each benchmark"""
     columns = [
         func.max(dm.Result.input_size_human).label("input_size"),
-        dm.Result.benchmark,
-        dm.Result.problem_preset,
+        *_RESULT_KEY,
     ]
 
     for impl in implementations:
@@ -188,7 +299,7 @@ def generate_performance_report(
                     case(
                         (
                             dm.Result.implementation == impl,
-                            dm.Result.median_exec_time,
+                            time_column,
                         ),
                     )
                 ),
@@ -198,10 +309,7 @@ def generate_performance_report(
 
     sql = (
         sqlalchemy.select(*columns)
-        .group_by(
-            dm.Result.benchmark,
-            dm.Result.problem_preset,
-        )
+        .group_by(*_RESULT_KEY)
         .where(dm.Result.run_id == run_id)
     )
 
@@ -229,7 +337,480 @@ def generate_performance_report(
 
             df.at[index, impl] = time
 
-    generate_summary(df, report_csv)
+    generate_summary(df, report_csv, title)
+
+
+def generate_roofline_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    report_csv: bool,
+):
+    """generate roofline report with achieved throughput of each result
+
+    Attained fraction is the ratio of achieved GFLOP/s to the roofline bound
+    of the host peak measured for the run. It is n/a if run was not
+    calibrated.
+    """
+    with Session(conn) as session:
+        run = session.get(dm.Run, run_id)
+        peak = MachinePeak(
+            gflops=run.peak_gflops if run else 0.0,
+            gbps=run.peak_gbps if run else 0.0,
+        )
+
+    sql = (
+        sqlalchemy.select(
+            dm.Result.benchmark,
+            dm.Result.problem_preset,
+            dm.Result.threads,
+            dm.Result.implementation,
+            dm.Result.flops,
+            dm.Result.traffic_bytes,
+            dm.Result.gflops,
+            dm.Result.gbps,
+        )
+        .where(
+            dm.Result.run_id == run_id,
+            dm.Result.error_state == "Success",
+            sqlalchemy.or_(dm.Result.flops > 0, dm.Result.traffic_bytes > 0),
+        )
+        .order_by(
+            dm.Result.benchmark,
+            dm.Result.problem_preset,
+            dm.Result.threads,
+            dm.Result.implementation,
+        )
+    )
+
+    df = pd.read_sql_query(sql=sql, con=conn.connect())
+
+    if df.empty:
+        return
+
+    NA = "n/a"
+
+    intensity = []
+    fraction = []
+    for _, row in df.iterrows():
+        attained = None
+        if row["traffic_bytes"] <= 0:
+            intensity.append(NA)
+            if peak.gflops > 0:
+                attained = row["gflops"] / peak.gflops
+        elif row["flops"] <= 0:
+            intensity.append(NA)
+            if peak.gbps > 0:
+                attained = row["gbps"] / peak.gbps
+        else:
+            ai = row["flops"] / row["traffic_bytes"]
+            intensity.append(round(ai, 3))
+            bound = attainable_gflops(ai, peak)
+            if bound is not None:
+                attained = row["gflops"] / bound
+
+        fraction.append(
+            NA if attained is None else str(round(attained * 100, 2)) + "%"
+        )
+
+    df = df.drop(["flops", "traffic_bytes"], axis=1)
+    df["gflops"] = df["gflops"].round(3)
+    df["gbps"] = df["gbps"].round(3)
+    df["flops_per_byte"] = intensity
+    df["attained_fraction"] = fraction
+
+    title = "Roofline of current implementation"
+    if peak.gflops > 0 and peak.gbps > 0:
+        title += (
+            f" (host peak {round(peak.gflops, 1)} GFLOP/s,"
+            + f" {round(peak.gbps, 1)} GB/s)"
+        )
+
+    generate_summary(df, report_csv, title)
+
+
+def generate_memory_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    implementations: list[str],
+    report_csv: bool,
+):
+    """generate report with peak RSS for each benchmark
+
+    Report is skipped if memory was not tracked during the run.
+    """
+    columns = [
+        func.max(dm.Result.input_size_human).label("input_size"),
+        *_RESULT_KEY,
+    ]
+
+    for impl in implementations:
+        columns.append(
+            func.max(
+                case(
+                    (
+                        dm.Result.implementation == impl,
+                        dm.Result.peak_rss,
+                    ),
+                )
+            ).label(impl),
+        )
+
+    sql = (
+        sqlalchemy.select(*columns)
+        .group_by(*_RESULT_KEY)
+        .where(dm.Result.run_id == run_id, dm.Result.peak_rss > 0)
+    )
+
+    df = pd.read_sql_query(sql=sql, con=conn.connect())
+
+    if df.empty:
+        return
+
+    NA = "n/a"
+    BYTES_IN_MEGABYTE: Final[float] = 1024 * 1024.0
+
+    for impl in implementations:
+        df[impl] = [
+            f"{rss / BYTES_IN_MEGABYTE:.1f}MB" if rss > 0 else NA
+            for rss in df[impl].fillna(0)
+        ]
+
+    generate_summary(df, report_csv, "Peak RSS of current implementation")
+
+
+def generate_device_time_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    implementations: list[str],
+    report_csv: bool,
+):
+    """generate report with median device time for each benchmark
+
+    Device time is the span of the device work, including idle gaps between
+    kernels. It is shown next to host execution time, that covers dispatch
+    of the device work. Report is skipped if device time was not measured
+    during the run.
+    """
+    columns = [
+        func.max(dm.Result.input_size_human).label("input_size"),
+        *_RESULT_KEY,
+    ]
+
+    for impl in implementations:
+        for column in ["median_exec_time", "median_device_time"]:
+            columns.append(
+                func.max(
+                    case(
+                        (
+                            dm.Result.implementation == impl,
+                            getattr(dm.Result, column),
+                        ),
+                    )
+                ).label(f"{impl}_{column}"),
+            )
+
+    sql = (
+        sqlalchemy.select(*columns)
+        .group_by(*_RESULT_KEY)
+        .where(dm.Result.run_id == run_id, dm.Result.median_device_time > 0)
+    )
+
+    df = pd.read_sql_query(sql=sql, con=conn.connect())
+
+    if df.empty:
+        return
+
+    NA = "n/a"
+    NANOSECONDS_IN_MILISECONDS: Final[float] = 1000 * 1000.0
+
+    for impl in implementations:
+        host = df.pop(f"{impl}_median_exec_time").fillna(0)
+        device = df.pop(f"{impl}_median_device_time").fillna(0)
+        df[impl] = [
+            f"{d / NANOSECONDS_IN_MILISECONDS:.3f}ms"
+            + f" (host {h / NANOSECONDS_IN_MILISECONDS:.3f}ms)"
+            if d > 0
+            else NA
+            for h, d in zip(host, device)
+        ]
+
+    generate_summary(
+        df, report_csv, "Median device span of current implementation"
+    )
+
+
+def generate_dispatch_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    implementations: list[str],
+    report_csv: bool,
+):
+    """generate report with dispatch-only and completed latency
+
+    Only results of asynchronous implementations are shown, that is the
+    ones that return noticeably before their work is completed.
+    """
+    columns = [
+        func.max(dm.Result.input_size_human).label("input_size"),
+        *_RESULT_KEY,
+    ]
+
+    for impl in implementations:
+        for column in ["median_dispatch_time", "median_exec_time"]:
+            columns.append(
+                func.max(
+                    case(
+                        (
+                            dm.Result.implementation == impl,
+                            getattr(dm.Result, column),
+                        ),
+                    )
+                ).label(f"{impl}_{column}"),
+            )
+
+    sql = (
+        sqlalchemy.select(*columns)
+        .group_by(*_RESULT_KEY)
+        .where(
+            dm.Result.run_id == run_id,
+            dm.Result.median_dispatch_time > 0,
+            dm.Result.median_dispatch_time
+            < ASYNC_DISPATCH_RATIO * dm.Result.median_exec_time,
+        )
+    )
+
+    df = pd.read_sql_query(sql=sql, con=conn.connect())
+
+    if df.empty:
+        return
+
+    NA = "n/a"
+    NANOSECONDS_IN_MILISECONDS: Final[float] = 1000 * 1000.0
+
+    for impl in implementations:
+        dispatch = df.pop(f"{impl}_median_dispatch_time").fillna(0)
+        completed = df.pop(f"{impl}_median_exec_time").fillna(0)
+        df[impl] = [
+            f"{d / NANOSECONDS_IN_MILISECONDS:.3f}ms"
+            + f" / {c / NANOSECONDS_IN_MILISECONDS:.3f}ms"
+            if d > 0
+            else NA
+            for d, c in zip(dispatch, completed)
+        ]
+
+    generate_summary(
+        df,
+        report_csv,
+        "Dispatch-only / completed latency of asynchronous implementations",
+    )
+
+
+def generate_profile_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    top: int,
+):
+    """prints the hottest functions of each profiled result"""
+    sql = (
+        sqlalchemy.select(
+            dm.Result.benchmark,
+            dm.Result.implementation,
+            dm.Result.problem_preset,
+            dm.Result.profile_path,
+        )
+        .where(
+            dm.Result.run_id == run_id,
+            dm.Result.profile_path.is_not(None),
+        )
+        .order_by(
+            dm.Result.benchmark,
+            dm.Result.problem_preset,
+            dm.Result.implementation,
+        )
+    )
+
+    with conn.connect() as connection:
+        profiles = connection.execute(sql).all()
+
+    if len(profiles) == 0:
+        return
+
+    title = "Hottest functions"
+    print(title)
+    print("=" * len(title))
+
+    for benchmark, implementation, preset, path in profiles:
+        print(f"{benchmark} ({implementation}, {preset}): {path}")
+
+        try:
+            functions = get_profiler_class_by_path(path).top_functions(
+                path, top
+            )
+        except Exception as e:
+            print(f"  could not read profile: {e}")
+            continue
+
+        for function, self_percent in functions:
+            print(f"  {self_percent:6.2f}%  {function}")
+
+    print("")
+
+
+def generate_scaling_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    report_csv: bool,
+):
+    """generate report with scaling exponents and crossovers of sweeps
+
+    Exponent k is fitted to the time ~ size**k model over the swept parameter.
+    Crossover is the swept parameter value where one implementation
+    overtakes the other. Report is skipped if run has no sweep results.
+    """
+    sql = (
+        sqlalchemy.select(
+            dm.Result.benchmark,
+            dm.Result.implementation,
+            dm.Result.problem_preset,
+            dm.Result.threads,
+            dm.Result.median_exec_time,
+        )
+        .where(
+            dm.Result.run_id == run_id,
+            dm.Result.error_state == "Success",
+            dm.Result.problem_preset.contains(SWEEP_PRESET_SEPARATOR),
+        )
+        .order_by(dm.Result.benchmark, dm.Result.implementation)
+    )
+
+    df = pd.read_sql_query(sql=sql, con=conn.connect())
+
+    points = [parse_sweep_preset(preset) for preset in df["problem_preset"]]
+    df["preset"] = [p[0] if p else None for p in points]
+    df["parameter"] = [p[1] if p else None for p in points]
+    df["size"] = [p[2] if p else None for p in points]
+    df = df.dropna(subset=["size"])
+
+    if df.empty:
+        return
+
+    rows = []
+    crossovers = []
+    for (benchmark, preset, parameter, threads), sweep in df.groupby(
+        ["benchmark", "preset", "parameter", "threads"]
+    ):
+        times = sweep.pivot_table(
+            index="size", columns="implementation", values="median_exec_time"
+        ).sort_index()
+
+        for impl in times.columns:
+            impl_times = times[impl].dropna()
+            exponent = fit_scaling_exponent(
+                impl_times.index.values, impl_times.values
+            )
+            if exponent is not None:
+                exponent = round(exponent, 3)
+            rows.append(
+                {
+                    "benchmark": benchmark,
+                    "preset": preset,
+                    "parameter": parameter,
+                    "threads": threads,
+                    "implementation": impl,
+                    "points": len(impl_times),
+                    "min_size": impl_times.index.min(),
+                    "max_size": impl_times.index.max(),
+                    "exponent": "n/a" if exponent is None else exponent,
+                }
+            )
+
+        for i, impl in enumerate(times.columns):
+            for other in times.columns[i + 1 :]:
+                for size in find_crossovers(
+                    times.index.values, times[impl].values, times[other].values
+                ):
+                    crossovers.append(
+                        {
+                            "benchmark": benchmark,
+                            "preset": preset,
+                            "parameter": parameter,
+                            "threads": threads,
+                            "implementations": f"{impl}/{other}",
+                            "crossover_size": round(size, 1),
+                        }
+                    )
+
+    generate_summary(
+        pd.DataFrame.from_records(rows),
+        report_csv,
+        "Scaling exponents of current implementation",
+    )
+
+    if crossovers:
+        generate_summary(
+            pd.DataFrame.from_records(crossovers),
+            report_csv,
+            "Crossover points of current implementation",
+        )
+
+
+def generate_thread_scaling_report(
+    conn: sqlalchemy.Engine,
+    run_id: int,
+    report_csv: bool,
+):
+    """generate report with strong scaling speedup and parallel efficiency
+
+    Speedup and efficiency are relative to the smallest thread count of each
+    implementation. Report is skipped if run was not limited to thread counts.
+    """
+    sql = (
+        sqlalchemy.select(
+            dm.Result.benchmark,
+            dm.Result.problem_preset,
+            dm.Result.implementation,
+            dm.Result.threads,
+            dm.Result.median_exec_time,
+        )
+        .where(
+            dm.Result.run_id == run_id,
+            dm.Result.error_state == "Success",
+            dm.Result.threads > 0,
+        )
+        .order_by(
+            dm.Result.benchmark,
+            dm.Result.problem_preset,
+            dm.Result.implementation,
+            dm.Result.threads,
+        )
+    )
+
+    df = pd.read_sql_query(sql=sql, con=conn.connect())
+
+    if df.empty:
+        return
+
+    NANOSECONDS_IN_MILISECONDS: Final[float] = 1000 * 1000.0
+
+    speedups = []
+    efficiencies = []
+    for _, curve in df.groupby(
+        ["benchmark", "problem_preset", "implementation"], sort=False
+    ):
+        speedup, efficiency = strong_scaling(
+            curve["threads"].values, curve["median_exec_time"].values
+        )
+        speedups.extend(speedup)
+        efficiencies.extend(efficiency)
+
+    df["median_exec_time"] = [
+        str(round(t / NANOSECONDS_IN_MILISECONDS, 2)) + "ms"
+        for t in df["median_exec_time"]
+    ]
+    df["speedup"] = [round(s, 2) for s in speedups]
+    df["efficiency"] = [str(round(e * 100, 1)) + "%" for e in efficiencies]
+
+    generate_summary(df, report_csv, "Strong scaling of current implementation")
 
 
 def generate_comparison_report(
@@ -245,8 +826,7 @@ def generate_comparison_report(
 
     columns = [
         func.max(dm.Result.input_size_human).label("input_size"),
-        dm.Result.benchmark,
-        dm.Result.problem_preset,
+        *_RESULT_KEY,
     ]
 
     for impl in implementations:
@@ -266,10 +846,7 @@ def generate_comparison_report(
 
     sql = (
         sqlalchemy.select(*columns)
-        .group_by(
-            dm.Result.benchmark,
-            dm.Result.problem_preset,
-        )
+        .group_by(*_RESULT_KEY)
         .where(dm.Result.run_id == run_id)
     )
 
@@ -294,6 +871,143 @@ def generate_comparison_report(
     generate_summary(df, report_csv)
 
 
+def generate_regression_report(
+    comparisons: list[Comparison],
+    baseline_run_ids: list[int],
+    candidate_run_id: int,
+    report_csv: bool,
+    changed_only: bool = False,
+) -> int:
+    """generate report of timing changes between baseline and candidate runs
+
+    Comparisons with insufficient samples are listed, but are not counted as
+    regressions.
+
+    Returns: number of regressions.
+    """
+    rows = [
+        {
+            "benchmark": c.benchmark,
+            "implementation": c.implementation,
+            "problem_preset": c.preset,
+            "threads": c.threads,
+            "baseline": str(round(c.baseline_median / 1e6, 3)) + "ms",
+            "candidate": str(round(c.candidate_median / 1e6, 3)) + "ms",
+            "change": f"{(c.ratio - 1) * 100:+.2f}%",
+            "change_ci": f"[{(c.ci_low - 1) * 100:+.2f}%,"
+            + f" {(c.ci_high - 1) * 100:+.2f}%]",
+            "p_value": "n/a" if c.p_value is None else f"{c.p_value:.3g}",
+            "status": c.status,
+        }
+        for c in comparisons
+        if not changed_only or c.status in [REGRESSION, IMPROVEMENT]
+    ]
+
+    baseline = ",".join(str(run_id) for run_id in baseline_run_ids)
+    title = f"Regressions of run {candidate_run_id} against run(s) {baseline}"
+
+    if rows:
+        generate_summary(pd.DataFrame.from_records(rows), report_csv, title)
+    else:
+        print(title)
+        print("=" * len(title))
+        print("No changes detected")
+
+    regressions = sum(c.status == REGRESSION for c in comparisons)
+    print(f"{regressions} regression(s) in {len(comparisons)} comparison(s)")
+
+    insufficient = sum(c.status == INSUFFICIENT_SAMPLES for c in comparisons)
+    if insufficient > 0:
+        logging.warning(
+            f"{insufficient} comparison(s) have less than {MIN_SAMPLES}"
+            + " samples and could not be classified"
+        )
+
+    return regressions
+
+
+def generate_trend_report(
+    conn: sqlalchemy.Engine,
+    report_csv: bool,
+    last_runs: int = 30,
+    machine_id: int = None,
+    benchmarks: set[str] = None,
+    implementations: set[str] = None,
+    html_path: str = None,
+    min_change: float = 0.05,
+):
+    """generate report with median times of each benchmark across runs
+
+    Change points are runs where level of the median time shifted by more
+    than min_change. If html_path is provided, report is also written as
+    HTML page with inline SVG sparklines.
+    """
+    df = read_trend(
+        conn,
+        last_runs=last_runs,
+        machine_id=machine_id,
+        benchmarks=benchmarks,
+        implementations=implementations,
+    )
+
+    if df.empty:
+        print("No successful results to build trend from")
+        return
+
+    pivot, change_points = summarize_trend(df, min_change)
+    run_ids = [c for c in pivot.columns if c != "change"]
+
+    NANOSECONDS_IN_MILISECONDS: Final[float] = 1000 * 1000.0
+    NA = "n/a"
+
+    summary = pivot.index.to_frame(index=False)
+    summary["runs"] = pivot[run_ids].count(axis=1).values
+    summary["last"] = [
+        str(round(t / NANOSECONDS_IN_MILISECONDS, 3)) + "ms"
+        for t in pivot[run_ids].ffill(axis=1).iloc[:, -1]
+    ]
+    summary["change"] = [
+        NA if pd.isna(c) else f"{c * 100:+.2f}%" for c in pivot["change"]
+    ]
+    summary["change_points"] = [
+        ",".join(str(run_id) for run_id in change_points[series]) or NA
+        for series in pivot.index
+    ]
+
+    title = f"Trend over runs {run_ids[0]}..{run_ids[-1]}"
+    if report_csv:
+        times = pivot[run_ids].reset_index(drop=True)
+        times.columns = [f"run_{run_id}" for run_id in run_ids]
+        generate_summary(pd.concat([summary, times], axis=1), True, title)
+    else:
+        generate_summary(summary, False, title)
+
+    if html_path is None:
+        return
+
+    sparklines = []
+    for series, row in pivot[run_ids].iterrows():
+        values = row.dropna()
+        sparklines.append(
+            sparkline_svg(
+                values.values,
+                [list(values.index).index(r) for r in change_points[series]],
+            )
+        )
+    summary.insert(len(SERIES_COLUMNS), "trend", sparklines)
+
+    with open(html_path, "w") as file:
+        file.write(
+            '<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+            + f"<title>{title}</title></head><body>"
+            + f"<h1>{title}</h1>"
+            + summary.to_html(index=False, escape=False)
+            + "</body></html>\n"
+        )
+
+    print(f"Trend report written to {html_path}")
+
+
 def get_failures_from_results(
     results_db: Union[str, sqlalchemy.Engine] = "results.db",
     run_id: int = None,
@@ -342,6 +1056,7 @@ def print_report(
     run_id: int,
     csv: bool,
     comparison_pairs: list[tuple[str, str]] = [],
+    profile_top: int = 0,
 ):
     generate_header(conn, run_id)
     implementations = generate_legend(conn, run_id)
@@ -360,6 +1075,52 @@ def print_report(
         report_csv=csv,
     )
 
+    generate_compile_time_report(
+        conn,
+        run_id=run_id,
+        implementations=implementations,
+        report_csv=csv,
+    )
+
+    generate_roofline_report(
+        conn,
+        run_id=run_id,
+        report_csv=csv,
+    )
+
+    generate_memory_report(
+        conn,
+        run_id=run_id,
+        implementations=implementations,
+        report_csv=csv,
+    )
+
+    generate_device_time_report(
+        conn,
+        run_id=run_id,
+        implementations=implementations,
+        report_csv=csv,
+    )
+
+    generate_dispatch_report(
+        conn,
+        run_id=run_id,
+        implementations=implementations,
+        report_csv=csv,
+    )
+
+    generate_scaling_report(
+        conn,
+        run_id=run_id,
+        report_csv=csv,
+    )
+
+    generate_thread_scaling_report(
+        conn,
+        run_id=run_id,
+        report_csv=csv,
+    )
+
     generate_comparison_report(
         conn,
         run_id=run_id,
@@ -368,6 +1129,9 @@ def print_report(
         report_csv=csv,
     )
 
+    if profile_top > 0:
+        generate_profile_report(conn, run_id=run_id, top=profile_top)
+
     unexpected_failures = get_unexpected_failures(conn, run_id=run_id)
 
     if len(unexpected_failures) > 0:
@@ -0,0 +1,260 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Roofline model helpers: benchmark work estimation and machine peaks."""
+
+import ast
+import logging
+import math
+import operator
+import time
+from dataclasses import dataclass
+from typing import Any, Union
+
+import numpy as np
+
+import dpbench.config as cfg
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+_FUNCTIONS = {
+    "min": min,
+    "max": max,
+    "log2": math.log2,
+    "sqrt": math.sqrt,
+    "ceil": math.ceil,
+    "floor": math.floor,
+}
+
+
+def _unsupported(node: ast.AST) -> ValueError:
+    return ValueError(f"unsupported expression {ast.dump(node)}")
+
+
+def _eval_expression(node: ast.Expression, variables: dict[str, Any]):
+    return _eval(node.body, variables)
+
+
+def _eval_constant(node: ast.Constant, variables: dict[str, Any]):
+    if not isinstance(node.value, (int, float)):
+        raise _unsupported(node)
+    return node.value
+
+
+def _eval_name(node: ast.Name, variables: dict[str, Any]):
+    if node.id not in variables:
+        raise ValueError(f"unknown variable {node.id}")
+    return variables[node.id]
+
+
+def _eval_binary(node: ast.BinOp, variables: dict[str, Any]):
+    op = _BINARY_OPERATORS.get(type(node.op))
+    if op is None:
+        raise _unsupported(node)
+    return op(_eval(node.left, variables), _eval(node.right, variables))
+
+
+def _eval_unary(node: ast.UnaryOp, variables: dict[str, Any]):
+    op = _UNARY_OPERATORS.get(type(node.op))
+    if op is None:
+        raise _unsupported(node)
+    return op(_eval(node.operand, variables))
+
+
+def _eval_call(node: ast.Call, variables: dict[str, Any]):
+    if (
+        not isinstance(node.func, ast.Name)
+        or node.func.id not in _FUNCTIONS
+        or node.keywords
+    ):
+        raise _unsupported(node)
+    return _FUNCTIONS[node.func.id](
+        *[_eval(arg, variables) for arg in node.args]
+    )
+
+
+_EVALUATORS = {
+    ast.Expression: _eval_expression,
+    ast.Constant: _eval_constant,
+    ast.Name: _eval_name,
+    ast.BinOp: _eval_binary,
+    ast.UnaryOp: _eval_unary,
+    ast.Call: _eval_call,
+}
+
+
+def _eval(node: ast.AST, variables: dict[str, Any]):
+    evaluator = _EVALUATORS.get(type(node))
+    if evaluator is None:
+        raise _unsupported(node)
+    return evaluator(node, variables)
+
+
+def evaluate_formula(formula: str, variables: dict[str, Any]) -> float:
+    """Evaluates arithmetic formula.
+
+    Only numbers, variables, arithmetic operators and a few math functions
+    (min, max, log2, sqrt, ceil, floor) are allowed.
+
+    Args:
+        formula: formula to evaluate, e.g. "2 * NI * NJ * NK".
+        variables: values of the variables used in formula.
+
+    Returns: value of the formula.
+
+    Raises:
+        ValueError: formula is not valid or uses unknown variables.
+    """
+    try:
+        tree = ast.parse(formula, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"invalid formula {formula}: {e}") from e
+
+    return float(_eval(tree, variables))
+
+
+def _float_itemsize(data: dict[str, Any], array_args: list[str]) -> int:
+    """Returns largest item size of the floating point input arrays."""
+    itemsizes = [
+        data[arg].dtype.itemsize
+        for arg in array_args
+        if isinstance(data.get(arg), np.ndarray)
+        and np.issubdtype(data[arg].dtype, np.floating)
+    ]
+
+    return max(itemsizes, default=8)
+
+
+def estimate_work(
+    config: cfg.Benchmark, preset: str, data: dict[str, Any]
+) -> tuple[float, float]:
+    """Estimates floating point operations and memory traffic of benchmark.
+
+    Args:
+        config: benchmark configuration with roofline formulas.
+        preset: preset which parameters are used in formulas.
+        data: input data of the benchmark.
+
+    Returns: (flops, bytes). Values are 0 if formulas are not provided or
+        could not be evaluated.
+    """
+    if config.roofline is None:
+        return 0.0, 0.0
+
+    variables = {
+        k: v
+        for k, v in config.parameters.get(preset, {}).items()
+        if isinstance(v, (int, float))
+    }
+    variables["itemsize"] = _float_itemsize(data, config.array_args)
+
+    work = []
+    for formula in [config.roofline.flops, config.roofline.bytes]:
+        if formula == "":
+            work.append(0.0)
+            continue
+
+        try:
+            work.append(evaluate_formula(formula, variables))
+        except (ValueError, ArithmeticError) as e:
+            logging.warning(
+                f"Could not evaluate roofline formula for {config.module_name}"
+                + f" ({preset}): {e}"
+            )
+            work.append(0.0)
+
+    return tuple(work)
+
+
+@dataclass
+class MachinePeak:
+    """Measured peak performance of the host."""
+
+    gflops: float = 0.0
+    gbps: float = 0.0
+
+
+def _best_time(fn, repeat: int) -> int:
+    fn()
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        fn()
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return max(best, 1)
+
+
+def measure_peak(
+    stream_size: int = 1 << 25,
+    dgemm_size: int = 2048,
+    repeat: int = 5,
+) -> MachinePeak:
+    """Measures host peak with STREAM triad and DGEMM calibration kernels.
+
+    Both kernels are executed with NumPy, so DGEMM uses all threads of the
+    BLAS library while triad runs on a single thread. Measured bandwidth is a
+    lower bound of the multi-socket machine bandwidth.
+
+    Args:
+        stream_size: number of float64 elements in each STREAM array.
+        dgemm_size: size of the square DGEMM matrices.
+        repeat: number of timed repetitions. The best one is used.
+
+    Returns: measured peak.
+    """
+    a = np.zeros(stream_size)
+    b = np.full(stream_size, 1.0)
+    c = np.full(stream_size, 2.0)
+    scalar = 3.0
+
+    def triad():
+        np.multiply(c, scalar, out=a)
+        np.add(a, b, out=a)
+
+    # Two passes: read c, write a, then read a and b, write a.
+    stream_bytes = 5 * stream_size * a.itemsize
+    gbps = stream_bytes / _best_time(triad, repeat)
+
+    x = np.full((dgemm_size, dgemm_size), 1.0)
+    y = np.full((dgemm_size, dgemm_size), 2.0)
+    z = np.empty((dgemm_size, dgemm_size))
+
+    def dgemm():
+        np.matmul(x, y, out=z)
+
+    gflops = 2 * dgemm_size**3 / _best_time(dgemm, repeat)
+
+    return MachinePeak(gflops=gflops, gbps=gbps)
+
+
+def attainable_gflops(
+    arithmetic_intensity: float, peak: MachinePeak
+) -> Union[float, None]:
+    """Returns roofline bound for the given arithmetic intensity.
+
+    Args:
+        arithmetic_intensity: flops per byte of memory traffic.
+        peak: machine peak.
+
+    Returns: attainable GFLOP/s or None if peak is unknown.
+    """
+    if peak.gflops <= 0 or peak.gbps <= 0:
+        return None
+
+    return min(peak.gflops, arithmetic_intensity * peak.gbps)
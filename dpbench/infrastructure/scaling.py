@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Scaling analysis: problem size sweeps, crossovers and strong scaling."""
+
+import copy
+import logging
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+
+import dpbench.config as cfg
+
+from .roofline import evaluate_formula
+
+# Separates base preset from the swept parameter in synthetic preset names,
+# e.g. S@npoints=1024.
+SWEEP_PRESET_SEPARATOR = "@"
+
+_DEFAULT_SWEEP_FACTOR = 2
+
+
+@dataclass
+class Sweep:
+    """Geometric range of values of a single preset parameter."""
+
+    parameter: str
+    values: list[Union[int, float]]
+
+
+def _sweep_value(formula: str) -> Union[int, float]:
+    value = evaluate_formula(formula, {})
+    return int(value) if value.is_integer() else value
+
+
+def parse_sweep(spec: str) -> Sweep:
+    """Parses sweep specification.
+
+    Specification has form name=start..stop[:factor], where start, stop and
+    factor are arithmetic expressions, e.g. npoints=2**10..2**24 or
+    npoints=1000..10**6:10. Values grow geometrically by factor, that is 2 by
+    default, and stop is included if it is reached exactly.
+
+    Args:
+        spec: sweep specification.
+
+    Returns: parsed sweep.
+
+    Raises:
+        ValueError: specification is not valid.
+    """
+    parameter, sep, value_range = spec.partition("=")
+    start, sep_range, stop = value_range.partition("..")
+    if not sep or not sep_range or not parameter.strip():
+        raise ValueError(f"expected name=start..stop[:factor], got {spec}")
+
+    stop, _, factor = stop.partition(":")
+
+    start = _sweep_value(start)
+    stop = _sweep_value(stop)
+    factor = _sweep_value(factor) if factor else _DEFAULT_SWEEP_FACTOR
+
+    if start <= 0 or stop < start or factor <= 1:
+        raise ValueError(
+            f"expected 0 < start <= stop and factor > 1, got {spec}"
+        )
+
+    values = []
+    value = start
+    while value <= stop:
+        values.append(value)
+        value *= factor
+
+    return Sweep(parameter=parameter.strip(), values=values)
+
+
+def make_sweep_preset(
+    preset: str, parameter: str, value: Union[int, float]
+) -> str:
+    """Returns name of the synthetic preset of the sweep point."""
+    return f"{preset}{SWEEP_PRESET_SEPARATOR}{parameter}={value}"
+
+
+def parse_sweep_preset(
+    preset: str,
+) -> Union[tuple[str, str, float], None]:
+    """Splits synthetic preset name into base preset, parameter and value.
+
+    Returns: (preset, parameter, value) or None if preset is not synthetic.
+    """
+    base, sep, point = preset.partition(SWEEP_PRESET_SEPARATOR)
+    parameter, sep_value, value = point.partition("=")
+    if not sep or not sep_value:
+        return None
+
+    try:
+        return base, parameter, float(value)
+    except ValueError:
+        return None
+
+
+def add_sweep_presets(
+    config: cfg.Benchmark, preset: str, sweep: Sweep
+) -> list[str]:
+    """Adds synthetic presets of the sweep points to the benchmark config.
+
+    Every synthetic preset is a copy of the base preset with the swept
+    parameter replaced.
+
+    Args:
+        config: benchmark configuration to update.
+        preset: base preset.
+        sweep: sweep to generate presets for.
+
+    Returns: names of the added presets. Empty if base preset does not have
+        the swept parameter.
+    """
+    base = config.parameters.get(preset)
+    if base is None or sweep.parameter not in base:
+        logging.warning(
+            f"{config.module_name} does not have {sweep.parameter} parameter"
+            + f" in {preset} preset, skipping sweep"
+        )
+        return []
+
+    presets = []
+    for value in sweep.values:
+        name = make_sweep_preset(preset, sweep.parameter, value)
+        parameters = copy.deepcopy(base)
+        parameters[sweep.parameter] = value
+        config.parameters[name] = parameters
+        presets.append(name)
+
+    return presets
+
+
+def fit_scaling_exponent(
+    sizes: list[float], times: list[float]
+) -> Union[float, None]:
+    """Fits empirical scaling exponent k of the time ~ size**k model.
+
+    Exponent is the slope of the least squares line in log-log space.
+
+    Args:
+        sizes: problem sizes.
+        times: execution times of the problem sizes.
+
+    Returns: exponent or None if there are less than two valid points.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    times = np.asarray(times, dtype=np.float64)
+    valid = (sizes > 0) & (times > 0)
+    if np.unique(sizes[valid]).size < 2:
+        return None
+
+    slope, _ = np.polyfit(np.log(sizes[valid]), np.log(times[valid]), 1)
+
+    return float(slope)
+
+
+def find_crossovers(
+    sizes: list[float], times: list[float], other_times: list[float]
+) -> list[float]:
+    """Finds problem sizes where one implementation overtakes the other.
+
+    Crossover is a sign change of log(times / other_times) between adjacent
+    points. Its size is interpolated linearly in log-log space.
+
+    Args:
+        sizes: problem sizes in ascending order.
+        times: execution times of the first implementation.
+        other_times: execution times of the second implementation.
+
+    Returns: sizes of the crossover points.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    times = np.asarray(times, dtype=np.float64)
+    other_times = np.asarray(other_times, dtype=np.float64)
+
+    valid = (sizes > 0) & (times > 0) & (other_times > 0)
+    log_sizes = np.log(sizes[valid])
+    log_ratio = np.log(times[valid] / other_times[valid])
+
+    crossovers = []
+    for i in range(len(log_ratio) - 1):
+        r0, r1 = log_ratio[i], log_ratio[i + 1]
+        if r0 == 0:
+            crossovers.append(float(np.exp(log_sizes[i])))
+        elif r0 * r1 < 0:
+            t = r0 / (r0 - r1)
+            crossovers.append(
+                float(
+                    np.exp(log_sizes[i] + t * (log_sizes[i + 1] - log_sizes[i]))
+                )
+            )
+
+    return crossovers
+
+
+def strong_scaling(
+    threads: list[int], times: list[float]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Computes strong scaling speedup and parallel efficiency.
+
+    Both are relative to the smallest thread count, so efficiency of the
+    baseline is 1 even if it was measured with more than one thread.
+
+    Args:
+        threads: thread counts in ascending order.
+        times: execution times of the thread counts.
+
+    Returns: (speedup, efficiency) for every thread count.
+    """
+    threads = np.asarray(threads, dtype=np.float64)
+    times = np.asarray(times, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        speedup = np.where(times > 0, times[0] / times, np.nan)
+        efficiency = speedup * threads[0] / threads
+
+    return speedup, efficiency
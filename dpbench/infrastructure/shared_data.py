@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tools to hand off benchmark data between processes via shared memory."""
+
+import logging
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+
+
+@dataclass
+class SharedArray:
+    """Descriptor of an array placed into a shared memory segment."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+    strides: tuple[int, ...]
+
+
+def share_data(
+    data: dict[str, Any]
+) -> tuple[dict[str, Any], list[shared_memory.SharedMemory]]:
+    """Copies arrays from the data dictionary into shared memory segments.
+
+    Arrays are replaced with their SharedArray descriptors, other values are
+    kept as is. Memory layout of the arrays is preserved.
+
+    Args:
+        data: dictionary with data to share.
+
+    Returns: dictionary with descriptors and list of the created segments. It
+        is up to the caller to close and unlink segments once they are no
+        longer needed.
+    """
+    descriptors = dict()
+    segments = []
+
+    for key, value in data.items():
+        if not isinstance(value, np.ndarray) or value.dtype.hasobject:
+            descriptors[key] = value
+            continue
+
+        segment = shared_memory.SharedMemory(
+            create=True, size=max(value.nbytes, 1)
+        )
+        segments.append(segment)
+
+        order = (
+            "F"
+            if value.flags["F_CONTIGUOUS"] and not value.flags["C_CONTIGUOUS"]
+            else "C"
+        )
+        shared = np.ndarray(
+            value.shape, dtype=value.dtype, buffer=segment.buf, order=order
+        )
+        np.copyto(shared, value)
+
+        descriptors[key] = SharedArray(
+            name=segment.name,
+            shape=shared.shape,
+            dtype=shared.dtype.str,
+            strides=shared.strides,
+        )
+
+        del shared
+
+    return descriptors, segments
+
+
+def attach_data(
+    descriptors: dict[str, Any]
+) -> tuple[dict[str, Any], list[shared_memory.SharedMemory]]:
+    """Wraps shared memory segments into read-only arrays without copying.
+
+    Args:
+        descriptors: dictionary returned by share_data.
+
+    Returns: data dictionary and list of the attached segments. Segments must
+        be kept alive while arrays are in use and closed afterwards.
+    """
+    data = dict()
+    segments = []
+
+    for key, value in descriptors.items():
+        if not isinstance(value, SharedArray):
+            data[key] = value
+            continue
+
+        segment = shared_memory.SharedMemory(name=value.name)
+        segments.append(segment)
+
+        array = np.ndarray(
+            value.shape,
+            dtype=np.dtype(value.dtype),
+            buffer=segment.buf,
+            strides=value.strides,
+        )
+        # Data is shared with concurrently running processes.
+        array.flags.writeable = False
+
+        data[key] = array
+
+    return data, segments
+
+
+def close_segments(
+    segments: list[shared_memory.SharedMemory], unlink: bool = False
+):
+    """Closes shared memory segments and optionally destroys them.
+
+    Args:
+        segments: segments to close.
+        unlink: set if segments must be destroyed.
+    """
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            logging.warning(
+                f"Shared memory segment {segment.name} is still in use"
+            )
+
+        if unlink:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Statistics helpers used to judge convergence of timing measurements."""
+
+import dataclasses
+import logging
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+# Minimal number of repetitions before convergence is checked. Fewer samples
+# give unreliable estimates of both standard deviation and median interval.
+MIN_ADAPTIVE_REPEAT = 5
+# Maximal share of the run timeout that time budget may take. The rest is left
+# for setup, warmup and the repetition that exceeds the budget.
+MAX_BUDGET_TIMEOUT_SHARE = 0.5
+
+
+def relative_std(samples: list[float]) -> float:
+    """Calculates relative standard deviation (coefficient of variation).
+
+    Args:
+        samples: measured values.
+
+    Returns: sample standard deviation divided by mean, or inf if it can not be
+        calculated.
+    """
+    if len(samples) < 2:
+        return math.inf
+
+    mean = np.mean(samples)
+    if mean == 0:
+        return math.inf
+
+    return float(np.std(samples, ddof=1) / mean)
+
+
+def median_confidence_interval(
+    samples: list[float], confidence: float = 0.95
+) -> tuple[float, float]:
+    """Calculates distribution-free confidence interval of the median.
+
+    Interval is built on order statistics using normal approximation of the
+    binomial distribution, so it does not assume normally distributed samples
+    and is robust to outliers.
+
+    Args:
+        samples: measured values.
+        confidence: confidence level of the interval.
+
+    Returns: lower and upper bounds of the interval. Bounds are the sample
+        extrema if there are too few samples for the requested confidence.
+    """
+    sorted_samples = np.sort(samples)
+    n = len(sorted_samples)
+
+    # Two-sided z-score for the confidence level.
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    half_width = z * math.sqrt(n) / 2
+
+    lower = max(math.floor(n / 2 - half_width), 0)
+    upper = min(math.ceil(n / 2 + half_width), n - 1)
+
+    return float(sorted_samples[lower]), float(sorted_samples[upper])
+
+
+def relative_median_ci_width(
+    samples: list[float], confidence: float = 0.95
+) -> float:
+    """Calculates half width of the median confidence interval relative to
+    median.
+
+    Args:
+        samples: measured values.
+        confidence: confidence level of the interval.
+
+    Returns: relative half width of the interval, or inf if it can not be
+        calculated.
+    """
+    if len(samples) < 2:
+        return math.inf
+
+    median = np.median(samples)
+    if median == 0:
+        return math.inf
+
+    lower, upper = median_confidence_interval(samples, confidence)
+
+    return float((upper - lower) / 2 / median)
+
+
+@dataclass
+class ConvergenceCriteria:
+    """Stop criteria of the adaptive repetition.
+
+    Repetition stops once either relative standard deviation or relative half
+    width of the median confidence interval drops below target_rsd, or once
+    measurement takes longer than time_budget. Budget is enforced even before
+    min_repeat samples are collected, such measurements are not converged.
+    """
+
+    target_rsd: float = 0.02
+    time_budget: float = 30.0
+    min_repeat: int = MIN_ADAPTIVE_REPEAT
+    max_repeat: int = 0
+
+    def converged(self, samples: list[float]) -> bool:
+        """Checks if samples are precise enough to stop measuring.
+
+        Args:
+            samples: measured values.
+
+        Returns: True if measurement converged.
+        """
+        if len(samples) < self.min_repeat:
+            return False
+
+        return (
+            relative_std(samples) <= self.target_rsd
+            or relative_median_ci_width(samples) <= self.target_rsd
+        )
+
+    def exhausted(self, repeats: int, elapsed_time: float) -> bool:
+        """Checks if there is no budget left for another repetition.
+
+        Args:
+            repeats: number of performed repetitions.
+            elapsed_time: time in seconds spent on repetitions.
+
+        Returns: True if measurement must stop.
+        """
+        if self.max_repeat and repeats >= self.max_repeat:
+            return True
+
+        # Stop once there is at least one sample to report, otherwise long
+        # running benchmarks get killed by timeout.
+        return repeats > 0 and elapsed_time >= self.time_budget
+
+    def fit_timeout(self, timeout: float) -> "ConvergenceCriteria":
+        """Limits time budget to the share of the run timeout.
+
+        Args:
+            timeout: timeout of the run in seconds.
+
+        Returns: criteria with time budget that fits the timeout.
+        """
+        max_budget = timeout * MAX_BUDGET_TIMEOUT_SHARE
+        if self.time_budget <= max_budget:
+            return self
+
+        logging.warning(
+            f"Time budget {self.time_budget}s does not fit timeout {timeout}s,"
+            + f" it is reduced to {max_budget}s"
+        )
+
+        return dataclasses.replace(self, time_budget=max_budget)
@@ -5,6 +5,8 @@
 import gc
 import time
 
+from .perf_counters import PerfCounters
+
 
 class timer:
     """A contextmanager class to capture the timing for a section of code.
@@ -18,22 +20,42 @@ class timer:
 
             print(t.get_elapsed_time())
 
+    If counters are provided, they are collected for the same section and
+    available with get_counter_values().
     """
 
-    def __init__(self, GCOff: bool = False) -> None:
+    def __init__(
+        self, GCOff: bool = False, counters: PerfCounters = None
+    ) -> None:
         self.GCOff = GCOff
+        self.counters = counters
+        self._counter_values = {}
 
     def __enter__(self):
         if not self.GCOff:
             self.gcold = gc.isenabled()
             gc.disable()
+        if self.counters:
+            self.counters.start()
         self._t = time.perf_counter_ns()
         return self
 
     def __exit__(self, type, value, traceback):
         self._t = time.perf_counter_ns() - self._t
+        if self.counters:
+            self._counter_values = self.counters.stop()
         if self.gcold:
             gc.enable()
 
     def get_elapsed_time(self):
         return self._t
+
+    def get_split_time(self) -> int:
+        """Returns time elapsed since entering the context in nanoseconds.
+
+        It is valid only inside the context.
+        """
+        return time.perf_counter_ns() - self._t
+
+    def get_counter_values(self) -> dict[str, int]:
+        return self._counter_values
@@ -0,0 +1,252 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Historical trends of benchmark timings over many runs."""
+
+import math
+from typing import Union
+
+import numpy as np
+import pandas as pd
+import sqlalchemy
+from sqlalchemy.orm import Session
+
+from . import datamodel as dm
+
+# Minimal number of runs on each side of a change point.
+MIN_SEGMENT = 2
+# Lower bound of relative run-to-run noise, so perfectly stable series do not
+# get split on tiny shifts.
+MIN_NOISE = 0.01
+
+SERIES_COLUMNS = ["benchmark", "implementation", "problem_preset", "threads"]
+
+
+def resolve_machine_id(
+    conn: sqlalchemy.Engine, fingerprint: str = None
+) -> Union[int, None]:
+    """Resolves machine to read trend for.
+
+    Args:
+        conn: database connection.
+        fingerprint: fingerprint of the machine. If not provided, machine of
+            the latest run is used.
+
+    Returns: machine id or None if the latest run has no machine recorded.
+
+    Raises:
+        ValueError: no machine with the fingerprint was found.
+    """
+    with Session(conn) as session:
+        if fingerprint is None:
+            return session.scalars(
+                sqlalchemy.select(dm.Run.machine_id)
+                .order_by(dm.Run.id.desc())
+                .limit(1)
+            ).first()
+
+        machine_id = session.scalars(
+            sqlalchemy.select(dm.Machine.id).where(
+                dm.Machine.fingerprint == fingerprint
+            )
+        ).first()
+
+    if machine_id is None:
+        raise ValueError(f"no machine with fingerprint {fingerprint}")
+
+    return machine_id
+
+
+def read_trend(
+    conn: sqlalchemy.Engine,
+    last_runs: int = 30,
+    machine_id: int = None,
+    benchmarks: set[str] = None,
+    implementations: set[str] = None,
+) -> pd.DataFrame:
+    """Reads median execution times of the successful results of many runs.
+
+    Filtering is done in SQL, so the query is served by the results index on
+    (benchmark, implementation, problem_preset, run_id).
+
+    Args:
+        conn: database connection.
+        last_runs: number of the most recent runs to read.
+        machine_id: only read runs executed on this machine.
+        benchmarks: only read these benchmarks.
+        implementations: only read these implementations.
+
+    Returns: data frame with run_id, created_at, benchmark, implementation,
+        problem_preset, threads and median_exec_time columns ordered by run.
+    """
+    runs = sqlalchemy.select(dm.Run.id, dm.Run.created_at)
+    if machine_id is not None:
+        runs = runs.where(dm.Run.machine_id == machine_id)
+    runs = runs.order_by(dm.Run.id.desc()).limit(last_runs).subquery()
+
+    sql = (
+        sqlalchemy.select(
+            dm.Result.run_id,
+            runs.c.created_at,
+            dm.Result.benchmark,
+            dm.Result.implementation,
+            dm.Result.problem_preset,
+            dm.Result.threads,
+            dm.Result.median_exec_time,
+        )
+        .join(runs, runs.c.id == dm.Result.run_id)
+        .where(dm.Result.error_state == "Success")
+        .order_by(dm.Result.run_id)
+    )
+    if benchmarks:
+        sql = sql.where(dm.Result.benchmark.in_(benchmarks))
+    if implementations:
+        sql = sql.where(dm.Result.implementation.in_(implementations))
+
+    with conn.connect() as connection:
+        return pd.read_sql_query(sql=sql, con=connection)
+
+
+def detect_change_points(
+    values: list[float],
+    min_change: float = 0.05,
+    min_segment: int = MIN_SEGMENT,
+) -> list[int]:
+    """Detects shifts of the level of timing series.
+
+    Binary segmentation of log-times: series is split where the split reduces
+    squared error by more than BIC penalty 2 * log(n) * noise variance. Noise
+    is estimated from differences of adjacent values, so it is not inflated
+    by the shifts themselves. Shifts smaller than min_change are dropped.
+
+    Args:
+        values: positive timings in run order.
+        min_change: minimal relative change of level to report.
+        min_segment: minimal number of values on each side of a change.
+
+    Returns: indices of the first value after each change.
+    """
+    x = np.log(np.asarray(values, dtype=np.float64))
+    n = len(x)
+    if n < 2 * min_segment:
+        return []
+
+    diffs = np.diff(x)
+    # MAD of differences scaled to standard deviation of a single value.
+    mad = np.median(np.abs(diffs - np.median(diffs)))
+    noise = max(mad / 0.6745 / math.sqrt(2), MIN_NOISE)
+    penalty = 2 * math.log(n) * noise**2
+
+    change_points = []
+    segments = [(0, n)]
+    while segments:
+        lo, hi = segments.pop()
+        size = hi - lo
+        if size < 2 * min_segment:
+            continue
+
+        segment = x[lo:hi]
+        k = np.arange(min_segment, size - min_segment + 1)
+        cumsum = np.cumsum(segment)
+        left_mean = cumsum[k - 1] / k
+        right_mean = (cumsum[-1] - cumsum[k - 1]) / (size - k)
+        gains = k * (size - k) / size * (left_mean - right_mean) ** 2
+
+        best = int(np.argmax(gains))
+        if gains[best] <= penalty:
+            continue
+
+        split = lo + int(k[best])
+        change = math.exp(right_mean[best] - left_mean[best]) - 1
+        if abs(change) >= min_change:
+            change_points.append(split)
+        segments += [(lo, split), (split, hi)]
+
+    return sorted(change_points)
+
+
+def sparkline_svg(
+    values: list[float],
+    change_points: list[int] = None,
+    width: int = 160,
+    height: int = 24,
+) -> str:
+    """Renders series as inline SVG sparkline.
+
+    Args:
+        values: series values.
+        change_points: indices of values to mark as changes.
+        width: width of the image in pixels.
+        height: height of the image in pixels.
+
+    Returns: svg element.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    pad = 2
+    span = values.max() - values.min() if len(values) else 0
+    scale = (height - 2 * pad) / span if span > 0 else 0
+    step = (width - 2 * pad) / max(len(values) - 1, 1)
+
+    points = [
+        (pad + i * step, height - pad - (v - values.min()) * scale)
+        for i, v in enumerate(values)
+    ]
+    if span == 0:
+        points = [(x, height / 2) for x, _ in points]
+
+    polyline = " ".join(f"{x:.1f},{y:.1f}" for x, y in points)
+    markers = "".join(
+        f'<circle cx="{points[i][0]:.1f}" cy="{points[i][1]:.1f}" r="2"'
+        + ' fill="red"/>'
+        for i in change_points or []
+    )
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}"'
+        + f' height="{height}" viewBox="0 0 {width} {height}">'
+        + f'<polyline points="{polyline}" fill="none" stroke="steelblue"'
+        + ' stroke-width="1.5"/>'
+        + markers
+        + "</svg>"
+    )
+
+
+def summarize_trend(
+    df: pd.DataFrame, min_change: float = 0.05
+) -> tuple[pd.DataFrame, dict[tuple, list[int]]]:
+    """Pivots trend into series per benchmark and detects change points.
+
+    Args:
+        df: trend read by read_trend.
+        min_change: minimal relative change of level to report.
+
+    Returns: (pivot, change points). Pivot has a row per series, a column per
+        run with median time and change column with relative change of the
+        last level. Change points are run ids keyed by series.
+    """
+    pivot = df.pivot_table(
+        index=SERIES_COLUMNS,
+        columns="run_id",
+        values="median_exec_time",
+        aggfunc="first",
+    )
+
+    change_points: dict[tuple, list[int]] = {}
+    last_change: list[Union[float, None]] = []
+    for series, row in pivot.iterrows():
+        values = row.dropna()
+        indices = detect_change_points(values.values, min_change)
+        change_points[series] = [int(values.index[i]) for i in indices]
+
+        if indices:
+            start = indices[-2] if len(indices) > 1 else 0
+            before = np.median(values.values[start : indices[-1]])
+            after = np.median(values.values[indices[-1] :])
+            last_change.append(after / before - 1)
+        else:
+            last_change.append(None)
+
+    pivot["change"] = last_change
+
+    return pivot, change_points
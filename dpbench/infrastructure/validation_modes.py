@@ -0,0 +1,282 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Validation modes configured per benchmark output in bench_info.
+
+Mode is a function that compares expected and actual output with the
+tolerance of the selected precision and returns whether output is valid with
+error statistics for logging. New modes are added with
+register_validation_mode.
+"""
+
+import logging
+from typing import Any, Callable, Union
+
+import numpy as np
+
+import dpbench.config as cfg
+from dpbench.config.benchmark import Validation
+
+from .benchmark_validation import (
+    ATOL,
+    MAX_REPORTED_MISMATCHES,
+    RTOL,
+    ArrayDiff,
+    compare_arrays,
+    validate_two_lists_of_array,
+)
+
+ValidationMode = Callable[[Any, Any, cfg.Tolerance], tuple[bool, ArrayDiff]]
+
+_VALIDATION_MODES: dict[str, ValidationMode] = {}
+
+
+def register_validation_mode(
+    name: str,
+) -> Callable[[ValidationMode], ValidationMode]:
+    """Decorator that registers validation mode under the name."""
+
+    def register(mode: ValidationMode) -> ValidationMode:
+        _VALIDATION_MODES[name] = mode
+        return mode
+
+    return register
+
+
+def get_validation_mode(name: str) -> ValidationMode:
+    """Returns validation mode registered under the name.
+
+    Raises:
+        ValueError: mode is not registered.
+    """
+    mode = _VALIDATION_MODES.get(name)
+    if mode is None:
+        raise ValueError(
+            f"unknown validation mode {name}, expected one of"
+            + f" {sorted(_VALIDATION_MODES)}"
+        )
+
+    return mode
+
+
+def _compare(
+    expected: Any, actual: Any, tolerance: cfg.Tolerance
+) -> tuple[bool, ArrayDiff]:
+    diff = compare_arrays(
+        expected,
+        actual,
+        rtol=tolerance.rel if tolerance.rel is not None else RTOL,
+        atol=tolerance.abs if tolerance.abs is not None else ATOL,
+        ulp=tolerance.ulp,
+    )
+
+    return diff.mismatches == 0, diff
+
+
+@register_validation_mode("allclose")
+def allclose(
+    expected: Any, actual: Any, tolerance: cfg.Tolerance
+) -> tuple[bool, ArrayDiff]:
+    """Compares arrays element-wise."""
+    return _compare(expected, actual, tolerance)
+
+
+@register_validation_mode("sign_invariant")
+def sign_invariant(
+    expected: Any, actual: Any, tolerance: cfg.Tolerance
+) -> tuple[bool, ArrayDiff]:
+    """Compares arrays element-wise up to the sign of each column, e.g.
+    eigenvectors or projections onto them. One dimensional array is a single
+    column.
+    """
+    expected = np.asarray(expected)
+    actual = np.asarray(actual)
+    if expected.shape != actual.shape or expected.ndim == 0:
+        return _compare(expected, actual, tolerance)
+
+    columns = expected.shape[-1] if expected.ndim > 1 else 1
+    signs = np.sign(
+        np.einsum(
+            "ij,ij->j",
+            expected.reshape(-1, columns),
+            actual.reshape(-1, columns),
+        )
+    )
+    signs[signs == 0] = 1
+
+    return _compare(
+        expected, actual * (signs if expected.ndim > 1 else signs[0]), tolerance
+    )
+
+
+def _allowed_mismatches(size: int, tolerance: cfg.Tolerance) -> float:
+    """Returns number of mismatching elements allowed by abs (count) and rel
+    (fraction) tolerance."""
+    return (tolerance.abs or 0) + (tolerance.rel or 0) * size
+
+
+@register_validation_mode("label_permutation")
+def label_permutation(
+    expected: Any, actual: Any, tolerance: cfg.Tolerance
+) -> tuple[bool, ArrayDiff]:
+    """Compares labels up to one-to-one renaming, e.g. cluster ids.
+
+    Labels are matched greedily starting from the most frequent pairs of
+    expected and actual labels. Tolerance abs is the number and rel is the
+    fraction of elements allowed to mismatch after renaming.
+    """
+    expected = np.asarray(expected).reshape(-1)
+    actual = np.asarray(actual).reshape(-1)
+    diff = ArrayDiff(size=expected.size)
+    if expected.shape != actual.shape:
+        diff.mismatches = diff.size
+        return False, diff
+    if expected.size == 0:
+        return True, diff
+
+    pairs, counts = np.unique(
+        np.stack([expected, actual]), axis=1, return_counts=True
+    )
+
+    mapping = {}
+    used = set()
+    for i in np.argsort(-counts, kind="stable"):
+        e, a = pairs[0, i].item(), pairs[1, i].item()
+        if e not in mapping and a not in used:
+            mapping[e] = a
+            used.add(a)
+
+    labels = np.unique(expected)
+    matched = np.array([label.item() in mapping for label in labels])
+    renamed = np.array(
+        [mapping.get(label.item(), 0) for label in labels], dtype=actual.dtype
+    )
+
+    index = np.searchsorted(labels, expected)
+    mismatch = ~matched[index] | (renamed[index] != actual)
+
+    diff.mismatches = int(np.count_nonzero(mismatch))
+    diff.first_mismatches = [
+        (int(i),) for i in np.flatnonzero(mismatch)[:MAX_REPORTED_MISMATCHES]
+    ]
+
+    return diff.mismatches <= _allowed_mismatches(diff.size, tolerance), diff
+
+
+@register_validation_mode("row_permutation")
+def row_permutation(
+    expected: Any, actual: Any, tolerance: cfg.Tolerance
+) -> tuple[bool, ArrayDiff]:
+    """Compares arrays element-wise up to the order of rows, e.g. cluster
+    centroids. Rows are sorted lexicographically before comparison.
+    """
+    expected = np.asarray(expected)
+    actual = np.asarray(actual)
+    if expected.shape != actual.shape or expected.ndim == 0:
+        return _compare(expected, actual, tolerance)
+
+    def _sort_rows(array: np.ndarray) -> np.ndarray:
+        rows = array.reshape(array.shape[0], -1)
+        return array[np.lexsort(rows.T[::-1])]
+
+    return _compare(_sort_rows(expected), _sort_rows(actual), tolerance)
+
+
+def _count_labels(value: Any) -> Union[int, float]:
+    """Returns scalar value as is and number of distinct non negative labels
+    of an array, so noise labeled as -1 is not counted."""
+    value = np.asarray(value)
+    if value.size == 1:
+        return value.item()
+
+    return int(np.count_nonzero(np.unique(value) >= 0))
+
+
+@register_validation_mode("count")
+def count(
+    expected: Any, actual: Any, tolerance: cfg.Tolerance
+) -> tuple[bool, ArrayDiff]:
+    """Compares number of clusters, e.g. returned by the benchmark or
+    counted from labels. Counts must be equal unless abs or rel tolerance is
+    set.
+    """
+    return _compare(
+        _count_labels(expected),
+        _count_labels(actual),
+        cfg.Tolerance(abs=tolerance.abs or 0, rel=tolerance.rel or 0),
+    )
+
+
+def _validate_output(
+    expected: Any,
+    actual: Any,
+    validation: Validation,
+    precision: str,
+) -> bool:
+    if not isinstance(expected, (tuple, list)):
+        expected = [expected]
+    if not isinstance(actual, (tuple, list)):
+        actual = [actual]
+
+    validations = validation
+    if not isinstance(validations, list):
+        validations = [validation] * len(expected)
+    if len(validations) != len(expected):
+        raise ValueError(
+            f"expected validation for {len(expected)} arrays, got"
+            + f" {len(validations)}"
+        )
+
+    valid = True
+    for i, (r, v, spec) in enumerate(zip(expected, actual, validations)):
+        mode = get_validation_mode(spec.mode)
+        array_valid, diff = mode(r, v, spec.get_tolerance(precision))
+        if not array_valid:
+            valid = False
+            logging.error(
+                f"Array {i} did not validate in {spec.mode} mode:"
+                + f" {diff.describe()}"
+            )
+
+    return valid
+
+
+def validate_outputs(
+    expected: dict[str, any],
+    actual: dict[str, any],
+    spec: dict[str, Validation],
+    precision: str = "",
+    rel_error=1e-05,
+) -> bool:
+    """Validates outputs with the modes and tolerances of the benchmark.
+
+    Outputs without validation spec are validated by the default
+    validation.
+
+    Args:
+        expected: expected values.
+        actual: actual values.
+        spec: validation of the outputs keyed by output name.
+        precision: precision of the benchmark data, e.g. single.
+        rel_error: maximum acceptable relative error of outputs without
+            validation spec.
+
+    Returns: true, if all outputs are valid.
+    """
+    for key in expected.keys():
+        validation = spec.get(key)
+        if validation is None:
+            valid = validate_two_lists_of_array(
+                expected[key], actual[key], rel_error=rel_error
+            )
+        else:
+            valid = _validate_output(
+                expected[key], actual[key], validation, precision
+            )
+
+        if not valid:
+            logging.error(f"Output did not match for {key}")
+            return False
+
+    return True
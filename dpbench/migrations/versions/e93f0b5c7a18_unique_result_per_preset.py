@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unique result per preset
+
+Revision ID: e93f0b5c7a18
+Revises: a6c2e8f41d37
+Create Date: 2026-10-18 13:47:29.118406
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e93f0b5c7a18"
+down_revision = "a6c2e8f41d37"
+branch_labels = None
+depends_on = None
+
+# SQLite does not name unique constraints, so batch mode needs a naming
+# convention to find the reflected constraint.
+naming_convention = {
+    "uq": "uq_%(table_name)s_%(column_0_N_name)s",
+}
+
+# Generated columns can not be copied by batch mode, so it gets recreated.
+input_size_human_sql = "CASE WHEN (input_size >= 1024 AND input_size < 1048576) THEN (input_size / 1024) || 'KB' WHEN (input_size >= 1048576 AND input_size < 1073741824) THEN (input_size / 1048576) || 'MB' WHEN (input_size >= 1073741824 AND input_size < 1099511627776) THEN (input_size / 1073741824) || 'GB' WHEN (input_size >= 1099511627776 AND input_size < 1125899906842624) THEN (input_size / 1099511627776) || 'TB' ELSE input_size || 'B' END"  # noqa: E501
+
+
+def _recreate_input_size_human(batch_op):
+    batch_op.drop_column("input_size_human")
+    batch_op.add_column(
+        sa.Column(
+            "input_size_human",
+            sa.Integer(),
+            sa.Computed(input_size_human_sql, persisted=False),
+            nullable=False,
+        )
+    )
+
+
+def upgrade() -> None:
+    with op.batch_alter_table(
+        "results", naming_convention=naming_convention
+    ) as batch_op:
+        _recreate_input_size_human(batch_op)
+        batch_op.drop_constraint(
+            "uq_results_run_id_benchmark_implementation", type_="unique"
+        )
+        batch_op.create_unique_constraint(
+            "uq_results_run_id_benchmark_implementation_problem_preset",
+            ["run_id", "benchmark", "implementation", "problem_preset"],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table(
+        "results", naming_convention=naming_convention
+    ) as batch_op:
+        _recreate_input_size_human(batch_op)
+        batch_op.drop_constraint(
+            "uq_results_run_id_benchmark_implementation_problem_preset",
+            type_="unique",
+        )
+        batch_op.create_unique_constraint(
+            "uq_results_run_id_benchmark_implementation",
+            ["run_id", "benchmark", "implementation"],
+        )
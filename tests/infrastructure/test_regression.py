@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from dpbench.infrastructure import datamodel as dm
+from dpbench.infrastructure.regression import (
+    IMPROVEMENT,
+    INSUFFICIENT_SAMPLES,
+    REGRESSION,
+    UNCHANGED,
+    bootstrap_ratio_ci,
+    compare_timings,
+    resolve_baseline_runs,
+)
+
+_BASELINE = np.array([100.0, 101.0, 99.0, 100.5, 99.5, 100.2, 99.8, 100.1])
+
+
+@pytest.mark.parametrize(
+    "scale, status",
+    [
+        (1.5, REGRESSION),
+        (0.5, IMPROVEMENT),
+        (1.0, UNCHANGED),
+        # Significant, but below threshold.
+        (1.03, UNCHANGED),
+    ],
+)
+def test_compare_timings(scale, status):
+    ratio, ci_low, ci_high, p_value, result = compare_timings(
+        _BASELINE, _BASELINE * scale, threshold=0.05
+    )
+
+    assert result == status
+    assert ratio == pytest.approx(scale)
+    assert ci_low <= ratio <= ci_high
+    assert 0 <= p_value <= 1
+
+
+def test_compare_timings_insufficient_samples():
+    ratio, ci_low, ci_high, p_value, status = compare_timings(
+        _BASELINE, _BASELINE[:2] * 2
+    )
+
+    assert status == INSUFFICIENT_SAMPLES
+    assert ratio == ci_low == ci_high == pytest.approx(2.0, rel=0.01)
+    assert p_value is None
+
+
+def test_bootstrap_ratio_ci():
+    low, high = bootstrap_ratio_ci(_BASELINE, _BASELINE * 2)
+
+    assert 1.9 < low < 2.0 < high < 2.1
+    # Interval is reproducible with the same seed.
+    assert bootstrap_ratio_ci(_BASELINE, _BASELINE * 2) == (low, high)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    engine = dm.create_connection(str(tmp_path / "results.db"))
+    dm.Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        machines = [
+            dm.Machine(
+                fingerprint=name,
+                hostname=name,
+                cpu_model="",
+                architecture="",
+                sockets=1,
+                cores=1,
+                logical_cpus=1,
+                memory_bytes=0,
+                kernel="",
+                os="",
+            )
+            for name in ["a", "b"]
+        ]
+        session.add_all(machines)
+        session.flush()
+        # Runs 1..5 alternate between machines a, b, a, b, a.
+        session.add_all(
+            [dm.Run(machine_id=machines[i % 2].id) for i in range(5)]
+        )
+        session.commit()
+
+    return engine
+
+
+@pytest.mark.parametrize(
+    "baseline, candidate, expected",
+    [
+        ("2", 5, [2]),
+        ("last-1", 5, [3]),
+        ("last-5", 5, [3, 1]),
+        ("last-1", 4, [2]),
+    ],
+)
+def test_resolve_baseline_runs(conn, baseline, candidate, expected):
+    assert resolve_baseline_runs(conn, baseline, candidate) == expected
+
+
+@pytest.mark.parametrize(
+    "baseline, candidate",
+    [("latest", 5), ("last-0", 5), ("last-1", 1), ("last-1", 42)],
+)
+def test_resolve_baseline_runs_invalid(conn, baseline, candidate):
+    with pytest.raises(ValueError):
+        resolve_baseline_runs(conn, baseline, candidate)
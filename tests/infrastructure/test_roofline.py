@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+import dpbench.config as cfg
+from dpbench.infrastructure.roofline import (
+    MachinePeak,
+    attainable_gflops,
+    estimate_work,
+    evaluate_formula,
+)
+
+
+@pytest.mark.parametrize(
+    "formula, expected",
+    [
+        ("2 * NI * NJ * NK", 2 * 3 * 4 * 5),
+        ("-NI + 10 // 3 % 2", -2),
+        ("NI ** 2 / 2", 4.5),
+        ("max(NI, NJ) * min(NI, NJ)", 12),
+        ("log2(NK - 1) + sqrt(NJ)", 4),
+        ("ceil(NI / 2) + floor(NI / 2)", 3),
+    ],
+)
+def test_evaluate_formula(formula, expected):
+    assert evaluate_formula(formula, {"NI": 3, "NJ": 4, "NK": 5}) == expected
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "N +",
+        "unknown * 2",
+        "'text'",
+        "__import__('os')",
+        "N.real",
+        "max(N, key=abs)",
+        "N if N else 1",
+        "N << 2",
+        "not N",
+    ],
+)
+def test_evaluate_formula_rejects(formula):
+    with pytest.raises(ValueError):
+        evaluate_formula(formula, {"N": 2})
+
+
+def test_evaluate_formula_division_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        evaluate_formula("1 / N", {"N": 0})
+
+
+def _benchmark(flops: str, bytes: str) -> cfg.Benchmark:
+    return cfg.Benchmark(
+        module_name="gemm",
+        parameters={"S": {"N": 10, "name": "small"}},
+        array_args=["a", "n"],
+        roofline=cfg.Roofline(flops=flops, bytes=bytes),
+    )
+
+
+def test_estimate_work_uses_float_itemsize():
+    data = {"a": np.zeros(4, dtype=np.float32), "n": np.zeros(4, np.int64)}
+
+    flops, traffic = estimate_work(
+        _benchmark("2 * N ** 3", "3 * N ** 2 * itemsize"), "S", data
+    )
+
+    assert flops == 2000
+    assert traffic == 1200
+
+
+def test_estimate_work_invalid_formula():
+    assert estimate_work(_benchmark("N / 0", ""), "S", {}) == (0.0, 0.0)
+
+
+def test_estimate_work_without_roofline():
+    config = cfg.Benchmark(module_name="gemm")
+
+    assert estimate_work(config, "S", {}) == (0.0, 0.0)
+
+
+def test_attainable_gflops():
+    peak = MachinePeak(gflops=100, gbps=10)
+
+    assert attainable_gflops(1, peak) == 10
+    assert attainable_gflops(100, peak) == 100
+    assert attainable_gflops(1, MachinePeak()) is None
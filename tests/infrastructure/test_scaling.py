@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+import dpbench.config as cfg
+from dpbench.infrastructure.scaling import (
+    Sweep,
+    add_sweep_presets,
+    find_crossovers,
+    fit_scaling_exponent,
+    make_sweep_preset,
+    parse_sweep,
+    parse_sweep_preset,
+    strong_scaling,
+)
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("n=1..8", Sweep("n", [1, 2, 4, 8])),
+        ("n=2**10..2**12", Sweep("n", [1024, 2048, 4096])),
+        (" n =1000..10**5:10", Sweep("n", [1000, 10000, 100000])),
+        ("n=3..20:3", Sweep("n", [3, 9])),
+        ("n=5..5", Sweep("n", [5])),
+        ("x=0.5..2", Sweep("x", [0.5, 1, 2])),
+    ],
+)
+def test_parse_sweep(spec, expected):
+    assert parse_sweep(spec) == expected
+
+
+@pytest.mark.parametrize(
+    "spec",
+    ["n", "n=1", "=1..8", "n=0..8", "n=8..1", "n=1..8:1", "n=1..8:x"],
+)
+def test_parse_sweep_invalid(spec):
+    with pytest.raises(ValueError):
+        parse_sweep(spec)
+
+
+def test_sweep_preset_round_trip():
+    name = make_sweep_preset("S", "npoints", 1024)
+
+    assert name == "S@npoints=1024"
+    assert parse_sweep_preset(name) == ("S", "npoints", 1024.0)
+
+
+@pytest.mark.parametrize("preset", ["S", "S@npoints", "S@npoints=big"])
+def test_parse_sweep_preset_not_synthetic(preset):
+    assert parse_sweep_preset(preset) is None
+
+
+def test_add_sweep_presets():
+    config = cfg.Benchmark(
+        module_name="knn", parameters={"S": {"npoints": 10, "seed": 7}}
+    )
+
+    presets = add_sweep_presets(config, "S", Sweep("npoints", [16, 32]))
+
+    assert presets == ["S@npoints=16", "S@npoints=32"]
+    assert config.parameters["S@npoints=32"] == {"npoints": 32, "seed": 7}
+    assert config.parameters["S"] == {"npoints": 10, "seed": 7}
+
+
+def test_add_sweep_presets_missing_parameter():
+    config = cfg.Benchmark(module_name="knn", parameters={"S": {"n": 10}})
+
+    assert add_sweep_presets(config, "S", Sweep("npoints", [16])) == []
+    assert add_sweep_presets(config, "M", Sweep("n", [16])) == []
+    assert list(config.parameters) == ["S"]
+
+
+def test_fit_scaling_exponent():
+    sizes = [10, 100, 1000, 10000]
+
+    assert fit_scaling_exponent(sizes, [s**2 for s in sizes]) == (
+        pytest.approx(2)
+    )
+    assert fit_scaling_exponent(sizes, [5, 5, 5, 5]) == pytest.approx(0)
+
+
+def test_fit_scaling_exponent_ignores_invalid_points():
+    assert fit_scaling_exponent([10, 100, 0], [10, 100, 5]) == (
+        pytest.approx(1)
+    )
+    assert fit_scaling_exponent([10, 10], [1, 2]) is None
+    assert fit_scaling_exponent([10, 100], [1, 0]) is None
+
+
+def test_find_crossovers_interpolates_in_log_space():
+    # Ratio goes from 1/2 to 2, so it crosses 1 at geometric mean of sizes.
+    crossovers = find_crossovers([100, 10000], [1, 4], [2, 2])
+
+    assert crossovers == [pytest.approx(1000)]
+
+
+def test_find_crossovers_equal_point():
+    sizes = [1, 2, 4]
+
+    assert find_crossovers(sizes, [1, 2, 3], [2, 2, 2]) == [2]
+
+
+def test_find_crossovers_none():
+    assert find_crossovers([1, 2, 4], [1, 1, 1], [2, 3, 4]) == []
+    assert find_crossovers([1], [1], [2]) == []
+
+
+def test_strong_scaling():
+    speedup, efficiency = strong_scaling([1, 2, 4], [8.0, 4.0, 4.0])
+
+    np.testing.assert_allclose(speedup, [1, 2, 2])
+    np.testing.assert_allclose(efficiency, [1, 1, 0.5])
+
+
+def test_strong_scaling_relative_to_smallest_thread_count():
+    speedup, efficiency = strong_scaling([2, 4], [6.0, 4.0])
+
+    np.testing.assert_allclose(speedup, [1, 1.5])
+    np.testing.assert_allclose(efficiency, [1, 0.75])
+
+
+def test_strong_scaling_missing_time():
+    speedup, efficiency = strong_scaling([1, 2], [8.0, 0.0])
+
+    assert speedup[0] == 1
+    assert np.isnan(speedup[1]) and np.isnan(efficiency[1])
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+
+import numpy as np
+import pytest
+
+from dpbench.infrastructure.stats import (
+    MAX_BUDGET_TIMEOUT_SHARE,
+    ConvergenceCriteria,
+    median_confidence_interval,
+    relative_median_ci_width,
+    relative_std,
+)
+
+
+def test_relative_std():
+    assert relative_std([1.0, 2.0, 3.0]) == pytest.approx(0.5)
+    assert relative_std([5.0, 5.0]) == 0
+
+
+@pytest.mark.parametrize("samples", [[], [1.0], [0.0, 0.0]])
+def test_relative_std_undefined(samples):
+    assert relative_std(samples) == math.inf
+
+
+def test_median_confidence_interval_contains_median():
+    samples = np.random.default_rng(0).normal(100, 5, 101)
+
+    lower, upper = median_confidence_interval(samples)
+
+    assert lower <= np.median(samples) <= upper
+    assert samples.min() < lower and upper < samples.max()
+
+
+def test_median_confidence_interval_few_samples():
+    assert median_confidence_interval([3.0, 1.0, 2.0]) == (1.0, 3.0)
+
+
+def test_relative_median_ci_width_ignores_outlier():
+    samples = [100.0] * 20 + [1e6]
+
+    assert relative_std(samples) > 1
+    assert relative_median_ci_width(samples) == 0
+
+
+def test_converged_needs_min_repeat():
+    criteria = ConvergenceCriteria(target_rsd=0.02, min_repeat=5)
+
+    assert not criteria.converged([1.0] * 4)
+    assert criteria.converged([1.0] * 5)
+
+
+def test_not_converged_on_noisy_samples():
+    criteria = ConvergenceCriteria(target_rsd=0.02)
+
+    assert not criteria.converged([1.0, 2.0, 1.0, 3.0, 1.0, 2.0])
+
+
+def test_exhausted_by_max_repeat():
+    criteria = ConvergenceCriteria(max_repeat=10)
+
+    assert not criteria.exhausted(9, 0)
+    assert criteria.exhausted(10, 0)
+
+
+def test_budget_stops_before_min_repeat():
+    criteria = ConvergenceCriteria(time_budget=30, min_repeat=5)
+
+    assert not criteria.exhausted(0, 40)
+    assert criteria.exhausted(1, 40)
+    assert not criteria.exhausted(1, 29)
+
+
+def test_fit_timeout():
+    criteria = ConvergenceCriteria(time_budget=30)
+
+    assert criteria.fit_timeout(200) is criteria
+
+    fitted = criteria.fit_timeout(40)
+    assert fitted.time_budget == 40 * MAX_BUDGET_TIMEOUT_SHARE
+    assert criteria.time_budget == 30
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pandas as pd
+import pytest
+
+from dpbench.infrastructure.trend import (
+    SERIES_COLUMNS,
+    detect_change_points,
+    sparkline_svg,
+    summarize_trend,
+)
+
+_NOISE = [1.0, 1.01, 0.99, 1.005, 0.995, 1.0, 1.01, 0.99]
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([100 * v for v in _NOISE], []),
+        ([100] * 8, []),
+        ([100] * 5 + [150] * 5, [5]),
+        ([100] * 4 + [50] * 4 + [100] * 4, [4, 8]),
+        ([100 * v for v in _NOISE] + [200 * v for v in _NOISE], [8]),
+        # Not enough values on each side of the change.
+        ([100, 150], []),
+    ],
+)
+def test_detect_change_points(values, expected):
+    assert detect_change_points(values) == expected
+
+
+def test_detect_change_points_min_change():
+    values = [100] * 5 + [103] * 5
+
+    assert detect_change_points(values, min_change=0.05) == []
+    assert detect_change_points(values, min_change=0.01) == [5]
+
+
+def test_summarize_trend():
+    times = [100] * 3 + [200] * 3
+    df = pd.DataFrame(
+        {
+            "run_id": list(range(1, 7)) * 2,
+            "benchmark": ["gemm"] * 12,
+            "implementation": ["numpy"] * 6 + ["numba_n"] * 6,
+            "problem_preset": ["S"] * 12,
+            "threads": [0] * 12,
+            "median_exec_time": times + [50] * 6,
+        }
+    )
+
+    pivot, change_points = summarize_trend(df)
+
+    assert list(pivot.index.names) == SERIES_COLUMNS
+    assert change_points == {
+        ("gemm", "numba_n", "S", 0): [],
+        ("gemm", "numpy", "S", 0): [4],
+    }
+    assert pivot.loc[("gemm", "numpy", "S", 0), "change"] == pytest.approx(1)
+    assert pd.isna(pivot.loc[("gemm", "numba_n", "S", 0), "change"])
+
+
+@pytest.mark.parametrize("values", [[1, 2, 3], [5, 5, 5], [7]])
+def test_sparkline_svg(values):
+    svg = sparkline_svg(values, [len(values) - 1], width=100, height=20)
+
+    assert svg.startswith("<svg") and svg.endswith("</svg>")
+    assert 'width="100"' in svg and 'height="20"' in svg
+    assert svg.count("<circle") == 1
+    points = svg.split('points="')[1].split('"')[0].split()
+    assert len(points) == len(values)
+    for point in points:
+        x, y = map(float, point.split(","))
+        assert 0 <= x <= 100 and 0 <= y <= 20
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+
+import numpy as np
+import pytest
+
+from dpbench.infrastructure.benchmark_validation import (
+    MAX_REPORTED_MISMATCHES,
+    compare_arrays,
+)
+
+
+def _arrays(shape, order="C", seed=0):
+    rng = np.random.default_rng(seed)
+    expected = np.asarray(rng.random(shape), order=order)
+    actual = expected.copy()
+    actual.flat[:: max(expected.size // 7, 1)] += 1e-3
+    return expected, actual
+
+
+@pytest.mark.parametrize("shape", [(), (1,), (100,), (10, 11), (3, 4, 5)])
+@pytest.mark.parametrize("chunk_size", [1, 7, 33, 1 << 20])
+def test_compare_arrays_matches_isclose(shape, chunk_size):
+    expected, actual = _arrays(shape)
+
+    diff = compare_arrays(expected, actual, chunk_size=chunk_size)
+
+    close = np.isclose(actual, expected)
+    assert diff.size == expected.size
+    assert diff.mismatches == np.count_nonzero(~close)
+    assert diff.max_abs_error == pytest.approx(np.max(abs(expected - actual)))
+    assert diff.norm_rel_error == pytest.approx(
+        np.linalg.norm(expected - actual) / np.linalg.norm(expected)
+    )
+    expected_first = [
+        tuple(int(i) for i in index) for index in np.argwhere(~close)
+    ]
+    assert diff.first_mismatches == expected_first[:MAX_REPORTED_MISMATCHES]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+def test_compare_arrays_non_contiguous(chunk_size):
+    expected, actual = _arrays((12, 10), order="F")
+
+    diff = compare_arrays(expected.T, actual.T, chunk_size=chunk_size)
+
+    contiguous = compare_arrays(
+        np.ascontiguousarray(expected.T), np.ascontiguousarray(actual.T)
+    )
+    assert diff.mismatches == np.count_nonzero(~np.isclose(actual, expected))
+    assert diff.first_mismatches == contiguous.first_mismatches
+    assert diff.norm_rel_error == pytest.approx(contiguous.norm_rel_error)
+
+
+def test_compare_arrays_equal():
+    expected, _ = _arrays((4, 5))
+
+    diff = compare_arrays(expected, expected.copy())
+
+    assert diff.mismatches == 0
+    assert diff.max_abs_error == 0
+    assert diff.max_ulp_error == 0
+    assert diff.first_mismatches == []
+
+
+def test_compare_arrays_special_values():
+    expected = np.array([np.inf, -np.inf, np.nan, 1.0, 1.0])
+    actual = np.array([np.inf, np.inf, np.nan, np.nan, 1.0])
+
+    diff = compare_arrays(expected, actual, chunk_size=2)
+
+    assert diff.mismatches == np.count_nonzero(~np.isclose(actual, expected))
+    assert diff.first_mismatches == [(1,), (2,), (3,)]
+    assert math.isnan(diff.max_abs_error)
+
+
+@pytest.mark.parametrize("ulp", [None, 4])
+def test_compare_arrays_infinities(ulp):
+    expected = np.array([np.inf, -np.inf, np.inf, 1.0])
+    actual = np.array([np.inf, np.inf, 1.0, np.inf])
+
+    diff = compare_arrays(expected, actual, ulp=ulp)
+
+    assert diff.first_mismatches == [(1,), (2,), (3,)]
+
+
+def test_compare_arrays_ulp():
+    expected = np.array([1.0, 2.0, 4.0], dtype=np.float32)
+    actual = expected + 2 * np.spacing(expected)
+
+    assert compare_arrays(expected, actual, rtol=0, atol=0).mismatches == 3
+    diff = compare_arrays(expected, actual, rtol=0, atol=0, ulp=2)
+    assert diff.mismatches == 0
+    assert diff.max_ulp_error == pytest.approx(2)
+
+
+def test_compare_arrays_broadcast_scalar():
+    diff = compare_arrays(1.0, np.array([1.0, 1.0, 2.0]))
+
+    assert diff.size == 3
+    assert diff.mismatches == 1
+    assert diff.first_mismatches == [(2,)]
+
+
+@pytest.mark.parametrize(
+    "expected, actual, mismatches",
+    [
+        (np.array(["a", "b"]), np.array(["a", "b"]), 0),
+        (np.array(["a", "b"]), np.array(["a", "c"]), 2),
+        (np.array([], dtype=np.float64), np.array([]), 0),
+    ],
+)
+def test_compare_arrays_non_numeric(expected, actual, mismatches):
+    assert compare_arrays(expected, actual).mismatches == mismatches
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2022 - 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+import dpbench.config as cfg
+from dpbench.config.benchmark import OutputValidation
+from dpbench.infrastructure.validation_modes import (
+    allclose,
+    count,
+    get_validation_mode,
+    label_permutation,
+    row_permutation,
+    sign_invariant,
+    validate_outputs,
+)
+
+_DEFAULT = cfg.Tolerance()
+
+
+@pytest.mark.parametrize(
+    "actual, valid",
+    [
+        ([1.0, 2.0, 3.0], True),
+        ([1.0, 2.0, 3.1], False),
+    ],
+)
+def test_allclose(actual, valid):
+    assert allclose([1.0, 2.0, 3.0], actual, _DEFAULT)[0] == valid
+
+
+def test_allclose_tolerance():
+    tolerance = cfg.Tolerance(abs=0.2)
+
+    assert allclose([1.0, 2.0, 3.0], [1.0, 2.0, 3.1], tolerance)[0]
+
+
+@pytest.mark.parametrize(
+    "expected, actual, valid",
+    [
+        ([[1.0, 2.0], [3.0, 4.0]], [[-1.0, 2.0], [-3.0, 4.0]], True),
+        ([[1.0, 2.0], [3.0, 4.0]], [[-1.0, 2.0], [3.0, 4.0]], False),
+        ([1.0, -2.0, 3.0], [-1.0, 2.0, -3.0], True),
+        ([1.0, -2.0, 3.0], [-1.0, -2.0, -3.0], False),
+    ],
+)
+def test_sign_invariant(expected, actual, valid):
+    assert sign_invariant(expected, actual, _DEFAULT)[0] == valid
+
+
+@pytest.mark.parametrize(
+    "actual, tolerance, valid",
+    [
+        ([2, 2, 0, 0, 1, 1], _DEFAULT, True),
+        ([2, 2, 0, 0, 1, 0], _DEFAULT, False),
+        ([2, 2, 0, 0, 1, 0], cfg.Tolerance(abs=1), True),
+        ([2, 2, 0, 0, 1, 0], cfg.Tolerance(rel=0.2), True),
+        ([0, 0, 0, 0, 1, 1], _DEFAULT, False),
+        ([2, 2, 0], _DEFAULT, False),
+    ],
+)
+def test_label_permutation(actual, tolerance, valid):
+    expected = [0, 0, 1, 1, 2, 2]
+
+    assert label_permutation(expected, actual, tolerance)[0] == valid
+
+
+@pytest.mark.parametrize(
+    "actual, valid",
+    [
+        ([[3.0, 4.0], [1.0, 2.0], [1.0, 0.0]], True),
+        ([[3.0, 4.0], [1.0, 2.0], [0.0, 1.0]], False),
+    ],
+)
+def test_row_permutation(actual, valid):
+    expected = [[1.0, 0.0], [1.0, 2.0], [3.0, 4.0]]
+
+    assert row_permutation(expected, actual, _DEFAULT)[0] == valid
+
+
+@pytest.mark.parametrize(
+    "expected, actual, tolerance, valid",
+    [
+        (3, [0, 1, 2, -1, 2], _DEFAULT, True),
+        (3, [0, 1, 1, -1], _DEFAULT, False),
+        (3, [0, 1, 1, -1], cfg.Tolerance(abs=1), True),
+        ([0, 0, 1], [1, 1, 0], _DEFAULT, True),
+    ],
+)
+def test_count(expected, actual, tolerance, valid):
+    assert count(expected, actual, tolerance)[0] == valid
+
+
+def test_get_validation_mode_unknown():
+    with pytest.raises(ValueError):
+        get_validation_mode("unknown")
+
+
+def test_validate_outputs():
+    expected = {
+        "labels": np.array([0, 0, 1, 1]),
+        "centroids": np.array([[1.0, 1.0], [5.0, 5.0]]),
+    }
+    actual = {
+        "labels": np.array([1, 1, 0, 0]),
+        "centroids": np.array([[5.0, 5.0], [1.0, 1.0]]),
+    }
+    spec = {
+        "labels": OutputValidation(mode="label_permutation"),
+        "centroids": OutputValidation(mode="row_permutation"),
+    }
+
+    assert validate_outputs(expected, actual, spec)
+    assert not validate_outputs(expected, actual, {})